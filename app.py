@@ -5,6 +5,7 @@ st.set_page_config(page_title = "Affective-AI", page_icon = "🤗", layout = "ce
 
 # DEPENDENCIES
 
+import os
 import pytz
 import joblib
 import numpy as np
@@ -32,7 +33,45 @@ database_Manager            = DatabaseManager(db_path = Config.DATABASE_PATH)
 IST                         = pytz.timezone(Config.TIMEZONE_IST)  
 
 
-best_model_pipeline         = joblib.load(open(Config.BEST_MODEL_PATH, "rb"))
+@st.cache_resource(max_entries = 2)
+def load_classifier(model_path : str, modified_ns : int) -> any:
+    """
+        Loads a pickled classifier pipeline and caches it per file version.
+
+        The modification time is part of the cache key, so an atomically replaced online-learning
+        checkpoint is picked up on the next rerun without restarting the app.
+    
+        Arguments:
+            
+            `model_path`         {str}        : Path of the pickled pipeline or online-learning checkpoint.
+
+            `modified_ns`        {int}        : Modification time of the file in nanoseconds.
+        
+        Returns:
+            
+            any : The classifier pipeline.
+        
+    """
+    model = joblib.load(model_path)
+
+    return model["pipeline"] if isinstance(model, dict) else model
+
+
+if Config.USE_ONLINE_MODEL and os.path.exists(Config.ONLINE_MODEL_PATH):
+    serving_model_path      = Config.ONLINE_MODEL_PATH
+
+elif Config.USE_CASCADE_MODEL and os.path.exists(Config.CASCADE_MODEL_PATH):
+    serving_model_path      = Config.CASCADE_MODEL_PATH
+
+else:
+    serving_model_path      = Config.BEST_MODEL_PATH
+
+best_model_pipeline         = load_classifier(model_path  = serving_model_path, 
+                                              modified_ns = os.stat(serving_model_path).st_mtime_ns
+                                              )
+model_version_id            = database_Manager.register_model_version(model_name = serving_model_path, 
+                                                                      classes    = best_model_pipeline.classes_
+                                                                      )
 
 
 def predict_emotions(docx : str) -> any:
@@ -237,6 +276,9 @@ def main():
                 if "audio_path" not in st.session_state:
                     st.session_state.audio_path    = None
 
+                if "submission_id" not in st.session_state:
+                    st.session_state.submission_id = 0
+
                 if st.button("🎙️ Start Recording", key = "record", help = "Click to start recording"):
 
                     st.write("🎤 **Recording started...**")
@@ -246,6 +288,7 @@ def main():
 
                     transcription                  = transcriber.transcribe_audio(audio_path, sample_rate = Config.SAMPLE_RATE) 
                     st.session_state.transcription = transcription
+                    st.session_state.submission_id += 1
                     
                     st.write("✅ **Recording complete. Transcribing...**")
 
@@ -264,11 +307,17 @@ def main():
                         prediction  = predict_emotions(docx = raw_text)
                         probability = get_prediction_proba(docx = raw_text)
 
-                        database_Manager.add_prediction_details(rawtext      = raw_text, 
-                                                                prediction   = prediction, 
-                                                                probability  = np.max(probability), 
-                                                                timeOfvisit  = datetime.now(IST)
-                                                                )
+                        # Store each recording once, not on every rerun triggered by the feedback form
+                        if st.session_state.get("prediction_submission") != st.session_state.submission_id:
+
+                            st.session_state.prediction_id   = database_Manager.add_prediction_details(rawtext          = raw_text, 
+                                                                                                       prediction       = prediction, 
+                                                                                                       probability      = np.max(probability), 
+                                                                                                       timeOfvisit      = datetime.now(IST), 
+                                                                                                       probabilities    = probability, 
+                                                                                                       model_version_id = model_version_id
+                                                                                                       )
+                            st.session_state.prediction_submission = st.session_state.submission_id
 
                         with col1:
                             st.success("Original Text")
@@ -293,6 +342,19 @@ def main():
                                                                                                 )
                             st.altair_chart(fig, use_container_width = True)
 
+                        with st.form(key = 'emotion_feedback_form'):
+                            confirmed_label = st.selectbox("Correct Emotion", 
+                                                           options = Config.EMOTION_LABELS, 
+                                                           index   = Config.EMOTION_LABELS.index(prediction) if prediction in Config.EMOTION_LABELS else 0
+                                                           )
+
+                            if st.form_submit_button("Confirm"):
+                                database_Manager.confirm_prediction(prediction_id = st.session_state.prediction_id, 
+                                                                    label         = confirmed_label, 
+                                                                    timeOfvisit   = datetime.now(IST)
+                                                                    )
+                                st.success("Thanks! Your feedback will be used to keep the model up to date.")
+
         else:
             st.error("Page not found. Please select a valid page from the sidebar.")
 
@@ -15,6 +15,8 @@ class Config:
     ML_MODEL_SAVE_PATH               = "./models"
     EMOTION_DATASET_RAW              = "./data/emotion_dataset_raw.csv"
     EMOTION_DATASET_CLEANED          = "./data/emotion_dataset_cleaned.csv"
+    PREDICTION_HISTORY_PATH          = "./data/prediction_history"
+    CACHE_DIR                        = "./cache"
     MODEL_ACCURACY_PLOT_PATH         = "./results"
 
     # AUDIO CONFIGURATIONS
@@ -30,6 +32,61 @@ class Config:
     TIMEZONE_IST                     = "Asia/Kolkata"
     TIMEZONE_UTC                     = "UTC"
 
+    # DATABASE CONFIGURATIONS
+    EMOTION_LABELS                   = ["anger", "disgust", "fear", "joy", "neutral", "sadness", "shame", "surprise"]
+    RAW_EVENT_RETENTION_DAYS         = 30
+    MINUTE_ROLLUP_RETENTION_DAYS     = 2
+    HOUR_ROLLUP_RETENTION_DAYS       = 90
+    MAINTENANCE_INTERVAL_HOURS       = 24
+    EXPORT_CHUNK_SIZE                = 50000
+
+    # ONLINE LEARNING CONFIGURATIONS
+    USE_ONLINE_MODEL                 = False
+    ONLINE_MODEL_PATH                = "./models/online_model.pkl"
+    ONLINE_MODEL_TYPE                = "sgd"
+    ONLINE_BATCH_SIZE                = 256
+
+    # DATA CLEANING CONFIGURATIONS
+    # Serial until the pool is measured faster on a multi-core host; on one core it was slower than in-process cleaning
+    CLEANING_WORKERS                 = 1
+    CLEANING_CHUNK_SIZE              = 100000
+    STREAM_CHUNK_SIZE                = 50000
+    DEDUP_NUM_PERM                   = 64
+    DEDUP_BANDS                      = 16
+    DEDUP_THRESHOLD                  = 0.8
+
+    # EDA CONFIGURATIONS
+    POLARITY_WORKERS                 = 4
+    POLARITY_CHUNK_SIZE              = 5000
+
+    # MODEL TRAINING CONFIGURATIONS
+    TRAINING_WORKERS                 = 4
+    MODEL_THREAD_BUDGETS             = {"Random Forest" : 2, "XGBoost" : 2, "LightGBM" : 2}
+    MODEL_TIMEOUTS                   = {"RBF SVM" : 3600}
+    DEFAULT_MODEL_TIMEOUT            = None
+    SEARCH_CANDIDATES                = 20
+    SEARCH_FACTOR                    = 3
+    SEARCH_CV_FOLDS                  = 3
+    SEARCH_JOBS                      = 4
+    WARM_START_MODEL_PATH            = "./models/multinomial_logistic_regression.pkl"
+    DISTILL_HARD_LABEL_WEIGHT        = 0.3
+
+    # CASCADE CONFIGURATIONS
+    CASCADE_FIRST_STAGE              = "Multinomial Naive Bayes"
+    # The first of these heavier models trained in the same run becomes the second stage
+    CASCADE_SECOND_STAGES            = ["RBF SVM", "MLP Classifier", "Hist Gradient Boosting", "Random Forest"]
+    CASCADE_MODEL_PATH               = "./models/classification_models/cascade_model.pkl"
+    # Opt-in: when set, a saved cascade is served instead of the model deployed to BEST_MODEL_PATH
+    USE_CASCADE_MODEL                = False
+    CASCADE_ACCURACY_TOLERANCE       = 0.005
+    PRUNING_LEVELS                   = {"none"                : {},
+                                        "min_df=2"            : {"min_df" : 2},
+                                        "min_df=3 max_df=0.5" : {"min_df" : 3, "max_df" : 0.5},
+                                        "max_features=10000"  : {"max_features" : 10000},
+                                        "chi2 k=5000"         : {"min_df" : 2, "chi2_k" : 5000},
+                                        "l1 C=0.5"            : {"min_df" : 2, "l1_C" : 0.5},
+                                        }
+
     @staticmethod
     def setup_directories():
         """
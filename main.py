@@ -1,10 +1,18 @@
 # DEPENDENCIES
 
+import os
+import argparse
+import pandas as pd
 from config.config import Config
 from src.utils.logger import LoggerSetup
 from src.utils.data_loader import DataLoader
+from src.utils.artifact_cache import ArtifactCache
+from src.utils.model_profiler import ModelProfiler
 from src.data_cleaner.cleaner import TextCleaner
+from src.data_cleaner.deduplicator import TextDeduplicator
 from src.pipeline.model_pipeline import ModelTrainer
+from src.pipeline.cascade_predictor import CascadePredictor
+from web.utils.database_manager import DatabaseManager
 from sklearn.model_selection import train_test_split
 from src.exploratory_data_analysis.exploratory_data_analyzer import EmotionEDA
 
@@ -12,26 +20,131 @@ from src.exploratory_data_analysis.exploratory_data_analyzer import EmotionEDA
 # LOGGER SETUP
 main_logger = LoggerSetup(logger_name = "main.py", log_filename_prefix = "main").get_logger()
 
+def parse_arguments() -> argparse.Namespace:
+    """
+    Parse the command line options of the training pipeline.
+
+    """
+
+    parser = argparse.ArgumentParser(description = "Affective-AI training pipeline")
+
+    parser.add_argument("--latency-budget-ms",
+                        type    = float,
+                        default = None,
+                        help    = "Deploy the most accurate model whose p99 single-sample latency is within this budget to Config.BEST_MODEL_PATH"
+                        )
+
+    parser.add_argument("--force",
+                        action  = "store_true",
+                        help    = "Ignore the artifact cache and recompute the cleaned data, features and every model"
+                        )
+
+    parser.add_argument("--search",
+                        action  = "store_true",
+                        help    = "Tune the models in SEARCH_SPACES with successive halving before the final training run"
+                        )
+
+    parser.add_argument("--warm-start",
+                        action  = "store_true",
+                        help    = "Initialize the logistic regression from Config.WARM_START_MODEL_PATH, aligned to the new vocabulary"
+                        )
+
+    parser.add_argument("--pruning-tolerance",
+                        type    = float,
+                        default = None,
+                        help    = "Evaluate Config.PRUNING_LEVELS and deploy the smallest pruned pipeline within this accuracy "
+                                  "tolerance of the best level to Config.BEST_MODEL_PATH"
+                        )
+
+    parser.add_argument("--distill",
+                        action  = "store_true",
+                        help    = "Distill the best heavy model into a linear student, using the stored transcripts as unlabeled data"
+                        )
+
+    parser.add_argument("--stream",
+                        action  = "store_true",
+                        help    = "Clean the raw CSV chunk by chunk into Config.EMOTION_DATASET_CLEANED to keep peak memory bounded"
+                        )
+
+    parser.add_argument("--dedup",
+                        action  = "store_true",
+                        help    = "Collapse exact and near-duplicate texts into weighted samples and split by duplicate cluster"
+                        )
+
+    parser.add_argument("--cascade",
+                        action  = "store_true",
+                        help    = "Build the confidence-gated cascade from this run's models, calibrate it on the test split and save it to Config.CASCADE_MODEL_PATH"
+                        )
+
+    return parser.parse_args()
+
+
 def main():
 
     try:
 
+        args                  = parse_arguments()
+        cache                 = ArtifactCache(cache_dir = Config.CACHE_DIR, force = args.force)
+
+        # Streaming keeps only the training columns, so each mode gets its own entry
+        cleaned_key           = ArtifactCache.fingerprint("cleaned_data",
+                                                          ArtifactCache.file_hash(file_path = Config.EMOTION_DATASET_RAW),
+                                                          TextCleaner.CLEANING_STEPS,
+                                                          "stream" if args.stream else "full"
+                                                          )
+        emotion_cleaned_df    = cache.load_frame(namespace = "cleaned_data", key = cleaned_key)
+
         dataLoader            = DataLoader()   
-        emotion_raw_df        = dataLoader.data_loader(file_path = Config.EMOTION_DATASET_RAW)
-        main_logger.info("Data loaded successfully:")
 
-        data_cleaner          = TextCleaner(dataframe = emotion_raw_df)
-        emotion_cleaned_df    = data_cleaner.data_cleaning()
-        main_logger.info("Data cleaned successfully.")
+        if emotion_cleaned_df is None and args.stream:
+
+            dataLoader.stream_transform(input_path  = Config.EMOTION_DATASET_RAW,
+                                        output_path = Config.EMOTION_DATASET_CLEANED,
+                                        transform   = lambda chunk : TextCleaner(dataframe  = chunk,
+                                                                                 n_workers  = Config.CLEANING_WORKERS,
+                                                                                 chunk_size = Config.CLEANING_CHUNK_SIZE
+                                                                                 ).data_cleaning(),
+                                        chunk_size  = Config.STREAM_CHUNK_SIZE
+                                        )
+            main_logger.info("Data cleaned successfully in streaming mode.")
+
+            # Training only needs the cleaned text and the label; texts that cleaned to "" are written as empty fields
+            emotion_cleaned_df = dataLoader.typed_loader(file_path       = Config.EMOTION_DATASET_CLEANED,
+                                                         columns         = ["Emotion", "Clean_Text"],
+                                                         keep_default_na = False
+                                                         )
+
+            cache.save_frame(namespace = "cleaned_data", key = cleaned_key, dataframe = emotion_cleaned_df)
+
+        elif emotion_cleaned_df is None:
+
+            emotion_raw_df     = dataLoader.typed_loader(file_path = Config.EMOTION_DATASET_RAW, cache_dir = Config.CACHE_DIR)
+            main_logger.info("Data loaded successfully:")
+
+            data_cleaner       = TextCleaner(dataframe  = emotion_raw_df,
+                                             n_workers  = Config.CLEANING_WORKERS,
+                                             chunk_size = Config.CLEANING_CHUNK_SIZE
+                                             )
+            emotion_cleaned_df = DataLoader.to_typed(dataframe = data_cleaner.data_cleaning())
+            main_logger.info("Data cleaned successfully.")
+
+            cache.save_frame(namespace = "cleaned_data", key = cleaned_key, dataframe = emotion_cleaned_df)
+
+        else:
+            main_logger.info("Reusing cached cleaned data.")
 
-        dataLoader.data_saver(dataframe = emotion_cleaned_df, 
-                              file_path = Config.EMOTION_DATASET_CLEANED
-                              )
+        if not args.stream:
+            dataLoader.data_saver(dataframe = emotion_cleaned_df, 
+                                  file_path = Config.EMOTION_DATASET_CLEANED
+                                  )
 
         # data_analyzer         = EmotionEDA(dataframe       = emotion_cleaned_df, 
         #                                    text_column     = "Text", 
         #                                    emotion_column  = "Emotion", 
-        #                                    output_dir      = Config.EDA_RESULTS_PATH
+        #                                    output_dir      = Config.EDA_RESULTS_PATH,
+        #                                    cache_dir       = Config.CACHE_DIR,
+        #                                    n_workers       = Config.POLARITY_WORKERS,
+        #                                    chunk_size      = Config.POLARITY_CHUNK_SIZE
         #                                    )     
         # data_analyzer.run_all_eda()
         # main_logger.info("All EDA completed successfully.")
@@ -39,19 +152,112 @@ def main():
         X                                = emotion_cleaned_df["Clean_Text"]
         y                                = emotion_cleaned_df["Emotion"]  
 
-        x_train, x_test, y_train, y_test = train_test_split(X, y, test_size = 0.3, random_state = 1234)
+        w_train                          = None
 
-        trainer                          = ModelTrainer(x_train  = x_train, 
-                                                        x_test   = x_test, 
-                                                        y_train  = y_train, 
-                                                        y_test   = y_test
+        if args.dedup:
+
+            deduplicator                 = TextDeduplicator(num_perm  = Config.DEDUP_NUM_PERM,
+                                                            bands     = Config.DEDUP_BANDS,
+                                                            threshold = Config.DEDUP_THRESHOLD
+                                                            )
+            collapsed_df                 = deduplicator.collapse(dataframe = emotion_cleaned_df)
+
+            x_train, x_test, y_train, y_test, w_train, _ = deduplicator.grouped_split(collapsed = collapsed_df, test_size = 0.3, random_state = 1234)
+
+        else:
+            x_train, x_test, y_train, y_test = train_test_split(X, y, test_size = 0.3, random_state = 1234)
+
+        trainer                          = ModelTrainer(x_train       = x_train, 
+                                                        x_test        = x_test, 
+                                                        y_train       = y_train, 
+                                                        y_test        = y_test,
+                                                        cache         = cache,
+                                                        sample_weight = w_train
                                                         )
         
-        trainer.train_and_evaluate(output_dir = Config.ML_MODEL_SAVE_PATH)
+        if args.search:
+            trainer.search_hyperparameters(n_candidates = Config.SEARCH_CANDIDATES,
+                                           factor       = Config.SEARCH_FACTOR,
+                                           cv           = Config.SEARCH_CV_FOLDS,
+                                           n_jobs       = Config.SEARCH_JOBS
+                                           )
+            main_logger.info("Hyperparameter search completed successfully.")
+
+        if args.warm_start:
+            trainer.warm_start_from(pipeline_path = Config.WARM_START_MODEL_PATH)
+        
+        trainer.train_and_evaluate(output_dir      = Config.ML_MODEL_SAVE_PATH,
+                                   n_workers       = Config.TRAINING_WORKERS,
+                                   thread_budgets  = Config.MODEL_THREAD_BUDGETS,
+                                   timeouts        = Config.MODEL_TIMEOUTS,
+                                   default_timeout = Config.DEFAULT_MODEL_TIMEOUT
+                                   )
         
         main_logger.info("Model training and evaluation completed successfully.")
 
+        if args.distill:
+
+            database_manager  = DatabaseManager(db_path = Config.DATABASE_PATH)
+            transcripts       = [row[1] for rows in database_manager.iter_prediction_chunks() for row in rows if row[1]]
+            database_manager.close_connection()
+
+            if transcripts:
+                transcripts   = TextCleaner(dataframe = pd.DataFrame({"Text" : transcripts})).data_cleaning()["Clean_Text"].tolist()
+
+            trainer.distill(output_dir        = Config.ML_MODEL_SAVE_PATH,
+                            unlabeled_texts   = transcripts,
+                            hard_label_weight = Config.DISTILL_HARD_LABEL_WEIGHT
+                            )
+
         trainer.plot_results(output_dir = Config.MODEL_ACCURACY_PLOT_PATH)
+        trainer.plot_pareto(output_dir = Config.MODEL_ACCURACY_PLOT_PATH)
+
+        if args.pruning_tolerance is not None:
+            trainer.evaluate_pruning_levels(levels = Config.PRUNING_LEVELS, output_dir = Config.ML_MODEL_SAVE_PATH)
+            trainer.deploy_pruned_model(accuracy_tolerance = args.pruning_tolerance, deploy_path = Config.BEST_MODEL_PATH)
+
+        trainer.save_results(output_dir = Config.MODEL_ACCURACY_PLOT_PATH)
+        trainer.compare_models(baseline = "RBF SVM", candidate = "Approximate RBF SVM")
+
+        # Serving latency of raw transcripts with and without the cleaning step of the saved pipelines
+        if "Text" in emotion_cleaned_df and "Multinomial Logistic Regression" in trainer.pipeline_paths:
+
+            raw_texts         = emotion_cleaned_df["Text"].dropna().sample(n = min(2000, len(emotion_cleaned_df)), random_state = 1234)
+            comparison        = ModelProfiler().compare_preprocessing(pipeline_path = trainer.pipeline_paths["Multinomial Logistic Regression"],
+                                                                      texts         = raw_texts
+                                                                      )
+            comparison.to_csv(os.path.join(Config.MODEL_ACCURACY_PLOT_PATH, "preprocessing_latency.csv"), index = False)
+
+        if args.cascade:
+
+            second_stages     = [name for name in Config.CASCADE_SECOND_STAGES if name in trainer.pipeline_paths]
+
+            if Config.CASCADE_FIRST_STAGE not in trainer.pipeline_paths or not second_stages:
+                main_logger.warning(f"Skipping the cascade: it needs {Config.CASCADE_FIRST_STAGE} and one of "
+                                    f"{Config.CASCADE_SECOND_STAGES} trained in this run.")
+
+            else:
+
+                cascade       = CascadePredictor.from_paths(first_stage_path  = trainer.pipeline_paths[Config.CASCADE_FIRST_STAGE],
+                                                            second_stage_path = trainer.pipeline_paths[second_stages[0]]
+                                                            )
+
+                # The threshold is chosen on one half of the test split and the accuracy reported on the other
+                x_calibration, x_holdout, y_calibration, y_holdout = train_test_split(list(x_test), list(y_test), test_size = 0.5, random_state = 1234)
+
+                calibration   = cascade.calibrate(texts              = x_calibration,
+                                                  labels             = y_calibration,
+                                                  accuracy_tolerance = Config.CASCADE_ACCURACY_TOLERANCE
+                                                  )
+                calibration.to_csv(os.path.join(Config.MODEL_ACCURACY_PLOT_PATH, "cascade_calibration.csv"), index = False)
+
+                cascade.evaluate(texts = x_holdout, labels = y_holdout)
+                cascade.save(file_path = Config.CASCADE_MODEL_PATH)
+
+        if args.latency_budget_ms is not None:
+            trainer.deploy_best_model(latency_budget_ms = args.latency_budget_ms,
+                                      deploy_path       = Config.BEST_MODEL_PATH
+                                      )
 
     except Exception as e:
         
@@ -2,9 +2,9 @@
 
 import pandas as pd
 from librosa import ex
-import neattext.functions as nfx
 
 from ..utils.logger import LoggerSetup
+from .cleaning_engine import TextCleaningEngine
 
 
 # LOGGER SETUP
@@ -17,17 +17,25 @@ class TextCleaner:
 
     Methods:
 
-        - data_cleaning()                            : Removes user handles and stopwords from the 'Text' column.
+        - data_cleaning()                            : Removes user handles and stopwords from the 'Text' column,
+                                                       optionally across a process pool.
     
     """
 
-    def __init__(self, dataframe: pd.DataFrame) -> None:
+    # Ordered neattext steps applied by data_cleaning(); part of the cache fingerprint of the cleaned data
+    CLEANING_STEPS = ("remove_userhandles", "remove_stopwords")
+
+    def __init__(self, dataframe: pd.DataFrame, n_workers : int = 1, chunk_size : int = 100000) -> None:
         """
         Initialize the TextCleaner with a pandas DataFrame.
         
         Arguments:
             
             dataframe          {pd.DataFrame}         : The input DataFrame containing a 'Text' column.
+
+            n_workers          {int, optional}        : Number of processes cleaning the texts in parallel.
+
+            chunk_size         {int, optional}        : Number of texts sent to a worker at a time.
         
         """
         try:
@@ -41,7 +49,10 @@ class TextCleaner:
                 data_cleaner_logger.error("Input must be a pandas DataFrame.")
                 raise TypeError("Input must be a pandas DataFrame.")
         
-            self.df = dataframe.copy()
+            # Shallow copy: the new column is added without copying (or mutating) the caller's data
+            self.df         = dataframe.copy(deep = False)
+            self.n_workers  = n_workers
+            self.chunk_size = chunk_size
 
             data_cleaner_logger.info("TextCleaner initialized successfully.")
 
@@ -67,8 +78,11 @@ class TextCleaner:
             
             data_cleaner_logger.info("Starting text cleaning process.")
 
-            self.df['Clean_Text'] = self.df['Text'].apply(nfx.remove_userhandles)
-            self.df['Clean_Text'] = self.df['Clean_Text'].apply(nfx.remove_stopwords)
+            # Same output as .apply(nfx.remove_userhandles).apply(nfx.remove_stopwords), in one fused pass
+            self.df['Clean_Text'] = TextCleaningEngine().clean_series_parallel(self.df['Text'],
+                                                                              n_workers  = self.n_workers,
+                                                                              chunk_size = self.chunk_size
+                                                                              )
 
             data_cleaner_logger.info("Text cleaning process completed successfully.")
 
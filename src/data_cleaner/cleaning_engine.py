@@ -0,0 +1,258 @@
+# DEPENDENCIES
+
+import re
+import time
+import argparse
+import itertools
+import multiprocessing
+import numpy as np
+import pandas as pd
+import neattext.functions as nfx
+from neattext.pattern_data.pattern_data import STOPWORDS_en
+from sklearn.base import BaseEstimator
+from sklearn.base import TransformerMixin
+
+from ..utils.logger import LoggerSetup
+
+
+# LOGGER SETUP
+cleaning_engine_logger = LoggerSetup(logger_name = "cleaning_engine.py", log_filename_prefix = "cleaning_engine").get_logger()
+
+
+# Texts being cleaned by a worker process, set once per worker by `_init_worker`
+_worker_texts  = None
+_worker_engine = None
+
+
+def _init_worker(texts : list) -> None:
+    """
+    Process pool initializer that keeps the texts in the worker, so tasks only carry index ranges.
+
+    With the fork start method the list is inherited from the parent without being pickled.
+
+    """
+
+    global _worker_texts, _worker_engine
+
+    _worker_texts  = texts
+    _worker_engine = TextCleaningEngine()
+
+
+def _clean_range(bounds : tuple) -> list:
+    """
+    Process pool entry point that cleans the texts in `[start, end)`.
+
+    """
+
+    start, end = bounds
+
+    return [_worker_engine.clean_text(text) for text in _worker_texts[start:end]]
+
+
+class TextCleaningEngine:
+    """
+    A single-pass replacement for `nfx.remove_userhandles` followed by `nfx.remove_stopwords`.
+
+    The user-handle pattern and the stopword set are compiled once, and every text is handled in one
+    fused pass: the handle substitution only runs on texts containing "@", and the split / stopword filter /
+    join happens in a single list comprehension. The output is identical to the two neattext calls.
+
+    Attributes:
+
+        `handle_pattern`          {re.Pattern}          : neattext's user-handle pattern (`@\\S+`).
+
+        `stopwords`               {frozenset}           : neattext's English stopwords.
+
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the TextCleaningEngine.
+
+        """
+
+        self.handle_pattern = re.compile(r"@\S+")
+        self.stopwords      = frozenset(STOPWORDS_en)
+
+    def clean_text(self, text : str) -> str:
+        """
+        Remove user handles and stopwords from one text.
+
+        Arguments:
+
+            `text`                        {str}             : The raw text.
+
+        Returns:
+
+            str                                             : The cleaned text.
+
+        """
+
+        if "@" in text:
+            text = self.handle_pattern.sub(" ", text)
+
+        stopwords = self.stopwords
+
+        return " ".join([word for word in text.split() if word.lower() not in stopwords])
+
+    def clean_series(self, texts : pd.Series) -> pd.Series:
+        """
+        Clean a column of texts, keeping its index.
+
+        Arguments:
+
+            `texts`                   {pd.Series}           : The raw texts.
+
+        Returns:
+
+            pd.Series                                       : The cleaned texts.
+
+        """
+
+        clean_text = self.clean_text
+
+        return pd.Series([clean_text(text) for text in texts.tolist()], index = texts.index, name = texts.name)
+
+    def clean_series_parallel(self, texts : pd.Series, n_workers : int, chunk_size : int = 100000) -> pd.Series:
+        """
+        Clean a column of texts across a process pool, keeping its index.
+
+        Only the list of texts is handed to the workers, never the DataFrame, and each task carries just a
+        `[start, end)` range of `chunk_size` texts. `Pool.imap` returns the cleaned chunks in submission order,
+        so they are simply concatenated back.
+        Columns that fit in a single chunk, or `n_workers <= 1`, are cleaned in-process.
+
+        Arguments:
+
+            `texts`                   {pd.Series}           : The raw texts.
+
+            `n_workers`                   {int}             : Number of worker processes.
+
+            `chunk_size`             {int, optional}        : Number of texts per chunk.
+
+        Returns:
+
+            pd.Series                                       : The cleaned texts.
+
+        """
+
+        if n_workers <= 1 or len(texts) <= chunk_size:
+            return self.clean_series(texts)
+
+        values = texts.tolist()
+        ranges = [(start, min(start + chunk_size, len(values))) for start in range(0, len(values), chunk_size)]
+
+        with multiprocessing.get_context().Pool(processes = n_workers, initializer = _init_worker, initargs = (values,)) as pool:
+            cleaned = list(itertools.chain.from_iterable(pool.imap(_clean_range, ranges)))
+
+        return pd.Series(cleaned, index = texts.index, name = texts.name)
+
+    def benchmark(self, texts : pd.Series, n_rows : int, baseline : bool = True, n_workers : int = 1) -> dict:
+        """
+        Measure cleaning throughput on `n_rows` rows built by repeating `texts`.
+
+        Arguments:
+
+            `texts`                   {pd.Series}           : Sample texts, e.g. the raw dataset.
+
+            `n_rows`                      {int}             : Number of rows to clean.
+
+            `baseline`             {bool, optional}         : Also time the per-row neattext `apply` and check the outputs match.
+
+            `n_workers`              {int, optional}        : Number of worker processes used by the engine.
+
+        Returns:
+
+            dict                                            : Rows, engine rows/s and, with `baseline`, neattext rows/s and whether outputs match.
+
+        """
+
+        try:
+
+            corpus  = pd.Series(texts.tolist() * (n_rows // len(texts) + 1)).iloc[:n_rows]
+
+            start   = time.perf_counter()
+            cleaned = self.clean_series_parallel(corpus, n_workers = n_workers)
+            elapsed = time.perf_counter() - start
+
+            result  = {"Rows" : n_rows, "Workers" : n_workers, "Engine (rows/s)" : round(n_rows / elapsed, 1)}
+
+            if baseline:
+
+                start                       = time.perf_counter()
+                expected                    = corpus.apply(nfx.remove_userhandles).apply(nfx.remove_stopwords)
+                elapsed                     = time.perf_counter() - start
+
+                result["neattext (rows/s)"] = round(n_rows / elapsed, 1)
+                result["Identical"]         = cleaned.equals(expected)
+
+            cleaning_engine_logger.info(f"Cleaning benchmark: {result}")
+
+            return result
+
+        except Exception as e:
+            cleaning_engine_logger.error(f"Error benchmarking cleaning engine: {repr(e)}")
+
+            raise
+
+
+class TextCleaningTransformer(TransformerMixin, BaseEstimator):
+    """
+    Stateless scikit-learn transformer applying the `TextCleaner` preprocessing to raw texts.
+
+    Used as the first step of every saved pipeline, so raw transcripts are cleaned exactly as the training
+    data was before they reach the vectorizer. The transformer has no parameters and learns nothing; the
+    compiled pattern and stopword set live in a module-level `TextCleaningEngine`, so a pickled pipeline
+    only stores a reference to this class. Cleaning is idempotent, so already cleaned texts pass through unchanged.
+
+    """
+
+    def fit(self, X, y = None) -> "TextCleaningTransformer":
+        """
+        Nothing to learn; returns the transformer.
+
+        """
+
+        return self
+
+    def transform(self, X) -> list:
+        """
+        Remove user handles and stopwords from every text.
+
+        Arguments:
+
+            `X`                      {list-like}            : Raw texts.
+
+        Returns:
+
+            list                                            : The cleaned texts.
+
+        """
+
+        clean_text = _ENGINE.clean_text
+
+        return [clean_text(text) for text in (X.tolist() if isinstance(X, (pd.Series, np.ndarray)) else X)]
+
+
+# Shared engine used by every TextCleaningTransformer
+_ENGINE = TextCleaningEngine()
+
+
+if __name__ == "__main__":
+
+    # python -m src.data_cleaner.cleaning_engine --rows 35000 10000000 --workers 1 2 4 8
+    parser = argparse.ArgumentParser(description = "Benchmark the text cleaning engine against neattext")
+
+    parser.add_argument("--data", default = "./data/emotion_dataset_raw.csv", help = "CSV file with a 'Text' column")
+    parser.add_argument("--rows", type = int, nargs = "+", default = [35000, 10000000], help = "Corpus sizes to benchmark")
+    parser.add_argument("--workers", type = int, nargs = "+", default = [1], help = "Worker process counts to benchmark")
+    parser.add_argument("--no-baseline", action = "store_true", help = "Skip the neattext baseline")
+
+    args   = parser.parse_args()
+    texts  = pd.read_csv(args.data)["Text"]
+    engine = TextCleaningEngine()
+
+    for n_rows in args.rows:
+
+        for n_workers in args.workers:
+            print(engine.benchmark(texts = texts, n_rows = n_rows, baseline = not args.no_baseline, n_workers = n_workers))
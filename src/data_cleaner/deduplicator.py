@@ -0,0 +1,343 @@
+# DEPENDENCIES
+
+import time
+import hashlib
+import argparse
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from scipy.sparse.csgraph import connected_components
+from sklearn.metrics import accuracy_score
+from sklearn.pipeline import Pipeline
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import GroupShuffleSplit
+from sklearn.model_selection import train_test_split
+from sklearn.feature_extraction.text import CountVectorizer
+
+from ..utils.logger import LoggerSetup
+
+
+# LOGGER SETUP
+deduplicator_logger = LoggerSetup(logger_name = "deduplicator.py", log_filename_prefix = "deduplicator").get_logger()
+
+
+# Mersenne prime 2^31 - 1, modulus of the MinHash permutations
+_MERSENNE_PRIME = (1 << 31) - 1
+
+
+class TextDeduplicator:
+    """
+    Collapses exact and near-duplicate texts into weighted samples before training.
+
+    Texts are first normalized (lowercased, HTML entities and punctuation dropped, whitespace collapsed) and
+    hashed, so exact duplicates share one entry. Every distinct normalized text then gets a MinHash signature
+    over its word set; texts whose signatures collide in at least one LSH band and agree on at least `threshold`
+    of their hashes (an estimate of their Jaccard similarity) are joined, and the connected components form the
+    duplicate clusters.
+
+    Each (cluster, label) pair becomes one sample weighted by its number of rows, and the train/test split is
+    grouped by cluster, so no copy of a training text can leak into the test split.
+
+    Attributes:
+
+        `num_perm`                    {int}             : Number of MinHash permutations.
+
+        `bands`                       {int}             : Number of LSH bands; `num_perm` must be a multiple of it.
+
+        `threshold`                  {float}            : Minimum estimated Jaccard similarity of near-duplicates.
+
+        `random_state`                {int}             : Seed of the MinHash permutations.
+
+        `report`                     {dict}             : Row counts of the last `collapse` call.
+
+        `row_clusters`            {np.ndarray}          : Cluster id of every input row of the last `collapse` call.
+
+    """
+
+    def __init__(self, num_perm : int = 64, bands : int = 16, threshold : float = 0.8, random_state : int = 1234) -> None:
+        """
+        Initialize the TextDeduplicator.
+
+        Arguments:
+
+            `num_perm`               {int, optional}        : Number of MinHash permutations.
+
+            `bands`                  {int, optional}        : Number of LSH bands.
+
+            `threshold`             {float, optional}       : Minimum estimated Jaccard similarity of near-duplicates.
+
+            `random_state`           {int, optional}        : Seed of the MinHash permutations.
+
+        """
+
+        try:
+
+            if num_perm % bands:
+                raise ValueError(f"num_perm ({num_perm}) must be a multiple of bands ({bands})")
+
+            self.num_perm     = num_perm
+            self.bands        = bands
+            self.threshold    = threshold
+            self.random_state = random_state
+            self.report       = {}
+            self.row_clusters = None
+
+            deduplicator_logger.info(f"TextDeduplicator initialized with {num_perm} permutations, {bands} bands "
+                                     f"and threshold {threshold}")
+
+        except Exception as e:
+            deduplicator_logger.error(f"Error initializing TextDeduplicator: {repr(e)}")
+
+            raise
+
+    @staticmethod
+    def normalize(texts : pd.Series) -> pd.Series:
+        """
+        Normalize texts so trivially different copies compare equal.
+
+        """
+
+        return (texts.fillna("").astype(str)
+                     .str.lower()
+                     .str.replace(r"&\w+;", " ", regex = True)
+                     .str.replace(r"[^\w\s]", " ", regex = True)
+                     .str.split()
+                     .str.join(" "))
+
+    def minhash(self, texts : list) -> np.ndarray:
+        """
+        MinHash signatures of the word sets of `texts`.
+
+        Every token id is hashed by `num_perm` universal hash functions `(a * id + b) mod p`, and the minimum over
+        the tokens of each text is taken with `np.minimum.reduceat` on the CSR rows, so no Python loop runs per text.
+        Texts without tokens get the signature `p` in every position.
+
+        Arguments:
+
+            `texts`                      {list}             : Normalized texts.
+
+        Returns:
+
+            np.ndarray                                      : Signatures of shape `(len(texts), num_perm)`.
+
+        """
+
+        matrix     = CountVectorizer(binary = True, lowercase = False, token_pattern = r"(?u)\b\w+\b", dtype = np.int8).fit_transform(texts)
+        matrix     = sp.csr_matrix(matrix)
+
+        rng        = np.random.RandomState(self.random_state)
+        a          = rng.randint(1, _MERSENNE_PRIME, size = self.num_perm).astype(np.int64)
+        b          = rng.randint(0, _MERSENNE_PRIME, size = self.num_perm).astype(np.int64)
+
+        signatures = np.full((matrix.shape[0], self.num_perm), _MERSENNE_PRIME, dtype = np.uint32)
+        non_empty  = np.flatnonzero(np.diff(matrix.indptr))
+        starts     = matrix.indptr[:-1][non_empty]
+        tokens     = matrix.indices.astype(np.int64)
+
+        for permutation in range(self.num_perm):
+
+            hashed                               = (a[permutation] * tokens + b[permutation]) % _MERSENNE_PRIME
+            signatures[non_empty, permutation]   = np.minimum.reduceat(hashed, starts)
+
+        return signatures
+
+    def cluster(self, texts : list) -> np.ndarray:
+        """
+        Cluster near-duplicate texts with MinHash LSH.
+
+        Within every band, each text is paired with the first text sharing its band hash; pairs whose signatures
+        agree on at least `threshold` of the permutations become edges, and clusters are the connected components.
+
+        Arguments:
+
+            `texts`                      {list}             : Normalized, distinct texts.
+
+        Returns:
+
+            np.ndarray                                      : Cluster id of every text.
+
+        """
+
+        signatures = self.minhash(texts)
+        rows       = self.num_perm // self.bands
+        weights    = np.uint64(1099511628211) ** np.arange(rows, dtype = np.uint64)
+        sources    = []
+        targets    = []
+
+        for band in range(self.bands):
+
+            keys                    = signatures[:, band * rows:(band + 1) * rows].astype(np.uint64) @ weights
+            _, first, inverse       = np.unique(keys, return_index = True, return_inverse = True)
+
+            candidate               = first[inverse]
+            pairs                   = np.flatnonzero(candidate != np.arange(len(keys)))
+            similar                 = (signatures[pairs] == signatures[candidate[pairs]]).mean(axis = 1) >= self.threshold
+
+            sources.append(pairs[similar])
+            targets.append(candidate[pairs[similar]])
+
+        sources    = np.concatenate(sources)
+        targets    = np.concatenate(targets)
+        graph      = sp.coo_matrix((np.ones(len(sources)), (sources, targets)), shape = (len(texts), len(texts)))
+
+        return connected_components(graph, directed = False)[1]
+
+    def collapse(self, dataframe : pd.DataFrame, text_column : str = "Clean_Text", label_column : str = "Emotion") -> pd.DataFrame:
+        """
+        Collapse exact and near-duplicate rows into weighted samples.
+
+        Arguments:
+
+            `dataframe`             {pd.DataFrame}          : Labeled texts, e.g. the cleaned dataset.
+
+            `text_column`            {str, optional}        : Column holding the texts.
+
+            `label_column`           {str, optional}        : Column holding the labels.
+
+        Returns:
+
+            pd.DataFrame                                    : One row per (cluster, label) with the first text of the group,
+                                                              its label, `Weight` (number of rows) and `Cluster`.
+
+        """
+
+        try:
+
+            start       = time.perf_counter()
+
+            normalized  = self.normalize(dataframe[text_column])
+            digests     = normalized.map(lambda text : hashlib.blake2b(text.encode("utf-8"), digest_size = 8).digest())
+            exact_ids, distinct = pd.factorize(digests)
+
+            # Representative normalized text of every exact-duplicate group
+            first_rows  = pd.Series(np.arange(len(exact_ids))).groupby(exact_ids).first().to_numpy()
+            clusters    = self.cluster(normalized.iloc[first_rows].tolist())[exact_ids]
+            self.row_clusters = clusters
+
+            grouped     = (pd.DataFrame({text_column  : dataframe[text_column].to_numpy(),
+                                         label_column : dataframe[label_column].to_numpy(),
+                                         "Cluster"    : clusters,
+                                         })
+                           .groupby(["Cluster", label_column], sort = False, observed = True))
+
+            collapsed   = grouped[text_column].first().to_frame()
+            collapsed["Weight"] = grouped.size()
+            collapsed   = collapsed.reset_index()[[text_column, label_column, "Weight", "Cluster"]]
+
+            self.report = {"Rows"                  : len(dataframe),
+                           "Exact Groups"          : len(distinct),
+                           "Clusters"              : int(clusters.max()) + 1 if len(clusters) else 0,
+                           "Weighted Samples"      : len(collapsed),
+                           "Row Reduction (%)"     : round(100 * (1 - len(collapsed) / max(len(dataframe), 1)), 2),
+                           "Deduplication Time (s)": round(time.perf_counter() - start, 2),
+                           }
+
+            deduplicator_logger.info(f"Deduplication: {self.report}")
+
+            return collapsed
+
+        except Exception as e:
+            deduplicator_logger.error(f"Error collapsing duplicates: {repr(e)}")
+
+            raise
+
+    @staticmethod
+    def grouped_split(collapsed : pd.DataFrame, text_column : str = "Clean_Text", label_column : str = "Emotion",
+                      test_size : float = 0.3, random_state : int = 1234) -> tuple:
+        """
+        Split collapsed samples so that every duplicate cluster falls entirely in train or in test.
+
+        Arguments:
+
+            `collapsed`             {pd.DataFrame}          : Output of `collapse`.
+
+            `text_column`            {str, optional}        : Column holding the texts.
+
+            `label_column`           {str, optional}        : Column holding the labels.
+
+            `test_size`             {float, optional}       : Fraction of the clusters held out.
+
+            `random_state`           {int, optional}        : Seed of the split.
+
+        Returns:
+
+            tuple                                           : `(x_train, x_test, y_train, y_test, w_train, w_test)`.
+
+        """
+
+        train, test = next(GroupShuffleSplit(n_splits = 1, test_size = test_size, random_state = random_state)
+                           .split(collapsed, groups = collapsed["Cluster"]))
+
+        train, test = collapsed.iloc[train], collapsed.iloc[test]
+
+        return (train[text_column], test[text_column], train[label_column], test[label_column],
+                train["Weight"].to_numpy(), test["Weight"].to_numpy())
+
+    def benchmark(self, dataframe : pd.DataFrame, text_column : str = "Clean_Text", label_column : str = "Emotion",
+                  test_size : float = 0.3, random_state : int = 1234) -> pd.DataFrame:
+        """
+        Compare a Logistic Regression trained on every row against one trained on the collapsed samples.
+
+        "Leaky" is the current random split over rows. "Grouped" trains on every row of the train clusters and
+        scores every row of the test clusters, which is the accuracy corrected for duplicate leakage.
+        "Collapsed" trains on the weighted samples of the same train clusters and scores the same test rows.
+
+        Returns:
+
+            pd.DataFrame                                    : Training rows, fit time and accuracy of every setup.
+
+        """
+
+        try:
+
+            def fit_and_score(x_train, x_test, y_train, y_test, sample_weight = None) -> dict:
+
+                pipeline = Pipeline([('cv', CountVectorizer()), ('clf', LogisticRegression(max_iter = 1000))])
+
+                start    = time.perf_counter()
+                pipeline.fit(x_train, y_train, clf__sample_weight = sample_weight)
+                fit_time = time.perf_counter() - start
+
+                return {"Training Rows" : len(x_train),
+                        "Fit Time (s)"  : round(fit_time, 2),
+                        "Accuracy"      : round(accuracy_score(y_test, pipeline.predict(x_test)), 4),
+                        }
+
+            texts       = dataframe[text_column].fillna("")
+            labels      = dataframe[label_column]
+
+            collapsed   = self.collapse(dataframe = dataframe, text_column = text_column, label_column = label_column)
+            x_train, _, y_train, _, w_train, _ = self.grouped_split(collapsed, text_column, label_column, test_size, random_state)
+
+            # Rows of the original dataset on the train side of the grouped split
+            in_train    = np.isin(self.row_clusters, collapsed.loc[x_train.index, "Cluster"].unique())
+
+            report      = pd.DataFrame([{"Setup" : "Leaky", **fit_and_score(*train_test_split(texts, labels, test_size = test_size, random_state = random_state))},
+                                        {"Setup" : "Grouped", **fit_and_score(texts[in_train], texts[~in_train], labels[in_train], labels[~in_train])},
+                                        {"Setup" : "Collapsed", **fit_and_score(x_train, texts[~in_train], y_train, labels[~in_train], sample_weight = w_train)},
+                                        ])
+
+            deduplicator_logger.info(f"Deduplication benchmark:\n{report.to_string(index = False)}")
+
+            return report
+
+        except Exception as e:
+            deduplicator_logger.error(f"Error benchmarking deduplication: {repr(e)}")
+
+            raise
+
+
+if __name__ == "__main__":
+
+    # python -m src.data_cleaner.deduplicator --data ./data/emotion_dataset_raw.csv
+    from .cleaner import TextCleaner
+
+    parser = argparse.ArgumentParser(description = "Measure duplicate collapsing on the emotion dataset")
+
+    parser.add_argument("--data", default = "./data/emotion_dataset_raw.csv", help = "Raw CSV file with 'Emotion' and 'Text' columns")
+    parser.add_argument("--threshold", type = float, default = 0.8, help = "Minimum estimated Jaccard similarity of near-duplicates")
+
+    args      = parser.parse_args()
+    dataframe = TextCleaner(dataframe = pd.read_csv(args.data)).data_cleaning()
+
+    print(TextDeduplicator(threshold = args.threshold).benchmark(dataframe = dataframe).to_string(index = False))
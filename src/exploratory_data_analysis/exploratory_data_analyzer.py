@@ -1,7 +1,10 @@
 # DEPENDENCIES
 
 import re
+import time
 import spacy
+import hashlib
+import multiprocessing
 import numpy as np
 import pandas as pd
 import seaborn as sns
@@ -15,11 +18,38 @@ from nltk.corpus import stopwords
 
 from ..utils.logger import LoggerSetup
 from ..utils.save_plot import PlotSaver
+from ..utils.artifact_cache import ArtifactCache
 
 # LOGGER SETUP
 eda_logger = LoggerSetup(logger_name = "exploratory_data_analyzer.py", log_filename_prefix = "exploratory_data_analyzer").get_logger()
 
 
+# Texts scored by a worker process, set once per worker by `_init_polarity_worker`
+_worker_texts = None
+
+
+def _init_polarity_worker(texts : list) -> None:
+    """
+    Process pool initializer that keeps the texts in the worker, so tasks only carry index ranges.
+
+    """
+
+    global _worker_texts
+
+    _worker_texts = texts
+
+
+def _polarity_range(bounds : tuple) -> list:
+    """
+    Process pool entry point that scores the TextBlob polarity of the texts in `[start, end)`.
+
+    """
+
+    start, end = bounds
+
+    return [TextBlob(str(text)).sentiment.polarity for text in _worker_texts[start:end]]
+
+
 class EmotionEDA:
     
     """
@@ -35,10 +65,19 @@ class EmotionEDA:
 
         `output_dir`                  {str}             : Optional directory to save generated plots.
     
+        `cache_dir`                   {str}             : Optional directory where polarity scores are cached.
+
+        `n_workers`                   {int}             : Number of processes scoring polarity.
+
+        `chunk_size`                  {int}             : Number of texts per polarity task.
+
+        `stage_timings`              {dict}             : Seconds spent in every stage of the last `run_all_eda` call.
+    
     """
 
 
-    def __init__(self, dataframe : pd.DataFrame, text_column : str = 'Text', emotion_column : str = 'Emotion', output_dir : str = None) -> None:
+    def __init__(self, dataframe : pd.DataFrame, text_column : str = 'Text', emotion_column : str = 'Emotion', output_dir : str = None,
+                 cache_dir : str = None, n_workers : int = 1, chunk_size : int = 5000) -> None:
         """
         Initialize the EmotionEDA class.
         
@@ -51,6 +90,12 @@ class EmotionEDA:
             `emotion_column`            {str}             : Name of the column with emotion labels.
             
             `output_dir`                {str}             : Optional path to save plots.
+
+            `cache_dir`                 {str}             : Optional directory where polarity scores are cached.
+
+            `n_workers`                 {int}             : Number of processes scoring polarity.
+
+            `chunk_size`                {int}             : Number of texts per polarity task.
         
         Raises:
 
@@ -78,6 +123,12 @@ class EmotionEDA:
             self.output_dir       = output_dir
 
             self.plt_saver        = PlotSaver(output_dir = output_dir)
+            self.cache            = None if cache_dir is None else ArtifactCache(cache_dir = cache_dir)
+            self.n_workers        = n_workers
+            self.chunk_size       = chunk_size
+            self.stage_timings    = {}
+            self._token_index     = None
+            self._polarity        = None
 
             if output_dir:
                 Path(output_dir).mkdir(parents = True, exist_ok = True)
@@ -92,6 +143,92 @@ class EmotionEDA:
             raise
 
 
+    @property
+    def token_index(self) -> dict:
+        """
+        Tokenize the text column once and share the result with every plot.
+
+        Built lazily on first access and reused afterwards; `run_all_eda` rebuilds it at the start of each run.
+
+        Returns:
+
+            dict                                          : `tokens` (lowercased token list per row), `lengths` (word count per row),
+                                                            `emotion_counts` (emotion -> Counter of alphabetic non-stopword tokens)
+                                                            and `global_counts` (their sum over all emotions).
+
+        """
+
+        if self._token_index is None:
+
+            stop_words     = set(stopwords.words('english'))
+            tokens         = [str(text).lower().split() for text in self.df[self.text_column].tolist()]
+            emotion_counts = {emotion : Counter() for emotion in self.df[self.emotion_column].unique()}
+
+            for emotion, words in zip(self.df[self.emotion_column].tolist(), tokens):
+                emotion_counts[emotion].update(word for word in words if word.isalpha() and word not in stop_words)
+
+            global_counts  = Counter()
+
+            for counts in emotion_counts.values():
+                global_counts.update(counts)
+
+            self._token_index = {"tokens"         : tokens,
+                                 "lengths"        : pd.Series([len(words) for words in tokens], index = self.df.index),
+                                 "emotion_counts" : emotion_counts,
+                                 "global_counts"  : global_counts,
+                                 }
+
+            eda_logger.info(f"Token index built for {len(tokens)} rows with {len(global_counts)} distinct words")
+
+        return self._token_index
+
+
+    @property
+    def polarity(self) -> pd.Series:
+        """
+        TextBlob polarity of every text, computed once per dataset.
+
+        The scores are cached on disk under a hash of the text column, so any EDA run over the same texts
+        reuses them. On a miss the texts are scored in `chunk_size` ranges across `n_workers` processes;
+        `Pool.imap` keeps the chunks in order.
+
+        Returns:
+
+            pd.Series                                     : Polarity from -1 (negative) to 1 (positive), aligned with `df`.
+
+        """
+
+        if self._polarity is None:
+
+            start  = time.perf_counter()
+            texts  = self.df[self.text_column].tolist()
+            digest = hashlib.sha256(pd.util.hash_pandas_object(self.df[self.text_column], index = False).to_numpy().tobytes()).hexdigest()
+            key    = ArtifactCache.fingerprint("polarity", digest)
+            scores = None if self.cache is None else self.cache.load(namespace = "polarity", key = key)
+
+            if scores is None:
+
+                ranges = [(begin, min(begin + self.chunk_size, len(texts))) for begin in range(0, len(texts), self.chunk_size)]
+
+                if self.n_workers <= 1 or len(ranges) <= 1:
+                    scores = [TextBlob(str(text)).sentiment.polarity for text in texts]
+
+                else:
+                    with multiprocessing.get_context().Pool(processes = self.n_workers, initializer = _init_polarity_worker, initargs = (texts,)) as pool:
+                        scores = [score for chunk in pool.imap(_polarity_range, ranges) for score in chunk]
+
+                scores = np.asarray(scores, dtype = float)
+
+                if self.cache is not None:
+                    self.cache.save(namespace = "polarity", key = key, artifact = scores)
+
+            self._polarity = pd.Series(scores, index = self.df.index, name = "polarity")
+
+            eda_logger.info(f"Polarity ready for {len(texts)} texts in {time.perf_counter() - start:.2f}s")
+
+        return self._polarity
+
+
     def plot_emotion_distribution(self) -> None:
         """
         Plot the distribution of emotions in the dataset.
@@ -128,7 +265,7 @@ class EmotionEDA:
 
         try:
         
-            self.df['text_length'] = self.df[self.text_column].apply(lambda x: len(str(x).split()))
+            self.df['text_length'] = self.token_index["lengths"]
             
             plt.figure(figsize = (8, 5))
             
@@ -155,16 +292,25 @@ class EmotionEDA:
         """
         Generate and display a word cloud for each emotion class.
         
+        The per-emotion text is joined from the tokens of the token index and goes through WordCloud's own
+        `generate`, so the clouds keep its bigram collocations and plural normalization.
+        
         """
         
         try:
-        
+
             stop_words    = set(stopwords.words('english'))
+            emotion_words = {emotion : [] for emotion in self.token_index["emotion_counts"]}
+
+            for emotion, words in zip(self.df[self.emotion_column].tolist(), self.token_index["tokens"]):
+                emotion_words[emotion].extend(words)
+        
+            for emotion, words in emotion_words.items():
             
-            for emotion in self.df[self.emotion_column].unique():
-                
-                text      = " ".join(self.df[self.df[self.emotion_column] == emotion][self.text_column].values)
-                text      = re.sub(r'\W+', ' ', text.lower())
+                text      = re.sub(r'\W+', ' ', " ".join(words))
+
+                if not text.strip():
+                    continue
                 
                 wordcloud = WordCloud(width             = 800, 
                                       height            = 400, 
@@ -198,13 +344,9 @@ class EmotionEDA:
         
         try:
 
-            stop_words          = set(stopwords.words('english'))
+            for emotion, counts in self.token_index["emotion_counts"].items():
             
-            for emotion in self.df[self.emotion_column].unique():
-            
-                words           = " ".join(self.df[self.df[self.emotion_column] == emotion][self.text_column].values).lower().split()
-                filtered_words  = [word for word in words if word not in stop_words and word.isalpha()]
-                common_words    = Counter(filtered_words).most_common(top_n)
+                common_words    = counts.most_common(top_n)
             
                 if common_words:
                     
@@ -240,7 +382,7 @@ class EmotionEDA:
 
         try:
 
-            self.df['polarity'] = self.df[self.text_column].apply(lambda x: TextBlob(str(x)).sentiment.polarity)
+            self.df['polarity'] = self.polarity
             plt.figure(figsize = (10, 5))
             
             sns.boxplot(data  = self.df, 
@@ -274,10 +416,7 @@ class EmotionEDA:
         
         try:
 
-            stop_words      = set(stopwords.words('english'))
-            all_words       = " ".join(self.df[self.text_column].astype(str)).lower().split()
-            filtered_words  = [word for word in all_words if word not in stop_words and word.isalpha()]
-            common_words    = Counter(filtered_words).most_common(top_n)
+            common_words    = self.token_index["global_counts"].most_common(top_n)
 
             if common_words:
                 labels, values = zip(*common_words)
@@ -308,7 +447,7 @@ class EmotionEDA:
         """
         try:
 
-            self.df['word_count'] = self.df[self.text_column].apply(lambda x: len(str(x).split()))
+            self.df['word_count'] = self.token_index["lengths"]
             avg_counts            = self.df.groupby(self.emotion_column)['word_count'].mean().sort_values(ascending=False)
             
             plt.figure(figsize=(8, 5))
@@ -367,7 +506,7 @@ class EmotionEDA:
 
         try:
 
-            self.df['polarity']  = self.df[self.text_column].apply(lambda x: TextBlob(str(x)).sentiment.polarity)
+            self.df['polarity']  = self.polarity
             avg_polarity         = self.df.groupby(self.emotion_column)['polarity'].mean().sort_values()
 
             plt.figure(figsize = (8, 5))
@@ -390,25 +529,48 @@ class EmotionEDA:
             raise
 
 
-    def run_all_eda(self):
+    def run_all_eda(self) -> dict:
         """
         Function to run all EDA functions in sequence.
 
+        The token index and the polarity scores are prepared once as their own stages, then shared by every plot.
+
+        Returns:
+
+            dict                                          : Seconds spent in every stage, also kept in `stage_timings`.
+
         """
 
         try:
 
-            self.plot_emotion_distribution()
-            self.plot_text_length_distribution()
-            self.plot_sentiment_polarity_distribution()
-            self.plot_most_common_words()
-            self.generate_wordcloud_per_emotion()
-            self.plot_top_words_per_emotion()
-            self.plot_avg_word_count_per_emotion()
-            self.plot_emotion_distribution_pie()
-            self.plot_avg_polarity_per_emotion()
-
-            eda_logger.info("All EDA plots generated successfully")
+            self._token_index  = None
+            self._polarity     = None
+            self.stage_timings = {}
+
+            stages             = {"token_index"                          : lambda : self.token_index,
+                                  "polarity"                             : lambda : self.polarity,
+                                  "plot_emotion_distribution"            : self.plot_emotion_distribution,
+                                  "plot_text_length_distribution"        : self.plot_text_length_distribution,
+                                  "plot_sentiment_polarity_distribution" : self.plot_sentiment_polarity_distribution,
+                                  "plot_most_common_words"               : self.plot_most_common_words,
+                                  "generate_wordcloud_per_emotion"       : self.generate_wordcloud_per_emotion,
+                                  "plot_top_words_per_emotion"           : self.plot_top_words_per_emotion,
+                                  "plot_avg_word_count_per_emotion"      : self.plot_avg_word_count_per_emotion,
+                                  "plot_emotion_distribution_pie"        : self.plot_emotion_distribution_pie,
+                                  "plot_avg_polarity_per_emotion"        : self.plot_avg_polarity_per_emotion,
+                                  }
+
+            for name, stage in stages.items():
+
+                start                     = time.perf_counter()
+                stage()
+                self.stage_timings[name]  = round(time.perf_counter() - start, 3)
+
+                eda_logger.info(f"EDA stage {name} took {self.stage_timings[name]}s")
+
+            eda_logger.info(f"All EDA plots generated successfully in {sum(self.stage_timings.values()):.2f}s")
+
+            return self.stage_timings
 
         except Exception as e:
             eda_logger.error(f"Error running all EDA functions: {repr(e)}")
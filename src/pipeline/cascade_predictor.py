@@ -0,0 +1,266 @@
+# DEPENDENCIES
+
+import os
+import time
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.metrics import accuracy_score
+
+from ..utils.logger import LoggerSetup
+
+# LOGGER SETUP
+cascade_predictor_logger = LoggerSetup(logger_name = "cascade_predictor.py", log_filename_prefix = "cascade_predictor").get_logger()
+
+
+class CascadePredictor:
+    """
+    A two-stage, confidence-gated emotion classifier.
+
+    A cheap first-stage pipeline answers every request whose top class probability reaches `threshold`;
+    only the remaining low-confidence texts are escalated to a heavier second-stage pipeline. The cascade
+    exposes `predict`, `predict_proba` and `classes_`, so it can be pickled and served like a single pipeline.
+
+    Attributes:
+
+        `first_stage`            {Pipeline}             : Cheap text pipeline with `predict_proba`.
+
+        `second_stage`           {Pipeline}             : Heavier text pipeline with `predict_proba`.
+
+        `threshold`               {float}               : Minimum first-stage confidence answered without escalation.
+
+        `classes_`              {np.ndarray}            : Class labels in probability column order (those of the first stage).
+
+    """
+
+    def __init__(self, first_stage, second_stage, threshold : float = 0.5) -> None:
+        """
+        Initialize the CascadePredictor.
+
+        Arguments:
+
+            `first_stage`            {Pipeline}             : Cheap text pipeline with `predict_proba`.
+
+            `second_stage`           {Pipeline}             : Heavier text pipeline with `predict_proba`.
+
+            `threshold`          {float, optional}          : Minimum first-stage confidence answered without escalation.
+
+        """
+
+        try:
+
+            self.first_stage   = first_stage
+            self.second_stage  = second_stage
+            self.threshold     = threshold
+            self.classes_      = np.asarray(first_stage.classes_)
+
+            # Column order of the second stage's probabilities in terms of the first stage's classes
+            second_columns     = {label : column for column, label in enumerate(second_stage.classes_)}
+            self._second_order = np.array([second_columns[label] for label in self.classes_])
+
+            cascade_predictor_logger.info(f"CascadePredictor initialized with threshold {self.threshold}")
+
+        except Exception as e:
+            cascade_predictor_logger.error(f"Error initializing CascadePredictor: {repr(e)}")
+
+            raise
+
+    @classmethod
+    def from_paths(cls, first_stage_path : str, second_stage_path : str, threshold : float = 0.5) -> "CascadePredictor":
+        """
+        Build a cascade from two pickled pipelines.
+
+        """
+
+        return cls(first_stage  = joblib.load(first_stage_path),
+                   second_stage = joblib.load(second_stage_path),
+                   threshold    = threshold
+                   )
+
+    def _cascade_proba(self, texts : list, first_proba : np.ndarray, threshold : float) -> tuple:
+        """
+        Replace the rows of `first_proba` below `threshold` with second-stage probabilities.
+
+        Returns:
+
+            tuple                                           : `(probabilities, escalated)` where `escalated` is a boolean mask.
+
+        """
+
+        escalated = first_proba.max(axis = 1) < threshold
+        proba     = first_proba.copy()
+
+        if escalated.any():
+            proba[escalated] = self.second_stage.predict_proba([texts[i] for i in np.flatnonzero(escalated)])[:, self._second_order]
+
+        return proba, escalated
+
+    def _second_stage_predict(self, texts : list) -> np.ndarray:
+        """
+        Second-stage labels as the cascade serves them: the argmax of `predict_proba` in the first stage's class order.
+
+        `predict` can disagree with that argmax, e.g. for an SVC with `probability = True`, so it is never used here.
+
+        """
+
+        return self.classes_[self.second_stage.predict_proba(texts)[:, self._second_order].argmax(axis = 1)]
+
+    def predict_proba(self, texts : list) -> np.ndarray:
+        """
+        Class probabilities from the first stage, or from the second stage for escalated texts.
+
+        Arguments:
+
+            `texts`                      {list}             : Texts to classify.
+
+        Returns:
+
+            np.ndarray                                      : Probabilities of shape `(len(texts), len(classes_))`.
+
+        """
+
+        texts = list(texts)
+
+        return self._cascade_proba(texts = texts, first_proba = self.first_stage.predict_proba(texts), threshold = self.threshold)[0]
+
+    def predict(self, texts : list) -> np.ndarray:
+        """
+        Predicted emotion for every text.
+
+        """
+
+        return self.classes_[self.predict_proba(texts).argmax(axis = 1)]
+
+    def calibrate(self, texts : list, labels : list, accuracy_tolerance : float = 0.005) -> pd.DataFrame:
+        """
+        Choose the lowest threshold whose cascade accuracy is within `accuracy_tolerance` of the second stage alone.
+
+        Both stages are run once on the held-out texts, and every candidate threshold (the first-stage confidence
+        quantiles) is then evaluated by combining their cached outputs, so the sweep costs two batch predictions.
+
+        Arguments:
+
+            `texts`                      {list}             : Held-out texts, e.g. the test split of `main.py`.
+
+            `labels`                     {list}             : Their true emotions.
+
+            `accuracy_tolerance`   {float, optional}        : Maximum accepted accuracy drop against the second stage alone.
+
+        Returns:
+
+            pd.DataFrame                                    : Threshold, escalation rate and accuracy of every candidate.
+
+        """
+
+        try:
+
+            texts         = list(texts)
+            labels        = np.asarray(labels)
+
+            first_proba   = self.first_stage.predict_proba(texts)
+            confidence    = first_proba.max(axis = 1)
+            first_pred    = self.classes_[first_proba.argmax(axis = 1)]
+            second_pred   = self._second_stage_predict(texts)
+
+            target        = accuracy_score(labels, second_pred) - accuracy_tolerance
+            rows          = []
+
+            for threshold in np.unique(np.quantile(confidence, np.linspace(0, 1, 101))):
+
+                escalated = confidence < threshold
+                rows.append({"Threshold"       : round(float(threshold), 4),
+                             "Escalation Rate" : round(float(escalated.mean()), 4),
+                             "Accuracy"        : round(accuracy_score(labels, np.where(escalated, second_pred, first_pred)), 4),
+                             })
+
+            # Thresholds above every confidence escalate everything, matching the second stage alone
+            rows.append({"Threshold" : 1.01, "Escalation Rate" : 1.0, "Accuracy" : round(accuracy_score(labels, second_pred), 4)})
+
+            report         = pd.DataFrame(rows)
+            self.threshold = float(report[report["Accuracy"] >= round(target, 4)]["Threshold"].min())
+
+            cascade_predictor_logger.info(f"Calibrated threshold {self.threshold} for a target accuracy of {target:.4f}")
+
+            return report
+
+        except Exception as e:
+            cascade_predictor_logger.error(f"Error calibrating CascadePredictor: {repr(e)}")
+
+            raise
+
+    def evaluate(self, texts : list, labels : list, n_single : int = 200) -> dict:
+        """
+        Report the escalation rate, per-stage single-request latency and end-to-end accuracy at the current threshold.
+
+        Arguments:
+
+            `texts`                      {list}             : Held-out texts.
+
+            `labels`                     {list}             : Their true emotions.
+
+            `n_single`               {int, optional}        : Number of texts timed one request at a time.
+
+        Returns:
+
+            dict                                            : Accuracy of each stage and of the cascade, escalation rate and latencies.
+
+        """
+
+        try:
+
+            texts          = list(texts)
+            labels         = np.asarray(labels)
+
+            first_proba    = self.first_stage.predict_proba(texts)
+            proba, escal   = self._cascade_proba(texts = texts, first_proba = first_proba, threshold = self.threshold)
+
+            first_times    = []
+            second_times   = []
+            cascade_times  = []
+
+            for text in texts[:n_single]:
+
+                start      = time.perf_counter()
+                confident  = self.first_stage.predict_proba([text]).max() >= self.threshold
+                first_time = time.perf_counter() - start
+
+                start      = time.perf_counter()
+                self.second_stage.predict_proba([text])
+                second_times.append(time.perf_counter() - start)
+
+                first_times.append(first_time)
+                cascade_times.append(first_time + (0 if confident else second_times[-1]))
+
+            report         = {"Threshold"                : self.threshold,
+                              "Escalation Rate"          : round(float(escal.mean()), 4),
+                              "First Stage Accuracy"     : round(accuracy_score(labels, self.classes_[first_proba.argmax(axis = 1)]), 4),
+                              "Second Stage Accuracy"    : round(accuracy_score(labels, self._second_stage_predict(texts)), 4),
+                              "Cascade Accuracy"         : round(accuracy_score(labels, self.classes_[proba.argmax(axis = 1)]), 4),
+                              "First Stage P50 (ms)"     : round(float(np.percentile(first_times, 50)) * 1000, 3),
+                              "Second Stage P50 (ms)"    : round(float(np.percentile(second_times, 50)) * 1000, 3),
+                              "Cascade Mean (ms)"        : round(float(np.mean(cascade_times)) * 1000, 3),
+                              "Cascade P99 (ms)"         : round(float(np.percentile(cascade_times, 99)) * 1000, 3),
+                              "Second Stage Mean (ms)"   : round(float(np.mean(second_times)) * 1000, 3),
+                              }
+
+            cascade_predictor_logger.info(f"Cascade evaluation: {report}")
+
+            return report
+
+        except Exception as e:
+            cascade_predictor_logger.error(f"Error evaluating CascadePredictor: {repr(e)}")
+
+            raise
+
+    def save(self, file_path : str) -> str:
+        """
+        Pickle the cascade so the app can load it in place of a single pipeline; the file is replaced atomically.
+
+        """
+
+        joblib.dump(self, file_path + ".tmp")
+        os.replace(file_path + ".tmp", file_path)
+
+        cascade_predictor_logger.info(f"CascadePredictor saved at: {file_path}")
+
+        return file_path
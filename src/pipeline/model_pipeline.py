@@ -1,22 +1,50 @@
 # DEPENDENCIES
 
+import os
+import re
+import time
+import queue
+import joblib
+import shutil
+import tempfile
+import numpy as np
 import pandas as pd
+import multiprocessing
+import scipy.sparse as sp
 from librosa import ex
 from sklearn.svm import SVC
+from sklearn.base import clone
+from scipy.stats import randint
+from scipy.stats import loguniform
 import matplotlib.pyplot as plt
 from sklearn.svm import LinearSVC
 from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import Normalizer
 from sklearn.metrics import accuracy_score
+from sklearn.feature_selection import chi2
+from sklearn.feature_selection import SelectKBest
+from sklearn.feature_selection import SelectFromModel
 from sklearn.naive_bayes import MultinomialNB
+from sklearn.linear_model import SGDClassifier
+from sklearn.decomposition import TruncatedSVD
+from sklearn.kernel_approximation import Nystroem
+from sklearn.calibration import CalibratedClassifierCV
 from sklearn.neural_network import MLPClassifier
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.linear_model import LogisticRegression
 from sklearn.ensemble import HistGradientBoostingClassifier
+from threadpoolctl import threadpool_limits
+from sklearn.utils.validation import has_fit_parameter
 from sklearn.feature_extraction.text import CountVectorizer
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.model_selection import HalvingRandomSearchCV
 
 from ..utils.logger import LoggerSetup
 from ..utils.save_plot import PlotSaver
+from ..utils.model_profiler import ModelProfiler
+from ..utils.artifact_cache import ArtifactCache
 from ..utils.pipeline_saver import PipelineSaver
+from ..data_cleaner.cleaning_engine import TextCleaningTransformer
 
 # LOGGER SETUP  
 model_pipeline_logger = LoggerSetup(logger_name = "model_pipeline.py", log_filename_prefix = "model_pipeline").get_logger()
@@ -33,21 +61,265 @@ except ImportError:
 
     model_pipeline_logger.error("Error Occurred in Importing")
 
+
+# Hyperparameter distributions sampled by ModelTrainer.search_hyperparameters(); models not listed keep their defaults
+SEARCH_SPACES = {"Multinomial Logistic Regression" : {"C"                     : loguniform(1e-2, 1e2)},
+                 "Multinomial Naive Bayes"         : {"alpha"                 : loguniform(1e-3, 1e1)},
+                 "Random Forest"                   : {"n_estimators"          : randint(100, 500),
+                                                      "max_features"          : ["sqrt", "log2"],
+                                                      "min_samples_leaf"      : randint(1, 5)},
+                 "Linear SVC"                      : {"C"                     : loguniform(1e-3, 1e1)},
+                 "Approximate RBF SVM"             : {"rbf__gamma"            : loguniform(5e-2, 5e0),
+                                                      "clf__estimator__alpha" : loguniform(1e-6, 1e-3)},
+                 }
+
+
+# Models heavy enough at request time to be worth distilling into a linear student
+DISTILLATION_TEACHERS = ["XGBoost", "LightGBM", "Random Forest", "MLP Classifier", "Hist Gradient Boosting", "RBF SVM"]
+
+
+def describe_search_space(space : dict) -> dict:
+    """
+    Turn a search space into plain values so it can be fingerprinted (frozen scipy distributions have no stable repr).
+
+    """
+
+    return {param : ([distribution.dist.name, list(distribution.args), distribution.kwds]
+                     if hasattr(distribution, "dist") else distribution)
+            for param, distribution in space.items()}
+
+
+def compact_vectorizer(vectorizer : CountVectorizer, support : np.ndarray = None) -> CountVectorizer:
+    """
+    Rebuild a fitted CountVectorizer with a fixed vocabulary holding only the kept tokens.
+
+    The fitted vectorizer carries every pruned token in `stop_words_`, and a feature selector after it still
+    tokenizes and counts the full vocabulary on every request. The compact copy produces the selected columns
+    directly, in the same order, so it can replace `vectorizer -> selector` in the serving pipeline.
+
+    Arguments:
+
+        `vectorizer`        {CountVectorizer}        : Fitted vectorizer.
+
+        `support`             {np.ndarray}           : Boolean mask of the kept columns, all columns when None.
+
+    Returns:
+
+        CountVectorizer                              : Fitted vectorizer with a fixed vocabulary.
+
+    """
+
+    tokens  = vectorizer.get_feature_names_out()
+    tokens  = tokens if support is None else tokens[support]
+
+    compact = clone(vectorizer).set_params(vocabulary = list(tokens), min_df = 1, max_df = 1.0, max_features = None)
+
+    return compact.fit([])
+
+
+def expand_soft_targets(matrix : sp.csr_matrix, probabilities : np.ndarray, classes : np.ndarray,
+                        min_probability : float = 1e-3, sample_weight : np.ndarray = None) -> tuple:
+    """
+    Turn soft targets into a weighted hard-label dataset.
+
+    Every row is repeated once per class with the class as label and its probability as sample weight, so a
+    classifier minimizing weighted log-loss on the result minimizes the cross-entropy against the soft targets.
+    Classes below `min_probability` are dropped to keep the expanded matrix small. With `sample_weight`, every
+    expanded row's probability is scaled by the weight of the row it came from.
+
+    Arguments:
+
+        `matrix`             {sp.csr_matrix}         : Sparse feature matrix, one row per sample.
+
+        `probabilities`       {np.ndarray}           : Soft targets of shape `(n_samples, n_classes)`.
+
+        `classes`             {np.ndarray}           : Class label of every probability column.
+
+        `min_probability`       {float}              : Smallest probability kept as a training row.
+
+        `sample_weight`       {np.ndarray, optional} : Weight of every original row, unweighted when None.
+
+    Returns:
+
+        tuple                                        : `(matrix, labels, sample_weight)` of the expanded dataset.
+
+    """
+
+    rows, columns = np.nonzero(probabilities >= min_probability)
+    weights       = probabilities[rows, columns]
+
+    if sample_weight is not None:
+        weights   = weights * np.asarray(sample_weight, dtype = float)[rows]
+
+    return matrix[rows], np.asarray(classes)[columns], weights
+
+
+def build_serving_pipeline(vectorizer : CountVectorizer, classifier) -> Pipeline:
+    """
+    Assemble the pipeline saved for serving: `clean` -> `cv` -> `clf`.
+
+    The `TextCleaningTransformer` step applies the training-time cleaning, so the app can pass raw
+    transcripts straight to `predict` and the vectorizer never tokenizes handles or stopwords.
+
+    Arguments:
+
+        `vectorizer`        {CountVectorizer}        : Fitted vectorizer.
+
+        `classifier`       {sklearn estimator}       : Fitted classifier.
+
+    Returns:
+
+        Pipeline                                     : Pipeline accepting raw text.
+
+    """
+
+    return Pipeline([('clean', TextCleaningTransformer()), ('cv', vectorizer), ('clf', classifier)])
+
+
+def fit_weighted(model, matrix, labels : np.ndarray, sample_weight : np.ndarray = None):
+    """
+    Fit a classifier on weighted samples.
+
+    Models accepting `sample_weight` get it directly; the others see every row repeated by its
+    weight, which is equivalent for the integer duplicate counts produced by `TextDeduplicator`.
+
+    Arguments:
+
+        `model`            {sklearn estimator}       : Unfitted classifier.
+
+        `matrix`             {sp.csr_matrix}         : Sparse feature matrix, one row per sample.
+
+        `labels`              {np.ndarray}           : Target label of every row.
+
+        `sample_weight`       {np.ndarray}           : Weight of every row, unweighted when None.
+
+    Returns:
+
+        sklearn estimator                            : The fitted classifier.
+
+    """
+
+    if sample_weight is None:
+        return model.fit(matrix, labels)
+
+    if has_fit_parameter(model, "sample_weight"):
+        return model.fit(matrix, labels, sample_weight = sample_weight)
+
+    rows = np.repeat(np.arange(len(labels)), np.asarray(sample_weight).astype(int))
+
+    return model.fit(matrix[rows], np.asarray(labels)[rows])
+
+
+def build_approximate_rbf_svm(n_svd_components : int = 300, n_kernel_components : int = 1000, gamma : float = 0.5,
+                              random_state : int = 1234) -> Pipeline:
+    """
+    Build a scalable stand-in for `SVC(kernel = "rbf", probability = True)`.
+
+    The sparse counts are reduced with TruncatedSVD and L2-normalized, the RBF kernel is approximated with a
+    Nystroem feature map, and a linear SVM trained with SGD is wrapped in sigmoid calibration for probabilities.
+    Training cost grows linearly with the number of samples instead of super-linearly, and calibration uses
+    3 cheap linear fits instead of the 5-fold internal cross-validation of `probability = True`.
+
+    Arguments:
+
+        `n_svd_components`       {int}               : Dimensionality of the dense SVD representation.
+
+        `n_kernel_components`    {int}               : Number of Nystroem landmark samples.
+
+        `gamma`                 {float}              : RBF kernel coefficient on the normalized SVD features.
+
+        `random_state`           {int}               : Seed for the SVD, the landmark sampling and SGD.
+
+    Returns:
+
+        Pipeline                                     : Unfitted classifier pipeline accepting the sparse count matrix.
+
+    """
+
+    return Pipeline([('svd', TruncatedSVD(n_components = n_svd_components, random_state = random_state)),
+                     ('norm', Normalizer()),
+                     ('rbf', Nystroem(kernel = "rbf", gamma = gamma, n_components = n_kernel_components, random_state = random_state)),
+                     ('clf', CalibratedClassifierCV(SGDClassifier(random_state = random_state), method = "sigmoid", cv = 3)),
+                     ])
+
+
+def fit_and_score(name : str, model, matrix_path : str, y_train : np.ndarray, y_test : np.ndarray, thread_budget : int = 1,
+                  sample_weight : np.ndarray = None) -> dict:
+    """
+    Fit one classifier on the shared feature matrices and score it on the test split.
+
+    The matrices are loaded from a joblib dump with `mmap_mode = 'r'`, so worker processes map the
+    same file instead of each receiving a pickled copy. BLAS/OpenMP threads are capped at `thread_budget`.
+
+    Arguments:
+
+        `name`                   {str}               : Display name of the model.
+
+        `model`            {sklearn estimator}       : Unfitted classifier.
+
+        `matrix_path`            {str}               : Path of the joblib dump holding `(x_train_matrix, x_test_matrix)`.
+
+        `y_train`             {np.ndarray}           : Target labels for training data.
+
+        `y_test`              {np.ndarray}           : Target labels for testing data.
+
+        `thread_budget`          {int}               : Maximum number of native threads the model may use.
+
+        `sample_weight`       {np.ndarray}           : Weight of every training row, unweighted when None.
+
+    Returns:
+
+        dict                                         : Model name, status, accuracy, fitted model, fit time and error message.
+
+    """
+
+    try:
+
+        with threadpool_limits(limits = thread_budget):
+
+            x_train_matrix, x_test_matrix = joblib.load(matrix_path, mmap_mode = 'r')
+
+            start    = time.perf_counter()
+            fit_weighted(model, x_train_matrix, y_train, sample_weight)
+            fit_time = time.perf_counter() - start
+
+            acc      = accuracy_score(y_test, model.predict(x_test_matrix))
+
+        return {"name" : name, "status" : "Completed", "accuracy" : acc, "model" : model, "fit_time" : fit_time, "error" : None}
+
+    except Exception as e:
+        return {"name" : name, "status" : "Failed", "accuracy" : None, "model" : None, "fit_time" : None, "error" : repr(e)}
+
+
+def _fit_and_score_worker(result_queue : multiprocessing.Queue, **kwargs) -> None:
+    """
+    Process entry point that runs `fit_and_score` and posts its result on `result_queue`.
+
+    """
+
+    result_queue.put(fit_and_score(**kwargs))
+
+
 class ModelTrainer:
     """
     A class for training and evaluating multiple machine learning models 
     on text classification tasks using pipelines.
 
     This class supports:
+        - Fitting a single CountVectorizer and sharing its sparse train/test matrices across all classifiers.
+        - Reusing cached feature matrices and fitted models whose data and hyperparameters did not change.
+        - Tuning hyperparameters with successive halving over the shared feature matrix.
         - Building pipelines with CountVectorizer and classifiers.
         - Training multiple models (Logistic Regression, Naive Bayes, Random Forest, Linear SVC).
-        - Evaluating models based on accuracy.
+        - Evaluating models based on accuracy, fit time, inference latency, throughput and model size.
+        - Selecting the most accurate model within a latency budget for deployment.
         - Displaying results in a DataFrame.
         - Visualizing results in a bar chart.
     
     """
     
-    def __init__(self, x_train : list, x_test : list, y_train : list, y_test : list) -> None:
+    def __init__(self, x_train : list, x_test : list, y_train : list, y_test : list, vectorizer_params : dict = None,
+                 cache : ArtifactCache = None, sample_weight : list = None) -> None:
         """
         Initialize the ModelTrainer with training and testing data.
 
@@ -61,6 +333,12 @@ class ModelTrainer:
             
             `y_test`             {list}        : Target labels for testing data.
 
+            `vectorizer_params`  {dict}        : Optional keyword arguments for the shared CountVectorizer.
+
+            `cache`          {ArtifactCache}   : Optional cache for feature matrices and fitted models.
+
+            `sample_weight`      {list}        : Optional weight of every training row, e.g. duplicate counts.
+
         Returns:
 
             None
@@ -75,11 +353,26 @@ class ModelTrainer:
             self.y_test     = y_test
             self.results    = []
 
+            self.sample_weight      = None if sample_weight is None else np.asarray(sample_weight)
+
+            self.vectorizer         = CountVectorizer(**(vectorizer_params or {}))
+            self.x_train_matrix     = None
+            self.x_test_matrix      = None
+            self.featurization_time = None
+            self.features_cached    = False
+            self.pipeline_paths     = {}
+            self.cache              = cache
+            self.feature_key        = None
+            self.search_results     = {}
+            self.pruning_results    = []
+            self.pruning_paths      = {}
+
             self.models     = {"Multinomial Logistic Regression" : LogisticRegression(multi_class="multinomial", solver="lbfgs", max_iter=1000),
                             "Multinomial Naive Bayes"         : MultinomialNB(),
                             "Random Forest"                   : RandomForestClassifier(),
                             "Linear SVC"                      : LinearSVC(),
                             "RBF SVM": SVC(kernel="rbf", probability=True),
+                            "Approximate RBF SVM"             : build_approximate_rbf_svm(),
                             "MLP Classifier": MLPClassifier(hidden_layer_sizes=(100,), max_iter=300),
                             "Hist Gradient Boosting": HistGradientBoostingClassifier(),
                             }
@@ -96,11 +389,358 @@ class ModelTrainer:
             
             raise e
 
-    def train_and_evaluate(self, output_dir : str) -> None:
+    def featurize(self) -> None:
         """
-        Train each model using a text classification pipeline and evaluate accuracy on test data.
+        Fit the CountVectorizer once on the training text and cache the sparse train/test matrices.
 
-        The results (model name and accuracy) are stored in the `results` attribute.
+        Every classifier is then fitted on the cached matrices, so the corpus is tokenized once per run
+        instead of once per model.
+
+        """
+
+        try:
+
+            start                   = time.perf_counter()
+
+            self.feature_key        = ArtifactCache.fingerprint("features",
+                                                                joblib.hash((list(self.x_train), list(self.x_test))),
+                                                                self.vectorizer.get_params()
+                                                                )
+            cached                  = None if self.cache is None else self.cache.load("features", self.feature_key)
+            self.features_cached    = cached is not None
+
+            if cached is not None:
+                self.vectorizer, self.x_train_matrix, self.x_test_matrix = cached
+
+            else:
+                self.x_train_matrix = self.vectorizer.fit_transform(self.x_train)
+                self.x_test_matrix  = self.vectorizer.transform(self.x_test)
+
+                if self.cache is not None:
+                    self.cache.save("features", self.feature_key, (self.vectorizer, self.x_train_matrix, self.x_test_matrix))
+
+            self.featurization_time = time.perf_counter() - start
+
+            model_pipeline_logger.info(f"{'Loaded cached features for' if self.features_cached else 'Featurized'} "
+                                       f"{self.x_train_matrix.shape[0]} training and {self.x_test_matrix.shape[0]} test rows "
+                                       f"into {self.x_train_matrix.shape[1]} features in {self.featurization_time:.2f}s")
+
+        except Exception as e:
+            model_pipeline_logger.error(f"Error during featurization: {repr(e)}")
+            
+            raise e
+
+    def model_key(self, model) -> str:
+        """
+        Fingerprint a model by the feature matrices, the labels and its hyperparameters.
+
+        Thread-count parameters (`n_jobs`) are left out since they do not change the fitted model.
+
+        Arguments:
+
+            `model`            {sklearn estimator}        : Unfitted classifier.
+
+        Returns:
+
+            str                                           : Cache key of the fitted model.
+
+        """
+
+        params = {key : value for key, value in model.get_params(deep = True).items() if not key.endswith("n_jobs")}
+
+        # Warm-started models also depend on their initial coefficients
+        init   = joblib.hash((model.coef_, model.intercept_)) if hasattr(model, "coef_") else None
+
+        return ArtifactCache.fingerprint("model",
+                                         self.feature_key,
+                                         joblib.hash((list(self.y_train), list(self.y_test))),
+                                         None if self.sample_weight is None else joblib.hash(self.sample_weight),
+                                         type(model).__name__,
+                                         params,
+                                         init
+                                         )
+
+    def warm_start_from(self, pipeline_path : str, name : str = "Multinomial Logistic Regression") -> bool:
+        """
+        Initialize a linear model from the coefficients of a previously saved pipeline.
+
+        The previous coefficients are re-indexed onto the current vocabulary by token, and onto the current
+        classes by label; tokens or classes the previous model never saw start at zero. The model is switched
+        to `warm_start = True`, so lbfgs starts from this point instead of from zero and a retrain on slightly
+        grown data converges in a few iterations.
+
+        Arguments:
+
+            `pipeline_path`               {str}             : Path of the previously saved `cv` -> `clf` pipeline.
+
+            `name`                   {str, optional}        : Name of the model in `self.models` to initialize.
+
+        Returns:
+
+            bool                                            : False when there is no previous pipeline to start from.
+
+        """
+
+        try:
+
+            if not os.path.exists(pipeline_path):
+
+                model_pipeline_logger.info(f"No previous pipeline at {pipeline_path}, {name} trains from scratch")
+                return False
+
+            if self.x_train_matrix is None:
+                self.featurize()
+
+            previous      = joblib.load(pipeline_path)
+            old_vocab     = previous.named_steps["cv"].vocabulary_
+            old_clf       = previous.named_steps["clf"]
+
+            classes       = np.unique(np.asarray(self.y_train))
+            old_rows      = {label : row for row, label in enumerate(old_clf.classes_)}
+
+            new_columns   = []
+            old_columns   = []
+
+            for token, column in self.vectorizer.vocabulary_.items():
+
+                if token in old_vocab:
+                    new_columns.append(column)
+                    old_columns.append(old_vocab[token])
+
+            coef          = np.zeros((len(classes), len(self.vectorizer.vocabulary_)))
+            intercept     = np.zeros(len(classes))
+
+            for row, label in enumerate(classes):
+
+                if label in old_rows:
+                    coef[row, new_columns] = old_clf.coef_[old_rows[label], old_columns]
+                    intercept[row]         = old_clf.intercept_[old_rows[label]]
+
+            model         = self.models[name]
+            model.set_params(warm_start = True)
+
+            model.coef_      = coef
+            model.intercept_ = intercept
+
+            model_pipeline_logger.info(f"{name} warm-started from {pipeline_path}: {len(new_columns)} of "
+                                       f"{len(self.vectorizer.vocabulary_)} tokens and {len(set(classes) & set(old_rows))} of "
+                                       f"{len(classes)} classes carried over")
+
+            return True
+
+        except Exception as e:
+            model_pipeline_logger.error(f"Error warm-starting {name}: {repr(e)}")
+
+            raise e
+
+    def search_hyperparameters(self, n_candidates : int = 20, factor : int = 3, cv : int = 3, n_jobs : int = 1,
+                               random_state : int = 1234) -> dict:
+        """
+        Tune the models listed in `SEARCH_SPACES` with successive halving and keep their best parameters.
+
+        `n_candidates` random configurations start on a small subsample of the shared training matrix; after each
+        round only the best `1 / factor` survive and get `factor` times more samples. The precomputed sparse matrix
+        is reused for every candidate and fold, candidates run on `n_jobs` processes, and the search outcome is cached
+        under the model key, so a rerun with unchanged data and search settings costs nothing.
+
+        Arguments:
+
+            `n_candidates`           {int, optional}        : Number of configurations sampled in the first round.
+
+            `factor`                 {int, optional}        : Elimination rate between rounds.
+
+            `cv`                     {int, optional}        : Number of cross-validation folds.
+
+            `n_jobs`                 {int, optional}        : Number of parallel processes evaluating candidates.
+
+            `random_state`           {int, optional}        : Seed for the sampled configurations and subsamples.
+
+        Returns:
+
+            dict                                            : Model name -> best parameters, cross-validated accuracy and search time.
+
+        """
+
+        try:
+
+            if self.x_train_matrix is None:
+                self.featurize()
+
+            y_train = np.asarray(self.y_train)
+
+            for name, space in SEARCH_SPACES.items():
+
+                if name not in self.models:
+                    continue
+
+                model    = self.models[name]
+                key      = ArtifactCache.fingerprint("search",
+                                                     self.model_key(model),
+                                                     describe_search_space(space),
+                                                     n_candidates, factor, cv, random_state
+                                                     )
+                outcome  = None if self.cache is None else self.cache.load("search", key)
+
+                if outcome is None:
+
+                    estimator = clone(model)
+
+                    if "n_jobs" in estimator.get_params():
+                        estimator.set_params(n_jobs = 1)
+
+                    search    = HalvingRandomSearchCV(estimator           = estimator,
+                                                      param_distributions = space,
+                                                      n_candidates        = n_candidates,
+                                                      factor              = factor,
+                                                      cv                  = cv,
+                                                      scoring             = "accuracy",
+                                                      min_resources       = "exhaust",
+                                                      n_jobs              = n_jobs,
+                                                      refit               = False,
+                                                      random_state        = random_state
+                                                      )
+
+                    # Duplicate counts are honoured by the models that accept them
+                    weighted  = self.sample_weight is not None and has_fit_parameter(estimator, "sample_weight")
+                    params    = {"sample_weight" : self.sample_weight} if weighted else {}
+
+                    try:
+                        start = time.perf_counter()
+                        search.fit(self.x_train_matrix, y_train, **params)
+
+                    except Exception as e:
+                        model_pipeline_logger.warning(f"Hyperparameter search for {name} failed, keeping defaults: {repr(e)}")
+                        continue
+
+                    outcome   = {"Best Params"     : {param : (value.item() if isinstance(value, np.generic) else value)
+                                                      for param, value in search.best_params_.items()},
+                                 "CV Accuracy"     : round(float(search.best_score_), 4),
+                                 "Search Time (s)" : round(time.perf_counter() - start, 2)
+                                 }
+
+                    if self.cache is not None:
+                        self.cache.save("search", key, outcome)
+
+                model.set_params(**outcome["Best Params"])
+                self.search_results[name] = outcome
+
+                model_pipeline_logger.info(f"Model: {name} | Best Params: {outcome['Best Params']} | "
+                                           f"CV Accuracy: {outcome['CV Accuracy']} | Search Time: {outcome['Search Time (s)']}s")
+
+            return self.search_results
+
+        except Exception as e:
+            model_pipeline_logger.error(f"Error during hyperparameter search: {repr(e)}")
+
+            raise e
+
+    def _dispatch(self, models : dict, matrix_path : str, n_workers : int, thread_budgets : dict, timeouts : dict,
+                  default_timeout : float) -> list:
+        """
+        Fit the given models in separate processes, at most `n_workers` at a time.
+
+        Each process gets its own deadline; a process still running past it is terminated and the model is
+        recorded as timed out while the remaining models keep training.
+
+        Returns:
+
+            list                                    : One `fit_and_score` result dict per model.
+
+        """
+
+        context      = multiprocessing.get_context()
+        result_queue = context.Queue()
+        pending      = list(models.items())
+        running      = {}
+        results      = []
+
+        try:
+
+            while pending or running:
+
+                while pending and len(running) < n_workers:
+
+                    name, model = pending.pop(0)
+                    timeout     = timeouts.get(name, default_timeout)
+                    process     = context.Process(target = _fit_and_score_worker,
+                                                  kwargs = {"result_queue"  : result_queue,
+                                                            "name"          : name,
+                                                            "model"         : model,
+                                                            "matrix_path"   : matrix_path,
+                                                            "y_train"       : np.asarray(self.y_train),
+                                                            "y_test"        : np.asarray(self.y_test),
+                                                            "thread_budget" : thread_budgets.get(name, 1),
+                                                            "sample_weight" : self.sample_weight,
+                                                            },
+                                                  daemon = True
+                                                  )
+                    process.start()
+
+                    running[name] = (process, None if timeout is None else time.monotonic() + timeout)
+                    model_pipeline_logger.info(f"Started training {name} in process {process.pid}")
+
+                try:
+
+                    while True:
+                        result = result_queue.get(timeout = 0.5)
+                        results.append(result)
+
+                        process, _ = running.pop(result["name"])
+                        process.join()
+
+                except queue.Empty:
+                    pass
+
+                for name, (process, deadline) in list(running.items()):
+
+                    if deadline is not None and time.monotonic() > deadline:
+
+                        process.terminate()
+                        process.join()
+                        running.pop(name)
+
+                        results.append({"name" : name, "status" : "Timed Out", "accuracy" : None, "model" : None,
+                                        "fit_time" : None, "error" : f"Exceeded {timeouts.get(name, default_timeout)}s timeout"})
+
+                    elif not process.is_alive() and result_queue.empty():
+
+                        running.pop(name)
+
+                        results.append({"name" : name, "status" : "Failed", "accuracy" : None, "model" : None,
+                                        "fit_time" : None, "error" : f"Worker exited with code {process.exitcode}"})
+
+            return results
+
+        finally:
+
+            for process, _ in running.values():
+                process.terminate()
+
+    def train_and_evaluate(self, output_dir : str, n_workers : int = 1, thread_budgets : dict = None, timeouts : dict = None,
+                           default_timeout : float = None) -> None:
+        """
+        Train each model on the shared feature matrix and evaluate accuracy on test data.
+
+        Each fitted classifier is saved together with the cleaning step and the fitted vectorizer as a complete
+        `Pipeline([('clean', ...), ('cv', ...), ('clf', ...)])`, so the saved artifacts accept raw text.
+        Every saved pipeline is then profiled with `ModelProfiler` on the test texts. The results
+        (status, accuracy, fit time, latency, throughput and size) are stored in the `results` attribute.
+
+        With `n_workers > 1` or any timeout, every model is fitted in its own worker process reading the
+        feature matrices from a shared memory-mapped dump. A model that fails or exceeds its timeout is
+        recorded with that status instead of stopping the run.
+
+        Arguments:
+
+            `output_dir`                  {str}             : Directory where the pipelines are saved.
+
+            `n_workers`              {int, optional}        : Number of models trained concurrently.
+
+            `thread_budgets`        {dict, optional}        : Model name -> native thread budget (`n_jobs`, BLAS/OpenMP), default 1.
+
+            `timeouts`              {dict, optional}        : Model name -> timeout in seconds.
+
+            `default_timeout`       {float, optional}       : Timeout in seconds for models not listed in `timeouts`.
 
         """
 
@@ -108,34 +748,353 @@ class ModelTrainer:
 
             model_pipeline_logger.info("Training and evaluating models...")
 
+            thread_budgets = thread_budgets or {}
+            timeouts       = timeouts or {}
+            profiler       = ModelProfiler()
+
+            if self.x_train_matrix is None:
+                self.featurize()
+
             for name, model in self.models.items():
-                pipeline = Pipeline([('cv', CountVectorizer()),('clf', model)])
 
-                pipeline.fit(self.x_train, self.y_train)
-                preds    = pipeline.predict(self.x_test)
-                acc      = accuracy_score(self.y_test, preds)
+                if "n_jobs" in model.get_params():
+                    model.set_params(n_jobs = thread_budgets.get(name, 1))
 
-                self.results.append({"Model"    : name,
-                                    "Accuracy" : round(acc, 4)
-                                    })
+            outcomes       = []
+            to_train       = {}
+            keys           = {name : self.model_key(model) for name, model in self.models.items()}
                 
+            for name, model in self.models.items():
+
+                cached = None if self.cache is None else self.cache.load("models", keys[name])
+
+                if cached is not None:
+                    outcomes.append(dict(cached, name = name))
+
+                else:
+                    to_train[name] = model
+
+            model_pipeline_logger.info(f"Reusing {len(outcomes)} cached models, training {len(to_train)}")
+
+            matrix_dir     = tempfile.mkdtemp(prefix = "model_trainer_")
+            matrix_path    = os.path.join(matrix_dir, "features.joblib")
+
+            try:
+
+                joblib.dump((self.x_train_matrix, self.x_test_matrix), matrix_path)
+
+                if n_workers > 1 or timeouts or default_timeout is not None:
+                    trained  = self._dispatch(models          = to_train,
+                                              matrix_path     = matrix_path,
+                                              n_workers       = n_workers,
+                                              thread_budgets  = thread_budgets,
+                                              timeouts        = timeouts,
+                                              default_timeout = default_timeout
+                                              )
+
+                else:
+                    trained  = [fit_and_score(name          = name,
+                                              model         = model,
+                                              matrix_path   = matrix_path,
+                                              y_train       = np.asarray(self.y_train),
+                                              y_test        = np.asarray(self.y_test),
+                                              thread_budget = thread_budgets.get(name, 1),
+                                              sample_weight = self.sample_weight
+                                              ) for name, model in to_train.items()]
+
+            finally:
+                shutil.rmtree(matrix_dir, ignore_errors = True)
+
+            for outcome in trained:
+
+                if self.cache is not None and outcome["status"] == "Completed":
+                    self.cache.save("models", keys[outcome["name"]], outcome)
+
+            outcomes      += trained
+
+            for outcome in sorted(outcomes, key = lambda outcome : list(self.models).index(outcome["name"])):
+
+                name     = outcome["name"]
+
+                result   = {"Model"        : name,
+                            "Status"       : outcome["status"],
+                            "Accuracy"     : None if outcome["accuracy"] is None else round(outcome["accuracy"], 4),
+                            "Fit Time (s)" : None if outcome["fit_time"] is None else round(outcome["fit_time"], 2)
+                            }
+
+                result.update(self.search_results.get(name, {}))
+
+                self.results.append(result)
+
+                if outcome["status"] != "Completed":
+
+                    model_pipeline_logger.warning(f"Model: {name} | {outcome['status']}: {outcome['error']}")
+                    continue
+
+                self.models[name] = outcome["model"]
+
+                pipeline = build_serving_pipeline(vectorizer = self.vectorizer, classifier = outcome["model"])
                 filename = f"{name.lower().replace(' ', '_')}.pkl"
                 
                 saver    = PipelineSaver(output_dir  = output_dir, 
                                         pipeline    = pipeline
                                         )
                 
-                saver.save_pipeline(filename = filename)
+                self.pipeline_paths[name] = saver.save_pipeline(filename = filename)
+
+                result.update(profiler.profile(pipeline_path = self.pipeline_paths[name], texts = self.x_test))
 
-                model_pipeline_logger.info(f"Model: {name} | Accuracy: {round(acc, 4)}")
+                model_pipeline_logger.info(f"Model: {name} | Accuracy: {round(outcome['accuracy'], 4)}")
+
+                if hasattr(outcome["model"], "n_iter_"):
+                    model_pipeline_logger.info(f"Model: {name} | Iterations: {np.max(outcome['model'].n_iter_)} | "
+                                               f"Fit Time: {round(outcome['fit_time'], 2)}s")
                 model_pipeline_logger.info(f"Pipeline for {name} saved as {filename}.")
 
+            # Only meaningful when the features were computed; on a cache hit the time is just the load
+            if not self.features_cached:
+
+                time_saved = self.featurization_time * (len(self.models) - 1)
+
+                model_pipeline_logger.info(f"Shared featurization took {self.featurization_time:.2f}s; estimated saving versus "
+                                           f"refitting it per model: ~{time_saved:.2f}s (featurization time x {len(self.models) - 1} "
+                                           f"extra models, not measured).")
+
         except Exception as e:
             model_pipeline_logger.error(f"Error during training and evaluation: {repr(e)}")
             
             raise e
 
 
+    def evaluate_pruning_levels(self, levels : dict, output_dir : str, name : str = "Multinomial Logistic Regression") -> pd.DataFrame:
+        """
+        Train one model at several vocabulary pruning levels and measure what each level costs and saves.
+
+        Every level is a dict of CountVectorizer options (`min_df`, `max_df`, `max_features`) plus optionally
+        `chi2_k` (keep the k best tokens by chi-squared) or `l1_C` (keep the tokens an L1-penalized LinearSVC
+        with this C gives a non-zero weight). The pruned vocabulary is baked into a fixed-vocabulary vectorizer
+        (see `compact_vectorizer`), so the saved pipeline only carries and counts the kept tokens.
+
+        Arguments:
+
+            `levels`                     {dict}             : Level name -> pruning options, e.g. `Config.PRUNING_LEVELS`.
+
+            `output_dir`                  {str}             : Directory under which the pruned pipelines are saved.
+
+            `name`                   {str, optional}        : Name of the model in `self.models` to train.
+
+        Returns:
+
+            pd.DataFrame                                    : Accuracy, vocabulary size, fit time, artifact size and latency per level.
+
+        """
+
+        try:
+
+            profiler             = ModelProfiler()
+            y_train              = np.asarray(self.y_train)
+            self.pruning_results = []
+
+            for level, options in levels.items():
+
+                options        = dict(options)
+                chi2_k         = options.pop("chi2_k", None)
+                l1_C           = options.pop("l1_C", None)
+
+                start          = time.perf_counter()
+
+                vectorizer     = clone(self.vectorizer).set_params(**options)
+                x_train_matrix = vectorizer.fit_transform(self.x_train)
+                support        = None
+
+                if chi2_k is not None or l1_C is not None:
+
+                    selector       = (SelectKBest(chi2, k = min(chi2_k, x_train_matrix.shape[1])) if chi2_k is not None
+                                      else SelectFromModel(LinearSVC(penalty = "l1", dual = False, C = l1_C)))
+                    x_train_matrix = selector.fit_transform(x_train_matrix, y_train)
+                    support        = selector.get_support()
+
+                model          = fit_weighted(clone(self.models[name]), x_train_matrix, y_train, self.sample_weight)
+                pipeline       = build_serving_pipeline(vectorizer = compact_vectorizer(vectorizer = vectorizer, support = support), classifier = model)
+                fit_time       = time.perf_counter() - start
+
+                filename       = f"{re.sub(r'[^a-z0-9]+', '_', f'{name} {level}'.lower()).strip('_')}.pkl"
+                saver          = PipelineSaver(output_dir = os.path.join(output_dir, "pruned"), pipeline = pipeline)
+
+                self.pruning_paths[level] = saver.save_pipeline(filename = filename)
+
+                result         = {"Level"           : level,
+                                  "Accuracy"        : round(accuracy_score(self.y_test, pipeline.predict(self.x_test)), 4),
+                                  "Vocabulary Size" : len(pipeline.named_steps["cv"].vocabulary_),
+                                  "Fit Time (s)"    : round(fit_time, 2),
+                                  }
+
+                result.update(profiler.profile(pipeline_path = self.pruning_paths[level], texts = self.x_test))
+
+                self.pruning_results.append(result)
+
+                model_pipeline_logger.info(f"Pruning level {level} | Accuracy: {result['Accuracy']} | "
+                                           f"Vocabulary: {result['Vocabulary Size']} | Size: {result['Pickle Size (KB)']}KB | "
+                                           f"p99: {result['P99 Latency (ms)']}ms")
+
+            return pd.DataFrame(self.pruning_results)
+
+        except Exception as e:
+            model_pipeline_logger.error(f"Error evaluating pruning levels: {repr(e)}")
+
+            raise e
+
+
+    def deploy_pruned_model(self, accuracy_tolerance : float, deploy_path : str) -> str:
+        """
+        Copy the smallest pruned pipeline whose accuracy is within `accuracy_tolerance` of the best level to the deployed path.
+
+        Arguments:
+
+            `accuracy_tolerance`         {float}            : Maximum acceptable accuracy drop relative to the best pruning level.
+
+            `deploy_path`                 {str}             : Destination of the deployed pipeline, e.g. `Config.BEST_MODEL_PATH`.
+
+        Returns:
+
+            str                                             : Name of the deployed pruning level.
+
+        """
+
+        try:
+
+            df         = pd.DataFrame(self.pruning_results)
+
+            if df.empty:
+
+                model_pipeline_logger.error("No pruning levels have been evaluated.")
+                raise ValueError("No pruning levels have been evaluated.")
+
+            candidates = df[df["Accuracy"] >= df["Accuracy"].max() - accuracy_tolerance]
+            best       = candidates.sort_values(by = ["Pickle Size (KB)", "P99 Latency (ms)"]).iloc[0]
+
+            os.makedirs(os.path.dirname(deploy_path) or ".", exist_ok = True)
+
+            shutil.copyfile(self.pruning_paths[best["Level"]], deploy_path + ".tmp")
+            os.replace(deploy_path + ".tmp", deploy_path)
+
+            model_pipeline_logger.info(f"Deployed pruning level {best['Level']} (accuracy {best['Accuracy']}, "
+                                       f"{best['Pickle Size (KB)']}KB, p99 {best['P99 Latency (ms)']}ms) to {deploy_path}")
+
+            return best["Level"]
+
+        except Exception as e:
+            model_pipeline_logger.error(f"Error deploying pruned model: {repr(e)}")
+
+            raise e
+
+
+    def distill(self, output_dir : str, teacher : str = None, unlabeled_texts : list = None, hard_label_weight : float = 0.3,
+                name : str = "Distilled Linear Student") -> dict:
+        """
+        Distill the best heavy model into a sparse multinomial logistic regression on the shared features.
+
+        The teacher's `predict_proba` on the training corpus (and on optional unlabeled texts, e.g. stored
+        transcripts) serves as soft targets. For labeled rows they are mixed with the true label as
+        `hard_label_weight * one_hot + (1 - hard_label_weight) * teacher`. The student is saved through
+        PipelineSaver, profiled and added to the results table next to its teacher.
+
+        Arguments:
+
+            `output_dir`                  {str}             : Directory where the student pipeline is saved.
+
+            `teacher`                {str, optional}        : Teacher model name, by default the most accurate completed model
+                                                              in `DISTILLATION_TEACHERS`.
+
+            `unlabeled_texts`       {list, optional}        : Additional cleaned texts labeled by the teacher only.
+
+            `hard_label_weight`     {float, optional}       : Weight of the true label in the targets of labeled rows.
+
+            `name`                   {str, optional}        : Name of the student in the results table.
+
+        Returns:
+
+            dict                                            : The student's result row.
+
+        """
+
+        try:
+
+            completed = {result["Model"] : result for result in self.results if result["Status"] == "Completed"}
+
+            if teacher is None:
+
+                candidates = [model for model in DISTILLATION_TEACHERS if model in completed]
+
+                if not candidates:
+
+                    model_pipeline_logger.error("No trained teacher model is available for distillation.")
+                    raise ValueError("No trained teacher model is available for distillation.")
+
+                teacher    = max(candidates, key = lambda model : completed[model]["Accuracy"])
+
+            teacher_model = self.models[teacher]
+            classes       = teacher_model.classes_
+
+            matrix        = self.x_train_matrix
+            targets       = teacher_model.predict_proba(matrix)
+
+            one_hot       = (np.asarray(self.y_train)[:, None] == classes[None, :]).astype(float)
+            targets       = hard_label_weight * one_hot + (1 - hard_label_weight) * targets
+            row_weights   = None if self.sample_weight is None else np.asarray(self.sample_weight, dtype = float)
+
+            if unlabeled_texts is not None and len(unlabeled_texts) > 0:
+
+                unlabeled = self.vectorizer.transform(unlabeled_texts)
+                matrix    = sp.vstack([matrix, unlabeled]).tocsr()
+                targets   = np.vstack([targets, teacher_model.predict_proba(unlabeled)])
+
+                if row_weights is not None:
+                    row_weights = np.concatenate([row_weights, np.ones(unlabeled.shape[0])])
+
+            x_expanded, y_expanded, weights = expand_soft_targets(matrix        = matrix,
+                                                                  probabilities = targets,
+                                                                  classes       = classes,
+                                                                  sample_weight = row_weights
+                                                                  )
+
+            start         = time.perf_counter()
+            student       = LogisticRegression(solver = "lbfgs", max_iter = 1000).fit(x_expanded, y_expanded, sample_weight = weights)
+            fit_time      = time.perf_counter() - start
+
+            pipeline      = build_serving_pipeline(vectorizer = self.vectorizer, classifier = student)
+            filename      = f"{name.lower().replace(' ', '_')}.pkl"
+
+            saver         = PipelineSaver(output_dir  = output_dir,
+                                          pipeline    = pipeline
+                                          )
+
+            self.pipeline_paths[name] = saver.save_pipeline(filename = filename)
+
+            result        = {"Model"        : name,
+                             "Status"       : "Completed",
+                             "Accuracy"     : round(accuracy_score(self.y_test, student.predict(self.x_test_matrix)), 4),
+                             "Fit Time (s)" : round(fit_time, 2),
+                             "Teacher"      : teacher
+                             }
+
+            result.update(ModelProfiler().profile(pipeline_path = self.pipeline_paths[name], texts = self.x_test))
+
+            self.results  = [row for row in self.results if row["Model"] != name] + [result]
+
+            model_pipeline_logger.info(f"Distilled {teacher} (accuracy {completed[teacher]['Accuracy']}, "
+                                       f"p99 {completed[teacher].get('P99 Latency (ms)')}ms) into {name} "
+                                       f"(accuracy {result['Accuracy']}, p99 {result['P99 Latency (ms)']}ms) "
+                                       f"on {matrix.shape[0]} texts, {0 if unlabeled_texts is None else len(unlabeled_texts)} unlabeled")
+
+            return result
+
+        except Exception as e:
+            model_pipeline_logger.error(f"Error during distillation: {repr(e)}")
+            
+            raise e
+
+
     def show_results(self):
         """
         Return a sorted DataFrame of model names and their accuracy scores.
@@ -168,7 +1127,7 @@ class ModelTrainer:
 
             plt_saver        = PlotSaver(output_dir = output_dir)
             
-            df               = self.show_results()
+            df               = self.show_results().dropna(subset = ["Accuracy"])
             plt.figure(figsize = (10, 6))
             
             plt.barh(df["Model"], 
@@ -193,3 +1152,171 @@ class ModelTrainer:
             model_pipeline_logger.error(f"Error during plotting: {repr(e)}")
             
             raise e
+
+
+    def compare_models(self, baseline : str, candidate : str) -> dict:
+        """
+        Compare the fit time and accuracy of a candidate model against a baseline model.
+
+        Arguments:
+
+            `baseline`                    {str}             : Name of the reference model, e.g. "RBF SVM".
+
+            `candidate`                   {str}             : Name of the model compared against it.
+
+        Returns:
+
+            dict                                            : Fit time speedup and accuracy difference, empty if either model did not complete.
+
+        """
+
+        try:
+
+            df = self.show_results().set_index("Model")
+
+            if any(name not in df.index or df.loc[name, "Status"] != "Completed" for name in (baseline, candidate)):
+
+                model_pipeline_logger.warning(f"Cannot compare {candidate} with {baseline}: both must complete training.")
+                return {}
+
+            comparison = {"Fit Time Speedup"    : round(float(df.loc[baseline, "Fit Time (s)"] / max(df.loc[candidate, "Fit Time (s)"], 1e-9)), 2),
+                          "Accuracy Difference" : round(float(df.loc[candidate, "Accuracy"] - df.loc[baseline, "Accuracy"]), 4)
+                          }
+
+            model_pipeline_logger.info(f"{candidate} vs {baseline}: {comparison['Fit Time Speedup']}x faster to fit, "
+                                       f"accuracy difference {comparison['Accuracy Difference']:+.4f}")
+
+            return comparison
+
+        except Exception as e:
+            model_pipeline_logger.error(f"Error comparing models: {repr(e)}")
+
+            raise e
+
+
+    def save_results(self, output_dir : str) -> str:
+        """
+        Save the results table as a CSV file, and the pruning report as `pruning_results.csv` when one was computed.
+
+        Arguments:
+
+            `output_dir`                  {str}             : Directory where `model_results.csv` is written.
+
+        Returns:
+
+            str                                             : Path of the saved CSV file.
+
+        """
+
+        try:
+
+            file_path = os.path.join(output_dir, "model_results.csv")
+
+            self.show_results().to_csv(file_path, index = False)
+
+            if self.pruning_results:
+                pd.DataFrame(self.pruning_results).to_csv(os.path.join(output_dir, "pruning_results.csv"), index = False)
+
+            model_pipeline_logger.info(f"Results table saved at: {file_path}")
+
+            return file_path
+
+        except Exception as e:
+            model_pipeline_logger.error(f"Error saving results: {repr(e)}")
+
+            raise e
+
+
+    def plot_pareto(self, output_dir : str) -> None:
+        """
+        Plot accuracy against p99 single-sample latency and highlight the Pareto-optimal models.
+
+        A model is Pareto-optimal when no other model is both at least as accurate and at least as fast.
+
+        Arguments:
+
+            `output_dir`                  {str}             : Directory of the Plot where it will be saved
+
+        """
+
+        try:
+
+            plt_saver        = PlotSaver(output_dir = output_dir)
+
+            df               = self.show_results().dropna(subset = ["Accuracy", "P99 Latency (ms)"])
+            df               = df.sort_values(by = ["P99 Latency (ms)", "Accuracy"], ascending = [True, False])
+            pareto           = df[df["Accuracy"] > df["Accuracy"].cummax().shift(fill_value = -1)]
+
+            plt.figure(figsize = (10, 6))
+
+            plt.scatter(df["P99 Latency (ms)"], df["Accuracy"], color = "skyblue", label = "Models")
+            plt.plot(pareto["P99 Latency (ms)"], pareto["Accuracy"], color = "orange", marker = "o", label = "Pareto Front")
+
+            for _, row in df.iterrows():
+                plt.annotate(row["Model"], (row["P99 Latency (ms)"], row["Accuracy"]), fontsize = 8,
+                             textcoords = "offset points", xytext = (5, 5))
+
+            plt.xscale("log")
+            plt.xlabel("P99 Single-Sample Latency (ms)")
+            plt.ylabel("Accuracy")
+            plt.title("Model Accuracy vs Latency")
+            plt.legend()
+            plt.tight_layout()
+
+            plt_saver.save_plot(plot       = plt,
+                                plot_name  = "model_accuracy_latency_pareto"
+                                )
+
+            plt.close()
+
+            model_pipeline_logger.info("Pareto plot saved successfully.")
+
+        except Exception as e:
+            model_pipeline_logger.error(f"Error during Pareto plotting: {repr(e)}")
+
+            raise e
+
+
+    def deploy_best_model(self, latency_budget_ms : float, deploy_path : str) -> str:
+        """
+        Copy the most accurate pipeline whose p99 single-sample latency fits the budget to the deployed path.
+
+        Arguments:
+
+            `latency_budget_ms`          {float}            : Maximum acceptable p99 latency in milliseconds.
+
+            `deploy_path`                 {str}             : Destination of the deployed pipeline, e.g. `Config.BEST_MODEL_PATH`.
+
+        Returns:
+
+            str                                             : Name of the deployed model.
+
+        """
+
+        try:
+
+            df         = self.show_results().dropna(subset = ["Accuracy", "P99 Latency (ms)"])
+            candidates = df[df["P99 Latency (ms)"] <= latency_budget_ms]
+
+            if candidates.empty:
+
+                model_pipeline_logger.error(f"No model meets the {latency_budget_ms}ms p99 latency budget.")
+                raise ValueError(f"No model meets the {latency_budget_ms}ms p99 latency budget.")
+
+            best       = candidates.sort_values(by = ["Accuracy", "P99 Latency (ms)"], ascending = [False, True]).iloc[0]
+
+            os.makedirs(os.path.dirname(deploy_path) or ".", exist_ok = True)
+
+            if os.path.abspath(self.pipeline_paths[best["Model"]]) != os.path.abspath(deploy_path):
+                shutil.copyfile(self.pipeline_paths[best["Model"]], deploy_path + ".tmp")
+                os.replace(deploy_path + ".tmp", deploy_path)
+
+            model_pipeline_logger.info(f"Deployed {best['Model']} (accuracy {best['Accuracy']}, "
+                                       f"p99 {best['P99 Latency (ms)']}ms) to {deploy_path}")
+
+            return best["Model"]
+
+        except Exception as e:
+            model_pipeline_logger.error(f"Error deploying best model: {repr(e)}")
+
+            raise e
@@ -0,0 +1,245 @@
+# DEPENDENCIES
+
+import os
+import json
+import joblib
+import hashlib
+import pandas as pd
+from .logger import LoggerSetup
+
+# LOGGER SETUP
+artifact_cache_logger = LoggerSetup(logger_name = "artifact_cache.py", log_filename_prefix = "artifact_cache").get_logger()
+
+
+class ArtifactCache:
+    """
+    A content-addressed store for intermediate training artifacts.
+
+    Every artifact is saved under a fingerprint of everything that produced it (input data hashes,
+    configuration and hyperparameters), so an unchanged step can be reused on the next run and any
+    change to its inputs automatically produces a new key.
+
+    Attributes:
+
+        `cache_dir`                   {str}             : Directory where the artifacts are stored.
+
+        `force`                      {bool}             : When True, lookups always miss so every step is recomputed.
+
+    """
+
+    def __init__(self, cache_dir : str, force : bool = False) -> None:
+        """
+        Initialize the ArtifactCache.
+
+        Arguments:
+
+            `cache_dir`                   {str}             : Directory where the artifacts are stored.
+
+            `force`                 {bool, optional}        : Ignore existing artifacts and overwrite them.
+
+        """
+
+        try:
+
+            self.cache_dir = cache_dir
+            self.force     = force
+
+            os.makedirs(self.cache_dir, exist_ok = True)
+
+            artifact_cache_logger.info(f"ArtifactCache initialized at {self.cache_dir} (force = {self.force})")
+
+        except Exception as e:
+            artifact_cache_logger.error(f"Error initializing ArtifactCache: {repr(e)}")
+
+            raise e
+
+    @staticmethod
+    def fingerprint(*parts) -> str:
+        """
+        Hash a sequence of configuration values into a stable key.
+
+        Values that are not JSON serializable (estimators, numpy scalars) are hashed through their `repr`.
+
+        Arguments:
+
+            `parts`                                         : Values identifying an artifact.
+
+        Returns:
+
+            str                                             : Hex digest of the parts.
+
+        """
+
+        payload = json.dumps(parts, sort_keys = True, default = repr)
+
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def file_hash(file_path : str, block_size : int = 1 << 20) -> str:
+        """
+        Hash the contents of a file.
+
+        Arguments:
+
+            `file_path`                   {str}             : Path of the file to hash.
+
+            `block_size`             {int, optional}        : Number of bytes read per step.
+
+        Returns:
+
+            str                                             : Hex digest of the file contents.
+
+        """
+
+        digest = hashlib.sha256()
+
+        with open(file_path, "rb") as f:
+
+            for block in iter(lambda: f.read(block_size), b""):
+                digest.update(block)
+
+        return digest.hexdigest()
+
+    def _path(self, namespace : str, key : str, extension : str = "joblib") -> str:
+        """
+        Path of the artifact stored under `namespace/key`.
+
+        """
+
+        return os.path.join(self.cache_dir, namespace, f"{key}.{extension}")
+
+    def load(self, namespace : str, key : str):
+        """
+        Load a cached artifact.
+
+        Arguments:
+
+            `namespace`                   {str}             : Kind of artifact, e.g. "cleaned_data", "features" or "models".
+
+            `key`                         {str}             : Fingerprint of the artifact.
+
+        Returns:
+
+            object                                          : The cached artifact, or None on a miss or when `force` is set.
+
+        """
+
+        path = self._path(namespace, key)
+
+        if self.force or not os.path.exists(path):
+            return None
+
+        try:
+
+            artifact = joblib.load(path)
+            artifact_cache_logger.info(f"Cache hit: {namespace}/{key[:12]}")
+
+            return artifact
+
+        except Exception as e:
+            artifact_cache_logger.warning(f"Ignoring unreadable cache entry {path}: {repr(e)}")
+
+            return None
+
+    def save(self, namespace : str, key : str, artifact) -> str:
+        """
+        Store an artifact, replacing any previous entry atomically.
+
+        Arguments:
+
+            `namespace`                   {str}             : Kind of artifact, e.g. "cleaned_data", "features" or "models".
+
+            `key`                         {str}             : Fingerprint of the artifact.
+
+            `artifact`                                      : Object to store.
+
+        Returns:
+
+            str                                             : Path of the stored artifact.
+
+        """
+
+        try:
+
+            path = self._path(namespace, key)
+            os.makedirs(os.path.dirname(path), exist_ok = True)
+
+            joblib.dump(artifact, path + ".tmp")
+            os.replace(path + ".tmp", path)
+
+            artifact_cache_logger.info(f"Cached {namespace}/{key[:12]}")
+
+            return path
+
+        except Exception as e:
+            artifact_cache_logger.error(f"Error caching {namespace}/{key[:12]}: {repr(e)}")
+
+            raise e
+
+    def load_frame(self, namespace : str, key : str) -> pd.DataFrame:
+        """
+        Load a DataFrame cached as Parquet, keeping its categorical and pyarrow string dtypes.
+
+        Arguments:
+
+            `namespace`                   {str}             : Kind of artifact, e.g. "cleaned_data".
+
+            `key`                         {str}             : Fingerprint of the artifact.
+
+        Returns:
+
+            pd.DataFrame                                    : The cached DataFrame, or None on a miss or when `force` is set.
+
+        """
+
+        path = self._path(namespace, key, extension = "parquet")
+
+        if self.force or not os.path.exists(path):
+            return None
+
+        try:
+
+            dataframe = pd.read_parquet(path)
+            artifact_cache_logger.info(f"Cache hit: {namespace}/{key[:12]}")
+
+            return dataframe
+
+        except Exception as e:
+            artifact_cache_logger.warning(f"Ignoring unreadable cache entry {path}: {repr(e)}")
+
+            return None
+
+    def save_frame(self, namespace : str, key : str, dataframe : pd.DataFrame) -> str:
+        """
+        Store a DataFrame as Parquet, replacing any previous entry atomically.
+
+        Arguments:
+
+            `namespace`                   {str}             : Kind of artifact, e.g. "cleaned_data".
+
+            `key`                         {str}             : Fingerprint of the artifact.
+
+            `dataframe`             {pd.DataFrame}          : DataFrame to store; its index is not kept.
+
+        Returns:
+
+            str                                             : Path of the stored artifact.
+
+        """
+
+        try:
+
+            path = self._path(namespace, key, extension = "parquet")
+            os.makedirs(os.path.dirname(path), exist_ok = True)
+
+            dataframe.to_parquet(path + ".tmp", index = False)
+            os.replace(path + ".tmp", path)
+
+            artifact_cache_logger.info(f"Cached {namespace}/{key[:12]}")
+
+            return path
+
+        except Exception as e:
+            artifact_cache_logger.error(f"Error caching {namespace}/{key[:12]}: {repr(e)}")
+
+            raise e
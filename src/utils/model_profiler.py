@@ -0,0 +1,163 @@
+# DEPENDENCIES
+
+import os
+import time
+import joblib
+import tracemalloc
+import numpy as np
+import pandas as pd
+from .logger import LoggerSetup
+
+# LOGGER SETUP
+model_profiler_logger = LoggerSetup(logger_name = "model_profiler.py", log_filename_prefix = "model_profiler").get_logger()
+
+
+class ModelProfiler:
+    """
+    A utility class for measuring the serving cost of a saved scikit-learn pipeline.
+
+    The pipeline is loaded from disk exactly as the app loads it, then timed on single-sample
+    requests (the UI path) and on one large batch.
+
+    Attributes:
+
+        `n_single`                    {int}             : Number of single-sample predictions used for the latency percentiles.
+
+        `n_warmup`                    {int}             : Number of untimed predictions run before measuring.
+
+    """
+
+    def __init__(self, n_single : int = 200, n_warmup : int = 10) -> None:
+        """
+        Initialize the ModelProfiler.
+
+        Arguments:
+
+            `n_single`               {int, optional}        : Number of timed single-sample predictions.
+
+            `n_warmup`               {int, optional}        : Number of untimed warm-up predictions.
+
+        """
+
+        self.n_single = n_single
+        self.n_warmup = n_warmup
+
+    def _time_predictions(self, pipeline, texts : list) -> dict:
+        """
+        Time single-sample predictions and one batch prediction.
+
+        Returns:
+
+            dict                                            : p50/p99 single-sample latency and batch throughput.
+
+        """
+
+        for text in texts[:self.n_warmup]:
+            pipeline.predict([text])
+
+        latencies  = []
+
+        for text in texts[:self.n_single]:
+
+            start  = time.perf_counter()
+            pipeline.predict([text])
+            latencies.append(time.perf_counter() - start)
+
+        start      = time.perf_counter()
+        pipeline.predict(texts)
+        batch_time = time.perf_counter() - start
+
+        return {"P50 Latency (ms)"    : round(float(np.percentile(latencies, 50)) * 1000, 3),
+                "P99 Latency (ms)"    : round(float(np.percentile(latencies, 99)) * 1000, 3),
+                "Throughput (rows/s)" : round(len(texts) / batch_time, 1),
+                }
+
+    def profile(self, pipeline_path : str, texts : list) -> dict:
+        """
+        Profile a pickled pipeline.
+
+        Arguments:
+
+            `pipeline_path`               {str}             : Path of the pickled pipeline.
+
+            `texts`                      {list}             : Raw texts used as requests; the whole list is used for the batch measurement.
+
+        Returns:
+
+            dict                                            : Pickle size, loaded memory, p50/p99 single-sample latency and batch throughput.
+
+        """
+
+        try:
+
+            texts      = list(texts)
+
+            tracemalloc.start()
+            pipeline   = joblib.load(pipeline_path)
+            _, peak    = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            profile    = {"Pickle Size (KB)"    : round(os.path.getsize(pipeline_path) / 1024, 1),
+                          "Loaded Memory (KB)"  : round(peak / 1024, 1),
+                          }
+
+            profile.update(self._time_predictions(pipeline = pipeline, texts = texts))
+
+            model_profiler_logger.info(f"Profiled {pipeline_path}: {profile}")
+
+            return profile
+
+        except Exception as e:
+            model_profiler_logger.error(f"Error profiling pipeline {pipeline_path}: {repr(e)}")
+
+            raise e
+
+    def compare_preprocessing(self, pipeline_path : str, texts : list) -> pd.DataFrame:
+        """
+        Compare a saved `clean` -> `cv` -> `clf` pipeline on raw texts against the same pipeline without its `clean` step.
+
+        The second setup is how raw transcripts used to be served: straight into the vectorizer.
+
+        Arguments:
+
+            `pipeline_path`               {str}             : Path of the pickled pipeline.
+
+            `texts`                      {list}             : Raw, uncleaned texts used as requests.
+
+        Returns:
+
+            pd.DataFrame                                    : Latency, throughput and average counted tokens per request of both setups.
+
+        """
+
+        try:
+
+            texts      = list(texts)
+            pipeline   = joblib.load(pipeline_path)
+
+            if "clean" not in pipeline.named_steps:
+                raise ValueError(f"{pipeline_path} has no 'clean' step")
+
+            setups     = {"raw text -> cv -> clf" : pipeline[1:],
+                          "clean -> cv -> clf"    : pipeline,
+                          }
+            rows       = []
+
+            for name, setup in setups.items():
+
+                row    = {"Setup" : name}
+                row.update(self._time_predictions(pipeline = setup, texts = texts))
+                row["Tokens per Request"] = round(float(setup[:-1].transform(texts).sum(axis = 1).mean()), 2)
+
+                rows.append(row)
+
+            comparison = pd.DataFrame(rows)
+
+            model_profiler_logger.info(f"Preprocessing comparison for {pipeline_path}:\n{comparison.to_string(index = False)}")
+
+            return comparison
+
+        except Exception as e:
+            model_profiler_logger.error(f"Error comparing preprocessing of {pipeline_path}: {repr(e)}")
+
+            raise e
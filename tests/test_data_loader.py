@@ -0,0 +1,32 @@
+import pandas as pd
+from sklearn.feature_extraction.text import CountVectorizer
+
+from src.data_cleaner.cleaner import TextCleaner
+from src.utils.data_loader import DataLoader
+
+
+def test_streamed_text_that_cleans_to_empty_string_loads_as_empty_string(tmp_path):
+
+    raw_path     = tmp_path / "raw.csv"
+    cleaned_path = tmp_path / "cleaned.csv"
+
+    pd.DataFrame({"Emotion" : ["joy", "sadness", "joy"],
+                  "Text"    : ["What a lovely day", "@user the and", "so happy today"],
+                  }).to_csv(raw_path, index = False)
+
+    data_loader  = DataLoader()
+    data_loader.stream_transform(input_path  = str(raw_path),
+                                 output_path = str(cleaned_path),
+                                 transform   = lambda chunk : TextCleaner(dataframe = chunk).data_cleaning(),
+                                 chunk_size  = 2
+                                 )
+
+    dataframe    = data_loader.typed_loader(file_path       = str(cleaned_path),
+                                            columns         = ["Emotion", "Clean_Text"],
+                                            keep_default_na = False
+                                            )
+
+    assert dataframe["Clean_Text"].tolist()[1] == ""
+    assert not dataframe["Clean_Text"].isna().any()
+
+    CountVectorizer().fit(dataframe["Clean_Text"])
@@ -0,0 +1,28 @@
+from datetime import datetime, timezone
+
+from web.utils.database_manager import DatabaseManager
+
+
+def test_pruning_keeps_predictions_with_feedback(tmp_path):
+
+    database_manager = DatabaseManager(db_path = str(tmp_path / "data.db"))
+    expired          = datetime(2020, 1, 1, tzinfo = timezone.utc)
+
+    confirmed_id     = database_manager.add_prediction_details(rawtext     = "what a lovely day",
+                                                               prediction  = "joy",
+                                                               probability = 0.9,
+                                                               timeOfvisit = expired
+                                                               )
+    database_manager.add_prediction_details(rawtext = "so tired", prediction = "sadness", probability = 0.6, timeOfvisit = expired)
+    database_manager.confirm_prediction(prediction_id = confirmed_id, label = "joy")
+
+    database_manager.refresh_rollups()
+    database_manager.prune_expired_events()
+
+    feedback         = [row for rows in database_manager.iter_feedback_chunks() for row in rows]
+    remaining        = database_manager.c.execute('SELECT id FROM emotionclfTable').fetchall()
+
+    database_manager.close_connection()
+
+    assert [(text, label) for _, text, label in feedback] == [("what a lovely day", "joy")]
+    assert remaining == [(confirmed_id,)]
@@ -4,6 +4,7 @@ import os
 import sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
+import time
 import pandas as pd
 import altair as alt
 import streamlit as st
@@ -14,31 +15,189 @@ from datetime import datetime
 from config.config import Config
 from src.utils.logger import LoggerSetup
 from web.utils.database_manager import DatabaseManager 
+from web.utils.prediction_exporter import PredictionExporter
 
 IST = timezone(Config.TIMEZONE_IST)
 
+HOUR_MS      = 60 * 60 * 1000
+DAY_MS       = 24 * HOUR_MS
+
+# Window label -> (window length in ms, histogram bucket width in ms, rollup granularity or None for raw events)
+TIME_WINDOWS = {"Last 24 Hours" : (DAY_MS, HOUR_MS, None),
+                "Last 7 Days"   : (7 * DAY_MS, DAY_MS, "day"),
+                "Last 30 Days"  : (30 * DAY_MS, DAY_MS, "day"),
+                "All Time"      : (None, DAY_MS, "day"),
+                }
+
 monitor_logger               = LoggerSetup(logger_name = "monitor.py", log_filename_prefix = "monitor").get_logger()
 
+def to_ist(epoch_ms : pd.Series) -> pd.Series:
+    """
+    Convert a series of UTC epoch milliseconds to IST datetimes for display.
+
+    """
+
+    return pd.to_datetime(epoch_ms, unit = 'ms', utc = True).dt.tz_convert(IST)
+
+def render_prediction_browser(database_Manager : DatabaseManager, start_ms : int = None) -> None:
+    """
+    Render a paged table of raw prediction records.
+
+    Only one page is queried per rerun; the keyset cursors of the pages visited so far are kept in
+    `st.session_state` so the user can step back and forth without any `OFFSET` scan.
+
+    Arguments:
+
+        `database_Manager`         {DatabaseManager}         : Open database manager to query.
+
+        `start_ms`                  {int, optional}          : Inclusive lower bound of the time window in UTC epoch milliseconds.
+
+    """
+
+    col1, col2                   = st.columns(2)
+
+    with col1:
+        emotion                  = st.selectbox("Emotion", options = ["All"] + sorted(database_Manager.label_ids.keys()))
+
+    with col2:
+        page_size                = st.selectbox("Rows per Page", options = [25, 50, 100], index = 1)
+
+    filters                      = (emotion, page_size, start_ms)
+
+    # Reset to the first page whenever the filters change
+    if st.session_state.get("prediction_browser_filters") != filters:
+        st.session_state.prediction_browser_filters = filters
+        st.session_state.prediction_browser_cursors = [None]
+
+    cursors                      = st.session_state.prediction_browser_cursors
+
+    rows                         = database_Manager.page_prediction_details(limit      = page_size + 1,
+                                                                            cursor     = cursors[-1],
+                                                                            prediction = None if emotion == "All" else emotion,
+                                                                            start_ms   = start_ms
+                                                                            )
+    has_next                     = len(rows) > page_size
+    rows                         = rows[:page_size]
+
+    df_emotions                  = pd.DataFrame(rows,
+                                                columns = ['Id',
+                                                        'Rawtext',
+                                                        'Prediction',
+                                                        'Probability',
+                                                        'Time_of_Visit'
+                                                        ]
+                                                )
+    df_emotions['Time_of_Visit'] = to_ist(df_emotions['Time_of_Visit'])
+    st.dataframe(df_emotions.set_index('Id'))
+
+    col1, col2, col3             = st.columns([1, 2, 1])
+
+    with col1:
+        if st.button("◀ Previous", disabled = len(cursors) == 1, key = "prediction_browser_previous"):
+            cursors.pop()
+            st.rerun()
+
+    with col2:
+        st.caption(f"Page {len(cursors)}")
+
+    with col3:
+        if st.button("Next ▶", disabled = not has_next, key = "prediction_browser_next"):
+            cursors.append((rows[-1][4], rows[-1][0]))
+            st.rerun()
+
+def database_prediction_metrics(database_Manager : DatabaseManager, start_ms : int, bucket_ms : int, granularity : str = None) -> tuple:
+    """
+    Fetch the emotion classifier aggregates from SQLite (raw events or rollups).
+
+    Returns:
+
+        tuple                        : `(prediction_count, prediction_histogram, confidence)` DataFrames.
+
+    """
+
+    prediction_count             = pd.DataFrame(database_Manager.count_predictions(start_ms = start_ms, granularity = granularity),
+                                                columns = ['Prediction',
+                                                        'Counts'
+                                                        ]
+                                                )
+
+    prediction_histogram         = pd.DataFrame(database_Manager.prediction_histogram(bucket_ms = bucket_ms, start_ms = start_ms, granularity = granularity),
+                                                columns = ['Time',
+                                                        'Prediction',
+                                                        'Counts'
+                                                        ]
+                                                )
+
+    confidence                   = pd.DataFrame(database_Manager.confidence_quantiles(start_ms = start_ms, granularity = granularity),
+                                                columns = ['Prediction',
+                                                        'Quantile',
+                                                        'Confidence'
+                                                        ]
+                                                )
+    confidence                   = confidence.pivot(index = 'Prediction', columns = 'Quantile', values = 'Confidence')
+    confidence_mean              = pd.DataFrame(database_Manager.confidence_means(start_ms = start_ms, granularity = granularity),
+                                                columns = ['Prediction',
+                                                        'Mean'
+                                                        ]
+                                                )
+
+    return prediction_count, prediction_histogram, confidence_mean.set_index('Prediction').join(confidence)
+
+def history_prediction_metrics(exporter : PredictionExporter, start_ms : int, bucket_ms : int) -> tuple:
+    """
+    Compute the emotion classifier aggregates from the exported Parquet history.
+
+    Only the `prediction`, `probability` and `timestampMs` columns of the partitions inside the window are read.
+
+    Returns:
+
+        tuple                        : `(prediction_count, prediction_histogram, confidence)` DataFrames.
+
+    """
+
+    history                      = exporter.load_history(start_ms = start_ms, columns = ['prediction', 'probability', 'timestampMs'])
+    history['Time']              = history['timestampMs'] // bucket_ms * bucket_ms
+
+    prediction_count             = (history['prediction'].value_counts(sort = True)
+                                                         .rename_axis('Prediction')
+                                                         .reset_index(name = 'Counts'))
+    prediction_count             = prediction_count[prediction_count['Counts'] > 0]
+
+    prediction_histogram         = (history.groupby(['Time', 'prediction'], observed = True)
+                                           .size()
+                                           .reset_index(name = 'Counts')
+                                           .rename(columns = {'prediction' : 'Prediction'}))
+
+    probability                  = history.groupby('prediction', observed = True)['probability']
+    confidence                   = probability.quantile([0.5, 0.9, 0.99], interpolation = 'lower').unstack()
+    confidence.insert(0, 'Mean', probability.mean())
+
+    return prediction_count, prediction_histogram, confidence.rename_axis('Prediction')
+
 def main():
 
     try:
 
         database_Manager         = DatabaseManager(db_path = Config.DATABASE_PATH)
+        exporter                 = PredictionExporter(output_dir = Config.PREDICTION_HISTORY_PATH) if Config.PREDICTION_HISTORY_PATH else None
         
 
         database_Manager.add_page_visited_details("Monitor", datetime.now(IST))
+        database_Manager.run_maintenance(exporter = exporter)
         st.subheader("📊 Monitor App")
 
+        window_name              = st.selectbox("Time Window", options = list(TIME_WINDOWS.keys()), index = 1)
+        window_ms, bucket_ms, granularity = TIME_WINDOWS[window_name]
+        # Align the window start to the bucket width so histogram buckets and browser pages stay stable across reruns
+        start_ms                 = None if window_ms is None else (time.time_ns() // 1_000_000 - window_ms) // bucket_ms * bucket_ms
+
         with st.expander("📈 Page Metrics"):
             
-            page_visited_details = pd.DataFrame(database_Manager.view_all_page_visited_details(), 
+            pg_count             = pd.DataFrame(database_Manager.count_page_visits(start_ms = start_ms, granularity = granularity),
                                                 columns = ['Page Name', 
-                                                        'Time of Visit'
+                                                        'Counts'
                                                         ]
                                                 )
-            st.dataframe(page_visited_details)
-
-            pg_count             = page_visited_details['Page Name'].value_counts().rename_axis('Page Name').reset_index(name = 'Counts')
 
             bar_chart            = alt.Chart(pg_count).mark_bar().encode(x      = 'Page Name', 
                                                                         y      = 'Counts', 
@@ -53,19 +212,39 @@ def main():
             
             st.plotly_chart(pie_chart, use_container_width = True)
 
+            page_histogram       = pd.DataFrame(database_Manager.page_visit_histogram(bucket_ms = bucket_ms, start_ms = start_ms, granularity = granularity),
+                                                columns = ['Time',
+                                                        'Page Name',
+                                                        'Counts'
+                                                        ]
+                                                )
+            page_histogram['Time'] = to_ist(page_histogram['Time'])
+
+            page_timeline        = alt.Chart(page_histogram).mark_bar().encode(x      = 'Time:T',
+                                                                              y      = 'Counts',
+                                                                              color  = 'Page Name'
+                                                                              )
+            st.altair_chart(page_timeline, use_container_width = True)
+
         # Emotion Classifier Metrics
         with st.expander("💡 Emotion Classifier Metrics"):
             
-            df_emotions          = pd.DataFrame(database_Manager.view_all_prediction_details(), 
-                                                columns = ['Rawtext', 
-                                                        'Prediction', 
-                                                        'Probability', 
-                                                        'Time_of_Visit'
-                                                        ]
-                                                )
-            st.dataframe(df_emotions)
+            use_history          = (granularity is not None and exporter is not None and
+                                    st.checkbox("Read long-range history from the Parquet export"))
+
+            # The export itself runs from run_maintenance, so reruns never write small Parquet files
+            if use_history:
+                prediction_count, prediction_histogram, confidence = history_prediction_metrics(exporter  = exporter,
+                                                                                                start_ms  = start_ms,
+                                                                                                bucket_ms = bucket_ms
+                                                                                                )
 
-            prediction_count     = df_emotions['Prediction'].value_counts().rename_axis('Prediction').reset_index(name = 'Counts')
+            else:
+                prediction_count, prediction_histogram, confidence = database_prediction_metrics(database_Manager = database_Manager,
+                                                                                                 start_ms         = start_ms,
+                                                                                                 bucket_ms        = bucket_ms,
+                                                                                                 granularity      = granularity
+                                                                                                 )
 
             prediction_chart     = alt.Chart(prediction_count).mark_bar().encode(x      = 'Prediction', 
                                                                                 y      = 'Counts', 
@@ -74,6 +253,18 @@ def main():
             
             st.altair_chart(prediction_chart, use_container_width = True)
 
+            prediction_histogram['Time'] = to_ist(prediction_histogram['Time'])
+
+            prediction_timeline  = alt.Chart(prediction_histogram).mark_bar().encode(x      = 'Time:T',
+                                                                                    y      = 'Counts',
+                                                                                    color  = 'Prediction'
+                                                                                    )
+            st.altair_chart(prediction_timeline, use_container_width = True)
+
+            st.dataframe(confidence)
+
+            render_prediction_browser(database_Manager = database_Manager, start_ms = start_ms)
+
         monitor_logger.info("Monitor Page Visited Successfully")
 
     except Exception as e:
@@ -4,11 +4,16 @@ import os
 import sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
+import re
+import json
+import argparse
+import time
 import pytz
 import sqlite3
-from librosa import ex
+import numpy as np
 from datetime import datetime
 
+from config.config import Config
 from src.utils.logger import LoggerSetup
 
 database_manager_logger = LoggerSetup(logger_name = "database_manager.py", log_filename_prefix = "database_manager").get_logger()
@@ -18,9 +23,25 @@ class DatabaseManager:
     A class for managing database operations for tracking page visits and emotion classifications.
     
     This class provides methods to create tables, add data, and retrieve data from a SQLite database.
-    It handles time conversion to Indian Standard Time (IST) and manages database connections.
+    Timestamps are stored as integer epoch milliseconds in UTC and emotion labels are stored as integer
+    codes referencing `emotionLabelTable`. The schema is versioned through `PRAGMA user_version` and
+    older databases are migrated in place when a connection is opened.
     """
 
+    SCHEMA_VERSION       = 5
+
+    # Rollup level -> bucket width in milliseconds
+    ROLLUP_GRANULARITIES = {"minute" : 60 * 1000,
+                            "hour"   : 60 * 60 * 1000,
+                            "day"    : 24 * 60 * 60 * 1000,
+                            }
+
+    # Number of equal-width confidence bins kept per rollup bucket for quantile estimates
+    CONFIDENCE_BINS      = 20
+
+    # Storage dtype of the per-class probability vectors (little-endian float16)
+    PROBABILITY_DTYPE    = np.dtype('<f2')
+
     def __init__(self, db_path : str) -> None:
         """
         Initialize the DatabaseManager with a connection to the specified database.
@@ -33,12 +54,15 @@ class DatabaseManager:
 
         try:
         
-            self.conn  = sqlite3.connect(db_path, check_same_thread = False)
-            self.c     = self.conn.cursor()
-            self.ist   = pytz.timezone('Asia/Kolkata') 
+            self.conn         = sqlite3.connect(db_path, check_same_thread = False)
+            self.c            = self.conn.cursor()
+            self.ist          = pytz.timezone(Config.TIMEZONE_IST)
             
-            self.create_page_visited_table()
-            self.create_emotionclf_table()
+            # WAL lets exports and dashboard reads run without blocking the app's inserts
+            self.c.execute('PRAGMA journal_mode = WAL')
+
+            self.migrate_schema()
+            self.load_emotion_labels()
 
             database_manager_logger.info("Database Connection Successful")
 
@@ -48,6 +72,294 @@ class DatabaseManager:
             raise
 
     
+    def migrate_schema(self) -> None:
+        """
+        Bring the database schema up to `SCHEMA_VERSION`.
+
+        Each migration step runs inside a single transaction together with the `user_version` bump,
+        so a failed migration leaves the database exactly as it was.
+
+        """
+
+        migrations = {1 : self._migrate_to_v1,
+                      2 : self._migrate_to_v2,
+                      3 : self._migrate_to_v3,
+                      4 : self._migrate_to_v4,
+                      5 : self._migrate_to_v5,
+                      }
+
+        try:
+
+            current_version = self.c.execute('PRAGMA user_version').fetchone()[0]
+
+            for version in range(current_version + 1, self.SCHEMA_VERSION + 1):
+
+                self.c.execute('BEGIN')
+
+                try:
+                    migrations[version]()
+                    self.c.execute(f'PRAGMA user_version = {version}')
+                    self.conn.commit()
+
+                except Exception:
+                    self.conn.rollback()
+
+                    raise
+
+                database_manager_logger.info(f"Database schema migrated to version {version}")
+
+        except Exception as e:
+            database_manager_logger.error(f"Error Occurred while migrating schema: {repr(e)}")
+
+            raise
+
+
+    def _migrate_to_v1(self) -> None:
+        """
+        Move the legacy string-timestamp tables to the indexed epoch-millisecond schema.
+
+        Rows of the legacy `pageTrackTable` and `emotionclfTable` (IST formatted `timeOfvisit`,
+        no primary key) are copied over in bulk and the legacy tables are dropped afterwards.
+
+        """
+
+        legacy_pages    = self._is_legacy_table('pageTrackTable')
+        legacy_emotions = self._is_legacy_table('emotionclfTable')
+
+        if legacy_pages:
+            self.c.execute('ALTER TABLE pageTrackTable RENAME TO pageTrackTable_legacy')
+
+        if legacy_emotions:
+            self.c.execute('ALTER TABLE emotionclfTable RENAME TO emotionclfTable_legacy')
+
+        self.create_emotion_label_table()
+        self.create_page_visited_table()
+        self.create_emotionclf_table()
+
+        if legacy_pages:
+
+            rows = self.c.execute('SELECT pagename, timeOfvisit FROM pageTrackTable_legacy').fetchall()
+
+            self.c.executemany('INSERT INTO pageTrackTable(pagename, timestampMs) VALUES (?, ?)',
+                               [(pagename, self._legacy_time_to_epoch_ms(timeOfvisit)) for pagename, timeOfvisit in rows])
+            self.c.execute('DROP TABLE pageTrackTable_legacy')
+
+            database_manager_logger.info(f"Migrated {len(rows)} rows from legacy pageTrackTable")
+
+        if legacy_emotions:
+
+            rows = self.c.execute('SELECT rawtext, prediction, probability, timeOfvisit FROM emotionclfTable_legacy').fetchall()
+
+            self.c.executemany('INSERT OR IGNORE INTO emotionLabelTable(label) VALUES (?)',
+                               [(prediction,) for prediction in {row[1] for row in rows}])
+
+            label_ids = dict(self.c.execute('SELECT label, id FROM emotionLabelTable').fetchall())
+
+            self.c.executemany('INSERT INTO emotionclfTable(rawtext, prediction, probability, timestampMs) VALUES (?, ?, ?, ?)',
+                               [(rawtext, label_ids[prediction], probability, self._legacy_time_to_epoch_ms(timeOfvisit))
+                                for rawtext, prediction, probability, timeOfvisit in rows])
+            self.c.execute('DROP TABLE emotionclfTable_legacy')
+
+            database_manager_logger.info(f"Migrated {len(rows)} rows from legacy emotionclfTable")
+
+
+    def _migrate_to_v2(self) -> None:
+        """
+        Add the rollup tables and the bookkeeping table used for high-water marks.
+
+        """
+
+        self.create_rollup_tables()
+
+
+    def _migrate_to_v3(self) -> None:
+        """
+        Add per-prediction probability vectors and the model version table holding their class order.
+
+        """
+
+        self.create_model_version_table()
+
+        self.c.execute('ALTER TABLE emotionclfTable ADD COLUMN modelVersionId INTEGER REFERENCES modelVersionTable(id)')
+        self.c.execute('ALTER TABLE emotionclfTable ADD COLUMN probabilities BLOB')
+        self.c.execute('CREATE INDEX IF NOT EXISTS idx_emotionclfTable_modelVersionId_timestampMs ON emotionclfTable(modelVersionId, timestampMs)')
+
+
+    def _migrate_to_v4(self) -> None:
+        """
+        Add the append-only log of user-confirmed labels consumed by the online learner.
+
+        """
+
+        self.create_prediction_feedback_table()
+
+
+    def _migrate_to_v5(self) -> None:
+        """
+        Rebuild the raw event tables with `AUTOINCREMENT` ids.
+
+        Rollups, retention and exports track progress with `id <= highWaterId`, which needs ids that are never
+        reused, even after the newest row is deleted. Rows keep their ids, the indexes are recreated from their
+        stored definitions and the id sequence starts above every high-water mark recorded so far.
+
+        """
+
+        for table in ('pageTrackTable', 'emotionclfTable'):
+
+            table_sql = self.c.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)).fetchone()[0]
+
+            if 'AUTOINCREMENT' in table_sql.upper():
+                continue
+
+            index_sql = [row[0] for row in self.c.execute("SELECT sql FROM sqlite_master WHERE type = 'index' AND tbl_name = ? "
+                                                          "AND sql IS NOT NULL", (table,)).fetchall()]
+            new_sql   = re.sub(r'^CREATE TABLE\s+"?\w+"?\s*\(\s*id INTEGER PRIMARY KEY',
+                               f'CREATE TABLE {table}_v5(id INTEGER PRIMARY KEY AUTOINCREMENT', table_sql, count = 1, flags = re.IGNORECASE)
+
+            if new_sql == table_sql:
+                raise ValueError(f"Unexpected schema for {table}: {table_sql}")
+
+            self.c.execute(new_sql)
+            self.c.execute(f'INSERT INTO {table}_v5 SELECT * FROM {table}')
+            self.c.execute(f'DROP TABLE {table}')
+            self.c.execute(f'ALTER TABLE {table}_v5 RENAME TO {table}')
+
+            for sql in index_sql:
+                self.c.execute(sql)
+
+            high_water = max(self._get_state(f'{table}.highWaterId'),
+                             self.c.execute(f'SELECT COALESCE(MAX(id), 0) FROM {table}').fetchone()[0])
+
+            self.c.execute('DELETE FROM sqlite_sequence WHERE name = ?', (table,))
+            self.c.execute('INSERT INTO sqlite_sequence(name, seq) VALUES (?, ?)', (table, high_water))
+
+            database_manager_logger.info(f"Rebuilt {table} with AUTOINCREMENT ids starting after {high_water}")
+
+
+    def _is_legacy_table(self, table_name : str) -> bool:
+        """
+        Check whether a table exists in its pre-migration form (no `id` primary key column).
+
+        """
+
+        columns = [row[1] for row in self.c.execute(f'PRAGMA table_info({table_name})').fetchall()]
+
+        return bool(columns) and 'id' not in columns
+
+
+    def _legacy_time_to_epoch_ms(self, timeOfvisit : str) -> int:
+        """
+        Convert a legacy IST formatted `timeOfvisit` string to UTC epoch milliseconds.
+
+        """
+
+        visited_at = datetime.fromisoformat(str(timeOfvisit))
+
+        if visited_at.tzinfo is None:
+            visited_at = self.ist.localize(visited_at)
+
+        return int(visited_at.timestamp() * 1000)
+
+
+    @staticmethod
+    def _to_epoch_ms(timeOfvisit : datetime = None) -> int:
+        """
+        Convert a datetime to UTC epoch milliseconds, defaulting to the current time.
+
+        """
+
+        if timeOfvisit is None:
+            return time.time_ns() // 1_000_000
+
+        return int(timeOfvisit.timestamp() * 1000)
+
+
+    def create_emotion_label_table(self) -> None:
+        """
+        Create the lookup table mapping integer emotion codes to label names and seed it with the known labels.
+
+        """
+
+        try:
+
+            self.c.execute('CREATE TABLE IF NOT EXISTS emotionLabelTable(id INTEGER PRIMARY KEY, label TEXT NOT NULL UNIQUE)')
+            self.c.executemany('INSERT OR IGNORE INTO emotionLabelTable(label) VALUES (?)',
+                               [(label,) for label in Config.EMOTION_LABELS])
+
+            database_manager_logger.info("emotionLabelTable created successfully")
+
+        except Exception as e:
+            database_manager_logger.error(f"Error Occurred in creating emotionLabelTable: {repr(e)}")
+
+            raise
+
+
+    def load_emotion_labels(self) -> None:
+        """
+        Load the emotion label codes into memory so inserts and reads avoid a lookup query.
+
+        """
+
+        try:
+
+            self.label_ids   = dict(self.c.execute('SELECT label, id FROM emotionLabelTable').fetchall())
+            self.label_names = {label_id : label for label, label_id in self.label_ids.items()}
+
+        except Exception as e:
+            database_manager_logger.error(f"Error Occurred while loading emotion labels: {repr(e)}")
+
+            raise
+
+
+    def get_emotion_label_id(self, label : str) -> int:
+        """
+        Return the integer code of an emotion label, registering labels that were not seen before.
+
+        Arguments:
+
+            `label`                   {str}                  : Emotion label predicted by the classifier.
+
+        Returns:
+
+            int                                              : Integer code stored in `emotionclfTable.prediction`.
+
+        """
+
+        if label not in self.label_ids:
+
+            self.c.execute('INSERT OR IGNORE INTO emotionLabelTable(label) VALUES (?)', (label,))
+            self.conn.commit()
+            self.load_emotion_labels()
+
+        return self.label_ids[label]
+
+
+    def create_rollup_tables(self) -> None:
+        """
+        Create the minute/hour/day aggregate tables for page visits and predictions if they don't already exist.
+
+        """
+
+        try:
+
+            self.c.execute('CREATE TABLE IF NOT EXISTS telemetryStateTable(key TEXT PRIMARY KEY, value INTEGER NOT NULL)')
+            self.c.execute('CREATE TABLE IF NOT EXISTS pageVisitRollupTable(granularity TEXT NOT NULL, bucketMs INTEGER NOT NULL, '
+                           'pagename TEXT NOT NULL, counts INTEGER NOT NULL, '
+                           'PRIMARY KEY(granularity, bucketMs, pagename)) WITHOUT ROWID')
+            self.c.execute('CREATE TABLE IF NOT EXISTS predictionRollupTable(granularity TEXT NOT NULL, bucketMs INTEGER NOT NULL, '
+                           'prediction INTEGER NOT NULL, counts INTEGER NOT NULL, probabilitySum REAL NOT NULL, '
+                           'PRIMARY KEY(granularity, bucketMs, prediction)) WITHOUT ROWID')
+            self.c.execute('CREATE TABLE IF NOT EXISTS confidenceRollupTable(granularity TEXT NOT NULL, bucketMs INTEGER NOT NULL, '
+                           'prediction INTEGER NOT NULL, bin INTEGER NOT NULL, counts INTEGER NOT NULL, '
+                           'PRIMARY KEY(granularity, bucketMs, prediction, bin)) WITHOUT ROWID')
+
+            database_manager_logger.info("Rollup tables created successfully")
+
+        except Exception as e:
+            database_manager_logger.error(f"Error Occurred in creating rollup tables: {repr(e)}")
+
+            raise
+
     def create_page_visited_table(self):
         """
         Create a table for tracking page visits if it doesn't already exist.
@@ -56,8 +368,10 @@ class DatabaseManager:
 
         try:
         
-            self.c.execute('CREATE TABLE IF NOT EXISTS pageTrackTable(pagename TEXT, timeOfvisit TIMESTAMP)')
-            self.conn.commit()
+            self.c.execute('CREATE TABLE IF NOT EXISTS pageTrackTable(id INTEGER PRIMARY KEY, pagename TEXT NOT NULL, '
+                           'timestampMs INTEGER NOT NULL)')
+            self.c.execute('CREATE INDEX IF NOT EXISTS idx_pageTrackTable_timestampMs ON pageTrackTable(timestampMs)')
+            self.c.execute('CREATE INDEX IF NOT EXISTS idx_pageTrackTable_pagename_timestampMs ON pageTrackTable(pagename, timestampMs)')
 
             database_manager_logger.info("Create table for Visited Page")
 
@@ -80,14 +394,8 @@ class DatabaseManager:
         
         try:
 
-            if timeOfvisit is None:
-                timeOfvisit = datetime.now(self.ist).strftime("%Y-%m-%d %H:%M:%S")
-            
-            else:
-                timeOfvisit = timeOfvisit.astimezone(self.ist).strftime("%Y-%m-%d %H:%M:%S")
-                
-            self.c.execute('INSERT INTO pageTrackTable(pagename, timeOfvisit) VALUES (?, ?)', 
-                        (pagename, timeOfvisit))
+            self.c.execute('INSERT INTO pageTrackTable(pagename, timestampMs) VALUES (?, ?)',
+                        (pagename, self._to_epoch_ms(timeOfvisit)))
             
             self.conn.commit()
 
@@ -104,13 +412,13 @@ class DatabaseManager:
         
         Returns:
         
-            list               : List of tuples containing page visit details.
+            list               : List of `(pagename, timestampMs)` tuples containing page visit details.
         
         """
 
         try:
         
-            self.c.execute('SELECT * FROM pageTrackTable')
+            self.c.execute('SELECT pagename, timestampMs FROM pageTrackTable ORDER BY id')
             data = self.c.fetchall()
 
             database_manager_logger.info("Showing all the details")
@@ -130,9 +438,11 @@ class DatabaseManager:
 
         try:
         
-            self.c.execute('CREATE TABLE IF NOT EXISTS emotionclfTable(rawtext TEXT, prediction TEXT, '
-                        'probability NUMBER, timeOfvisit TIMESTAMP)')
-            self.conn.commit()
+            self.c.execute('CREATE TABLE IF NOT EXISTS emotionclfTable(id INTEGER PRIMARY KEY, rawtext TEXT, '
+                           'prediction INTEGER NOT NULL REFERENCES emotionLabelTable(id), '
+                           'probability REAL, timestampMs INTEGER NOT NULL)')
+            self.c.execute('CREATE INDEX IF NOT EXISTS idx_emotionclfTable_timestampMs ON emotionclfTable(timestampMs)')
+            self.c.execute('CREATE INDEX IF NOT EXISTS idx_emotionclfTable_prediction_timestampMs ON emotionclfTable(prediction, timestampMs)')
 
             database_manager_logger.info("emotionclf_table created successfully")
 
@@ -141,7 +451,109 @@ class DatabaseManager:
 
             raise
 
-    def add_prediction_details(self, rawtext : str, prediction : str, probability : float, timeOfvisit : datetime = None) -> None:
+    def create_prediction_feedback_table(self) -> None:
+        """
+        Create the table logging the label a user confirmed (or corrected) for a stored prediction.
+
+        Confirmations are appended rather than written onto `emotionclfTable`, so a learner tracking the last
+        consumed feedback id never misses a confirmation made for an older prediction.
+
+        """
+
+        try:
+
+            self.c.execute('CREATE TABLE IF NOT EXISTS predictionFeedbackTable(id INTEGER PRIMARY KEY AUTOINCREMENT, '
+                           'predictionId INTEGER NOT NULL REFERENCES emotionclfTable(id), '
+                           'label INTEGER NOT NULL REFERENCES emotionLabelTable(id), timestampMs INTEGER NOT NULL)')
+
+            database_manager_logger.info("predictionFeedbackTable created successfully")
+
+        except Exception as e:
+            database_manager_logger.error(f"Error Occurred in creating predictionFeedbackTable: {repr(e)}")
+
+            raise
+
+    def create_model_version_table(self) -> None:
+        """
+        Create the table recording the class order of every model version that wrote probability vectors.
+
+        """
+
+        try:
+
+            self.c.execute('CREATE TABLE IF NOT EXISTS modelVersionTable(id INTEGER PRIMARY KEY AUTOINCREMENT, '
+                           'modelName TEXT NOT NULL, classes TEXT NOT NULL, UNIQUE(modelName, classes))')
+
+            database_manager_logger.info("modelVersionTable created successfully")
+
+        except Exception as e:
+            database_manager_logger.error(f"Error Occurred in creating modelVersionTable: {repr(e)}")
+
+            raise
+
+    def register_model_version(self, model_name : str, classes : list) -> int:
+        """
+        Record the class order of a model once and return its version id.
+
+        Registering the same model name and class order again returns the existing id.
+
+        Arguments:
+
+            `model_name`                  {str}             : Identifier of the deployed model, e.g. its pipeline path.
+
+            `classes`                    {list}             : Class labels in the column order of `predict_proba`.
+
+        Returns:
+
+            int                                             : Id to pass as `model_version_id` to `add_prediction_details`.
+
+        """
+
+        try:
+
+            classes = json.dumps([str(label) for label in classes])
+
+            self.c.execute('INSERT OR IGNORE INTO modelVersionTable(modelName, classes) VALUES (?, ?)', (model_name, classes))
+            self.conn.commit()
+
+            return self.c.execute('SELECT id FROM modelVersionTable WHERE modelName = ? AND classes = ?',
+                                  (model_name, classes)).fetchone()[0]
+
+        except Exception as e:
+            database_manager_logger.error(f"Error Registering Model Version: {repr(e)}")
+
+            raise
+
+    def get_model_classes(self, model_version_id : int) -> list:
+        """
+        Return the class order recorded for a model version.
+
+        Arguments:
+
+            `model_version_id`            {int}             : Id returned by `register_model_version`.
+
+        Returns:
+
+            list                                            : Class labels in probability column order.
+
+        """
+
+        try:
+
+            row = self.c.execute('SELECT classes FROM modelVersionTable WHERE id = ?', (model_version_id,)).fetchone()
+
+            if row is None:
+                raise ValueError(f"Unknown model version id: {model_version_id}")
+
+            return json.loads(row[0])
+
+        except Exception as e:
+            database_manager_logger.error(f"Error Reading Model Classes: {repr(e)}")
+
+            raise
+
+    def add_prediction_details(self, rawtext : str, prediction : str, probability : float, timeOfvisit : datetime = None,
+                               probabilities : np.ndarray = None, model_version_id : int = None) -> int:
         """
         Add emotion classification prediction details to the database.
         
@@ -155,51 +567,759 @@ class DatabaseManager:
             
             timeOfvisit        {datetime, optional}      : Time when the prediction was made.
                                             
+            probabilities     {np.ndarray, optional}     : Full per-class probability vector, stored as a float16 blob.
+
+            model_version_id      {int, optional}        : Model version whose class order the vector follows.
+
+        Returns:
+
+            int                                          : Id of the stored prediction, used to confirm its label later.
+
         """
 
         try:
 
-            if timeOfvisit is None:
-                timeOfvisit = datetime.now(self.ist).strftime("%Y-%m-%d %H:%M:%S")
+            if probabilities is not None and model_version_id is None:
+                raise ValueError("A model_version_id is required to store a probability vector.")
             
-            else:
-                timeOfvisit = timeOfvisit.astimezone(self.ist).strftime("%Y-%m-%d %H:%M:%S")
+            blob = None if probabilities is None else np.ravel(probabilities).astype(self.PROBABILITY_DTYPE).tobytes()
                 
-            self.c.execute('INSERT INTO emotionclfTable(rawtext, prediction, probability, timeOfvisit) '
-                        'VALUES (?, ?, ?, ?)', (rawtext, prediction, probability, timeOfvisit))
+            self.c.execute('INSERT INTO emotionclfTable(rawtext, prediction, probability, timestampMs, modelVersionId, probabilities) '
+                        'VALUES (?, ?, ?, ?, ?, ?)', (rawtext, self.get_emotion_label_id(prediction), float(probability),
+                                                      self._to_epoch_ms(timeOfvisit), model_version_id, blob))
             self.conn.commit()
 
             database_manager_logger.info("Prediction Details added")
 
+            return self.c.lastrowid
+
         except Exception as e:
             database_manager_logger.error(f"Error Adding Prediction Details: {repr(e)}")
 
             raise
 
-    def view_all_prediction_details(self) -> list:
+    def confirm_prediction(self, prediction_id : int, label : str, timeOfvisit : datetime = None) -> None:
         """
-        Retrieve all emotion classification prediction records from the database.
-        
-        Returns:
-            
-            list                : List of tuples containing prediction details.
+        Record the label a user confirmed for a stored prediction.
+
+        Arguments:
+
+            `prediction_id`               {int}             : Id returned by `add_prediction_details`.
+
+            `label`                       {str}             : The correct emotion label.
+
+            `timeOfvisit`          {datetime, optional}     : Time of the confirmation.
+
         """
 
         try:
-        
-            self.c.execute('SELECT * FROM emotionclfTable')
-            data = self.c.fetchall()
-            
-            database_manager_logger.info("Showing all Prediction Details")
 
-            return data
-        
+            self.c.execute('INSERT INTO predictionFeedbackTable(predictionId, label, timestampMs) VALUES (?, ?, ?)',
+                           (int(prediction_id), self.get_emotion_label_id(label), self._to_epoch_ms(timeOfvisit)))
+            self.conn.commit()
+
+            database_manager_logger.info(f"Prediction {prediction_id} confirmed as {label}")
+
         except Exception as e:
-            database_manager_logger.error(f"Error Showing Prediction Details: {repr(e)}")
+            database_manager_logger.error(f"Error Confirming Prediction: {repr(e)}")
 
             raise
-    
-    def close_connection(self) -> None:
+
+    def iter_feedback_chunks(self, after_id : int = 0, chunk_size : int = 256):
+        """
+        Stream confirmed labels with feedback id `> after_id` in ascending order, one chunk at a time.
+
+        Retention pruning keeps every prediction with feedback, so no confirmed label is skipped.
+
+        Arguments:
+
+            `after_id`               {int, optional}        : Only feedback with a larger id is returned.
+
+            `chunk_size`             {int, optional}        : Maximum number of rows per chunk.
+
+        Yields:
+
+            list                                            : List of `(feedbackId, rawtext, label)` tuples.
+
+        """
+
+        try:
+
+            while True:
+
+                rows = self.conn.execute('SELECT f.id, e.rawtext, l.label FROM predictionFeedbackTable f '
+                                         'JOIN emotionclfTable e ON e.id = f.predictionId JOIN emotionLabelTable l ON l.id = f.label '
+                                         'WHERE f.id > ? ORDER BY f.id LIMIT ?', (int(after_id), int(chunk_size))).fetchall()
+
+                if not rows:
+                    return
+
+                yield rows
+
+                after_id = rows[-1][0]
+
+        except Exception as e:
+            database_manager_logger.error(f"Error Streaming Prediction Feedback: {repr(e)}")
+
+            raise
+
+    def fetch_probability_matrix(self, model_version_id : int, start_ms : int = None, end_ms : int = None) -> tuple:
+        """
+        Load the stored probability vectors of one model version as a 2-D array.
+
+        The blobs are concatenated and decoded with a single `np.frombuffer` call, so there is no
+        per-row Python parsing regardless of how many predictions are read.
+
+        Arguments:
+
+            `model_version_id`            {int}             : Id returned by `register_model_version`.
+
+            `start_ms`               {int, optional}        : Inclusive lower bound in UTC epoch milliseconds.
+
+            `end_ms`                 {int, optional}        : Exclusive upper bound in UTC epoch milliseconds.
+
+        Returns:
+
+            tuple                                           : `(ids, probabilities, classes)` where `ids` is an int64 array of
+                                                              row ids, `probabilities` a float16 array of shape
+                                                              `(len(ids), len(classes))` and `classes` the column labels.
+
+        """
+
+        try:
+
+            classes = self.get_model_classes(model_version_id)
+
+            self.c.execute('SELECT id, probabilities FROM emotionclfTable '
+                           'WHERE modelVersionId = ? AND timestampMs >= ? AND timestampMs < ? AND probabilities IS NOT NULL '
+                           'ORDER BY id', (model_version_id, *self._time_window(start_ms, end_ms)))
+            rows    = self.c.fetchall()
+
+            ids     = np.fromiter((row[0] for row in rows), dtype = np.int64, count = len(rows))
+            matrix  = np.frombuffer(b"".join(row[1] for row in rows), dtype = self.PROBABILITY_DTYPE).reshape(len(rows), len(classes))
+
+            return ids, matrix, classes
+
+        except Exception as e:
+            database_manager_logger.error(f"Error Fetching Probability Matrix: {repr(e)}")
+
+            raise
+
+    def view_all_prediction_details(self) -> list:
+        """
+        Retrieve all emotion classification prediction records from the database.
+        
+        Returns:
+            
+            list                : List of `(rawtext, prediction, probability, timestampMs)` tuples containing prediction details.
+        """
+
+        try:
+        
+            self.c.execute('SELECT e.rawtext, l.label, e.probability, e.timestampMs FROM emotionclfTable e '
+                           'JOIN emotionLabelTable l ON l.id = e.prediction ORDER BY e.id')
+            data = self.c.fetchall()
+            
+            database_manager_logger.info("Showing all Prediction Details")
+
+            return data
+        
+        except Exception as e:
+            database_manager_logger.error(f"Error Showing Prediction Details: {repr(e)}")
+
+            raise
+
+    def iter_prediction_chunks(self, after_id : int = 0, chunk_size : int = 50000):
+        """
+        Stream prediction records with `id > after_id` in ascending id order, one chunk at a time.
+
+        Every chunk is a separate short keyset query on its own cursor, so a long export never holds a
+        read transaction open against the live database.
+
+        Arguments:
+
+            `after_id`               {int, optional}        : Only rows with a larger id are returned.
+
+            `chunk_size`             {int, optional}        : Maximum number of rows per chunk.
+
+        Yields:
+
+            list                                            : List of `(id, rawtext, prediction, probability, timestampMs,
+                                                              modelVersionId, probabilities)` tuples.
+
+        """
+
+        try:
+
+            while True:
+
+                rows = self.conn.execute('SELECT e.id, e.rawtext, l.label, e.probability, e.timestampMs, e.modelVersionId, e.probabilities '
+                                         'FROM emotionclfTable e JOIN emotionLabelTable l ON l.id = e.prediction '
+                                         'WHERE e.id > ? ORDER BY e.id LIMIT ?', (int(after_id), int(chunk_size))).fetchall()
+
+                if not rows:
+                    return
+
+                yield rows
+
+                after_id = rows[-1][0]
+
+        except Exception as e:
+            database_manager_logger.error(f"Error Streaming Prediction Details: {repr(e)}")
+
+            raise
+
+    def page_prediction_details(self, limit : int = 50, cursor : tuple = None, prediction : str = None, start_ms : int = None,
+                                end_ms : int = None, max_text_length : int = 200) -> list:
+        """
+        Retrieve one page of prediction records, newest first, using keyset pagination.
+
+        The page boundary is the `(timestampMs, id)` pair of the last row of the previous page, which lets
+        SQLite seek straight into the `(timestampMs)` or `(prediction, timestampMs)` index instead of
+        skipping rows with `OFFSET`, so every page costs the same regardless of table size.
+
+        Arguments:
+
+            `limit`                  {int, optional}        : Maximum number of rows in the page.
+
+            `cursor`                {tuple, optional}       : `(timestampMs, id)` of the last row of the previous page.
+
+            `prediction`             {str, optional}        : Only return rows predicted as this emotion.
+
+            `start_ms`               {int, optional}        : Inclusive lower bound in UTC epoch milliseconds.
+
+            `end_ms`                 {int, optional}        : Exclusive upper bound in UTC epoch milliseconds.
+
+            `max_text_length`        {int, optional}        : Raw text is truncated to this many characters.
+
+        Returns:
+
+            list                                            : List of `(id, rawtext, prediction, probability, timestampMs)` tuples.
+
+        """
+
+        try:
+
+            conditions = ['e.timestampMs >= ?', 'e.timestampMs < ?']
+            params     = list(self._time_window(start_ms, end_ms))
+
+            if prediction is not None:
+
+                if prediction not in self.label_ids:
+                    return []
+
+                conditions.append('e.prediction = ?')
+                params.append(self.label_ids[prediction])
+
+            if cursor is not None:
+                conditions.append('(e.timestampMs, e.id) < (?, ?)')
+                params.extend(int(value) for value in cursor)
+
+            self.c.execute('SELECT e.id, substr(e.rawtext, 1, ?), l.label, e.probability, e.timestampMs FROM emotionclfTable e '
+                           f'JOIN emotionLabelTable l ON l.id = e.prediction WHERE {" AND ".join(conditions)} '
+                           'ORDER BY e.timestampMs DESC, e.id DESC LIMIT ?',
+                           (int(max_text_length), *params, int(limit)))
+
+            return self.c.fetchall()
+
+        except Exception as e:
+            database_manager_logger.error(f"Error Paging Prediction Details: {repr(e)}")
+
+            raise
+
+    @staticmethod
+    def _time_window(start_ms : int = None, end_ms : int = None) -> tuple:
+        """
+        Resolve an optional `[start_ms, end_ms)` window into concrete bounds usable as query parameters.
+
+        """
+
+        return (0 if start_ms is None else int(start_ms),
+                sys.maxsize if end_ms is None else int(end_ms))
+
+    def _check_granularity(self, granularity : str) -> None:
+        """
+        Validate a rollup granularity name.
+
+        """
+
+        if granularity not in self.ROLLUP_GRANULARITIES:
+            raise ValueError(f"Unknown rollup granularity '{granularity}', expected one of {list(self.ROLLUP_GRANULARITIES)}.")
+
+    def count_page_visits(self, start_ms : int = None, end_ms : int = None, granularity : str = None) -> list:
+        """
+        Count page visits per page inside a time window.
+
+        Arguments:
+
+            `start_ms`               {int, optional}        : Inclusive lower bound in UTC epoch milliseconds.
+
+            `end_ms`                 {int, optional}        : Exclusive upper bound in UTC epoch milliseconds.
+
+            `granularity`            {str, optional}        : Read from this rollup level instead of the raw events.
+
+        Returns:
+
+            list                                            : List of `(pagename, count)` tuples, most visited first.
+
+        """
+
+        try:
+
+            if granularity is None:
+                self.c.execute('SELECT pagename, COUNT(*) AS counts FROM pageTrackTable '
+                               'WHERE timestampMs >= ? AND timestampMs < ? '
+                               'GROUP BY pagename ORDER BY counts DESC', self._time_window(start_ms, end_ms))
+
+            else:
+                self._check_granularity(granularity)
+                self.c.execute('SELECT pagename, SUM(counts) AS total FROM pageVisitRollupTable '
+                               'WHERE granularity = ? AND bucketMs >= ? AND bucketMs < ? '
+                               'GROUP BY pagename ORDER BY total DESC', (granularity, *self._time_window(start_ms, end_ms)))
+
+            return self.c.fetchall()
+
+        except Exception as e:
+            database_manager_logger.error(f"Error Counting Page Visits: {repr(e)}")
+
+            raise
+
+    def count_predictions(self, start_ms : int = None, end_ms : int = None, granularity : str = None) -> list:
+        """
+        Count predictions per emotion inside a time window.
+
+        Arguments:
+
+            `start_ms`               {int, optional}        : Inclusive lower bound in UTC epoch milliseconds.
+
+            `end_ms`                 {int, optional}        : Exclusive upper bound in UTC epoch milliseconds.
+
+            `granularity`            {str, optional}        : Read from this rollup level instead of the raw events.
+
+        Returns:
+
+            list                                            : List of `(prediction, count)` tuples, most frequent first.
+
+        """
+
+        try:
+
+            if granularity is None:
+                source = ('SELECT prediction, COUNT(*) AS counts FROM emotionclfTable '
+                          'WHERE timestampMs >= ? AND timestampMs < ? GROUP BY prediction')
+                params = self._time_window(start_ms, end_ms)
+
+            else:
+                self._check_granularity(granularity)
+                source = ('SELECT prediction, SUM(counts) AS counts FROM predictionRollupTable '
+                          'WHERE granularity = ? AND bucketMs >= ? AND bucketMs < ? GROUP BY prediction')
+                params = (granularity, *self._time_window(start_ms, end_ms))
+
+            self.c.execute(f'SELECT l.label, p.counts FROM ({source}) p '
+                           'JOIN emotionLabelTable l ON l.id = p.prediction ORDER BY p.counts DESC', params)
+
+            return self.c.fetchall()
+
+        except Exception as e:
+            database_manager_logger.error(f"Error Counting Predictions: {repr(e)}")
+
+            raise
+
+    def page_visit_histogram(self, bucket_ms : int, start_ms : int = None, end_ms : int = None, granularity : str = None) -> list:
+        """
+        Count page visits per page in fixed-width time buckets.
+
+        Arguments:
+
+            `bucket_ms`                   {int}             : Bucket width in milliseconds, a multiple of the rollup width when reading rollups.
+
+            `start_ms`               {int, optional}        : Inclusive lower bound in UTC epoch milliseconds.
+
+            `end_ms`                 {int, optional}        : Exclusive upper bound in UTC epoch milliseconds.
+
+            `granularity`            {str, optional}        : Read from this rollup level instead of the raw events.
+
+        Returns:
+
+            list                                            : List of `(bucket_start_ms, pagename, count)` tuples ordered by bucket.
+
+        """
+
+        try:
+
+            if granularity is None:
+                self.c.execute('SELECT (timestampMs / ?) * ? AS bucket, pagename, COUNT(*) FROM pageTrackTable '
+                               'WHERE timestampMs >= ? AND timestampMs < ? '
+                               'GROUP BY bucket, pagename ORDER BY bucket',
+                               (int(bucket_ms), int(bucket_ms), *self._time_window(start_ms, end_ms)))
+
+            else:
+                self._check_granularity(granularity)
+                self.c.execute('SELECT (bucketMs / ?) * ? AS bucket, pagename, SUM(counts) FROM pageVisitRollupTable '
+                               'WHERE granularity = ? AND bucketMs >= ? AND bucketMs < ? '
+                               'GROUP BY bucket, pagename ORDER BY bucket',
+                               (int(bucket_ms), int(bucket_ms), granularity, *self._time_window(start_ms, end_ms)))
+
+            return self.c.fetchall()
+
+        except Exception as e:
+            database_manager_logger.error(f"Error Building Page Visit Histogram: {repr(e)}")
+
+            raise
+
+    def prediction_histogram(self, bucket_ms : int, start_ms : int = None, end_ms : int = None, granularity : str = None) -> list:
+        """
+        Count predictions per emotion in fixed-width time buckets.
+
+        Arguments:
+
+            `bucket_ms`                   {int}             : Bucket width in milliseconds, a multiple of the rollup width when reading rollups.
+
+            `start_ms`               {int, optional}        : Inclusive lower bound in UTC epoch milliseconds.
+
+            `end_ms`                 {int, optional}        : Exclusive upper bound in UTC epoch milliseconds.
+
+            `granularity`            {str, optional}        : Read from this rollup level instead of the raw events.
+
+        Returns:
+
+            list                                            : List of `(bucket_start_ms, prediction, count)` tuples ordered by bucket.
+
+        """
+
+        try:
+
+            if granularity is None:
+                source = ('SELECT (timestampMs / ?) * ? AS bucket, prediction, COUNT(*) AS counts FROM emotionclfTable '
+                          'WHERE timestampMs >= ? AND timestampMs < ? GROUP BY bucket, prediction')
+                params = (int(bucket_ms), int(bucket_ms), *self._time_window(start_ms, end_ms))
+
+            else:
+                self._check_granularity(granularity)
+                source = ('SELECT (bucketMs / ?) * ? AS bucket, prediction, SUM(counts) AS counts FROM predictionRollupTable '
+                          'WHERE granularity = ? AND bucketMs >= ? AND bucketMs < ? GROUP BY bucket, prediction')
+                params = (int(bucket_ms), int(bucket_ms), granularity, *self._time_window(start_ms, end_ms))
+
+            self.c.execute(f'SELECT h.bucket, l.label, h.counts FROM ({source}) h '
+                           'JOIN emotionLabelTable l ON l.id = h.prediction ORDER BY h.bucket, l.label', params)
+
+            return self.c.fetchall()
+
+        except Exception as e:
+            database_manager_logger.error(f"Error Building Prediction Histogram: {repr(e)}")
+
+            raise
+
+    def confidence_means(self, start_ms : int = None, end_ms : int = None, granularity : str = None) -> list:
+        """
+        Compute the mean prediction confidence per emotion inside a time window.
+
+        Arguments:
+
+            `start_ms`               {int, optional}        : Inclusive lower bound in UTC epoch milliseconds.
+
+            `end_ms`                 {int, optional}        : Exclusive upper bound in UTC epoch milliseconds.
+
+            `granularity`            {str, optional}        : Read from this rollup level instead of the raw events.
+
+        Returns:
+
+            list                                            : List of `(prediction, mean_probability)` tuples.
+
+        """
+
+        try:
+
+            if granularity is None:
+                source = ('SELECT prediction, AVG(probability) AS mean FROM emotionclfTable '
+                          'WHERE timestampMs >= ? AND timestampMs < ? GROUP BY prediction')
+                params = self._time_window(start_ms, end_ms)
+
+            else:
+                self._check_granularity(granularity)
+                source = ('SELECT prediction, SUM(probabilitySum) / SUM(counts) AS mean FROM predictionRollupTable '
+                          'WHERE granularity = ? AND bucketMs >= ? AND bucketMs < ? GROUP BY prediction')
+                params = (granularity, *self._time_window(start_ms, end_ms))
+
+            self.c.execute(f'SELECT l.label, m.mean FROM ({source}) m '
+                           'JOIN emotionLabelTable l ON l.id = m.prediction ORDER BY l.label', params)
+
+            return self.c.fetchall()
+
+        except Exception as e:
+            database_manager_logger.error(f"Error Computing Confidence Means: {repr(e)}")
+
+            raise
+
+    def confidence_quantiles(self, quantiles : tuple = (0.5, 0.9, 0.99), start_ms : int = None, end_ms : int = None,
+                             granularity : str = None) -> list:
+        """
+        Compute nearest-rank quantiles of the prediction confidence per emotion inside a time window.
+
+        On raw events the ranking is done with SQLite window functions so only one row per emotion and
+        quantile leaves the database. On rollups the quantile is estimated from the merged confidence
+        histogram and reported as the upper edge of the bin that contains it.
+
+        Arguments:
+
+            `quantiles`             {tuple, optional}       : Quantiles to compute, each in `[0, 1]`.
+
+            `start_ms`               {int, optional}        : Inclusive lower bound in UTC epoch milliseconds.
+
+            `end_ms`                 {int, optional}        : Exclusive upper bound in UTC epoch milliseconds.
+
+            `granularity`            {str, optional}        : Read from this rollup level instead of the raw events.
+
+        Returns:
+
+            list                                            : List of `(prediction, quantile, probability)` tuples.
+
+        """
+
+        try:
+
+            if not quantiles or any(not 0 <= quantile <= 1 for quantile in quantiles):
+                raise ValueError("Quantiles must be a non-empty sequence of values in [0, 1].")
+
+            values = ", ".join("(?)" for _ in quantiles)
+
+            if granularity is None:
+                self.c.execute(f'WITH q(quantile) AS (VALUES {values}), '
+                               'ranked AS (SELECT prediction, probability, '
+                               'ROW_NUMBER() OVER (PARTITION BY prediction ORDER BY probability) - 1 AS rn, '
+                               'COUNT(*) OVER (PARTITION BY prediction) AS n '
+                               'FROM emotionclfTable WHERE timestampMs >= ? AND timestampMs < ?) '
+                               'SELECT l.label, q.quantile, r.probability FROM ranked r '
+                               'JOIN q ON r.rn = CAST(q.quantile * (r.n - 1) AS INTEGER) '
+                               'JOIN emotionLabelTable l ON l.id = r.prediction ORDER BY l.label, q.quantile',
+                               (*[float(quantile) for quantile in quantiles], *self._time_window(start_ms, end_ms)))
+
+            else:
+                self._check_granularity(granularity)
+                self.c.execute(f'WITH q(quantile) AS (VALUES {values}), '
+                               'bins AS (SELECT prediction, bin, SUM(counts) AS counts FROM confidenceRollupTable '
+                               'WHERE granularity = ? AND bucketMs >= ? AND bucketMs < ? GROUP BY prediction, bin), '
+                               'running AS (SELECT prediction, bin, '
+                               'SUM(counts) OVER (PARTITION BY prediction ORDER BY bin) AS cumulative, '
+                               'SUM(counts) OVER (PARTITION BY prediction) AS n FROM bins) '
+                               'SELECT l.label, q.quantile, (MIN(r.bin) + 1) * 1.0 / ? FROM running r '
+                               'JOIN q ON r.cumulative > CAST(q.quantile * (r.n - 1) AS INTEGER) '
+                               'JOIN emotionLabelTable l ON l.id = r.prediction '
+                               'GROUP BY l.label, q.quantile ORDER BY l.label, q.quantile',
+                               (*[float(quantile) for quantile in quantiles], granularity,
+                                *self._time_window(start_ms, end_ms), self.CONFIDENCE_BINS))
+
+            return self.c.fetchall()
+
+        except Exception as e:
+            database_manager_logger.error(f"Error Computing Confidence Quantiles: {repr(e)}")
+
+            raise
+
+    def _get_state(self, key : str, default : int = 0) -> int:
+        """
+        Read an integer bookkeeping value (high-water marks, maintenance timestamps) from `telemetryStateTable`.
+
+        """
+
+        row = self.c.execute('SELECT value FROM telemetryStateTable WHERE key = ?', (key,)).fetchone()
+
+        return default if row is None else row[0]
+
+    def _set_state(self, key : str, value : int) -> None:
+        """
+        Write an integer bookkeeping value to `telemetryStateTable`.
+
+        """
+
+        self.c.execute('INSERT INTO telemetryStateTable(key, value) VALUES (?, ?) '
+                       'ON CONFLICT(key) DO UPDATE SET value = excluded.value', (key, int(value)))
+
+    def refresh_rollups(self) -> None:
+        """
+        Fold raw events added since the last run into the minute, hour and day rollup tables.
+
+        Progress is tracked with a per-table high-water mark on `id`, so every run only aggregates the new
+        rows and merges them into the existing buckets with an upsert. The aggregation and the high-water
+        mark update commit together.
+
+        """
+
+        try:
+
+            self.c.execute('BEGIN')
+
+            try:
+
+                page_mark    = self._get_state('pageTrackTable.highWaterId')
+                emotion_mark = self._get_state('emotionclfTable.highWaterId')
+                page_max     = self.c.execute('SELECT MAX(?, COALESCE(MAX(id), 0)) FROM pageTrackTable', (page_mark,)).fetchone()[0]
+                emotion_max  = self.c.execute('SELECT MAX(?, COALESCE(MAX(id), 0)) FROM emotionclfTable', (emotion_mark,)).fetchone()[0]
+
+                for granularity, width in self.ROLLUP_GRANULARITIES.items():
+
+                    self.c.execute('INSERT INTO pageVisitRollupTable(granularity, bucketMs, pagename, counts) '
+                                   'SELECT ?, (timestampMs / ?) * ?, pagename, COUNT(*) FROM pageTrackTable '
+                                   'WHERE id > ? AND id <= ? GROUP BY 2, 3 '
+                                   'ON CONFLICT(granularity, bucketMs, pagename) DO UPDATE SET counts = counts + excluded.counts',
+                                   (granularity, width, width, page_mark, page_max))
+
+                    self.c.execute('INSERT INTO predictionRollupTable(granularity, bucketMs, prediction, counts, probabilitySum) '
+                                   'SELECT ?, (timestampMs / ?) * ?, prediction, COUNT(*), TOTAL(probability) FROM emotionclfTable '
+                                   'WHERE id > ? AND id <= ? GROUP BY 2, 3 '
+                                   'ON CONFLICT(granularity, bucketMs, prediction) DO UPDATE SET '
+                                   'counts = counts + excluded.counts, probabilitySum = probabilitySum + excluded.probabilitySum',
+                                   (granularity, width, width, emotion_mark, emotion_max))
+
+                    self.c.execute('INSERT INTO confidenceRollupTable(granularity, bucketMs, prediction, bin, counts) '
+                                   'SELECT ?, (timestampMs / ?) * ?, prediction, MIN(MAX(CAST(probability * ? AS INTEGER), 0), ? - 1), COUNT(*) '
+                                   'FROM emotionclfTable WHERE id > ? AND id <= ? AND probability IS NOT NULL GROUP BY 2, 3, 4 '
+                                   'ON CONFLICT(granularity, bucketMs, prediction, bin) DO UPDATE SET counts = counts + excluded.counts',
+                                   (granularity, width, width, self.CONFIDENCE_BINS, self.CONFIDENCE_BINS, emotion_mark, emotion_max))
+
+                self._set_state('pageTrackTable.highWaterId', page_max)
+                self._set_state('emotionclfTable.highWaterId', emotion_max)
+                self.conn.commit()
+
+            except Exception:
+                self.conn.rollback()
+
+                raise
+
+            database_manager_logger.info(f"Rollups refreshed with {page_max - page_mark} page visits and {emotion_max - emotion_mark} predictions")
+
+        except Exception as e:
+            database_manager_logger.error(f"Error Refreshing Rollups: {repr(e)}")
+
+            raise
+
+    def prune_expired_events(self, now_ms : int = None, export_high_water_id : int = None) -> None:
+        """
+        Delete raw events and fine-grained rollups that fall outside their retention windows.
+
+        Only raw events already folded into the rollups (at or below the high-water mark) are deleted, so
+        pruning never loses data that the rollups have not seen. When the predictions are also exported,
+        only rows at or below the export high-water mark are deleted as well. Predictions a user confirmed a
+        label for are kept, so the online learner never loses feedback. Day rollups are kept indefinitely.
+
+        Arguments:
+
+            `now_ms`                 {int, optional}        : Reference time in UTC epoch milliseconds, defaults to now.
+
+            `export_high_water_id`   {int, optional}        : Id of the last exported prediction, no export bound when None.
+
+        """
+
+        try:
+
+            now_ms         = self._to_epoch_ms() if now_ms is None else int(now_ms)
+            day_ms         = self.ROLLUP_GRANULARITIES["day"]
+            raw_cutoff     = now_ms - Config.RAW_EVENT_RETENTION_DAYS * day_ms
+            emotion_mark   = self._get_state('emotionclfTable.highWaterId')
+
+            if export_high_water_id is not None:
+                emotion_mark = min(emotion_mark, int(export_high_water_id))
+
+            with self.conn:
+
+                self.c.execute('DELETE FROM pageTrackTable WHERE timestampMs < ? AND id <= ?',
+                               (raw_cutoff, self._get_state('pageTrackTable.highWaterId')))
+                pages_deleted    = self.c.rowcount
+
+                self.c.execute('DELETE FROM emotionclfTable WHERE timestampMs < ? AND id <= ? '
+                               'AND id NOT IN (SELECT predictionId FROM predictionFeedbackTable)',
+                               (raw_cutoff, emotion_mark))
+                emotions_deleted = self.c.rowcount
+
+                for granularity, retention_days in (("minute", Config.MINUTE_ROLLUP_RETENTION_DAYS),
+                                                    ("hour", Config.HOUR_ROLLUP_RETENTION_DAYS)):
+
+                    for table in ('pageVisitRollupTable', 'predictionRollupTable', 'confidenceRollupTable'):
+                        self.c.execute(f'DELETE FROM {table} WHERE granularity = ? AND bucketMs < ?',
+                                       (granularity, now_ms - retention_days * day_ms))
+
+            database_manager_logger.info(f"Pruned {pages_deleted} page visits and {emotions_deleted} predictions past retention")
+
+        except Exception as e:
+            database_manager_logger.error(f"Error Pruning Expired Events: {repr(e)}")
+
+            raise
+
+    def vacuum(self) -> None:
+        """
+        Return free pages to the filesystem.
+
+        The first call switches the database to `auto_vacuum = INCREMENTAL`, which needs one full `VACUUM`;
+        later calls only run `PRAGMA incremental_vacuum`.
+
+        """
+
+        try:
+
+            if self.c.execute('PRAGMA auto_vacuum').fetchone()[0] != 2:
+                self.c.execute('PRAGMA auto_vacuum = INCREMENTAL')
+                self.c.execute('VACUUM')
+
+                database_manager_logger.info("Database switched to incremental auto vacuum")
+
+            else:
+                self.c.execute('PRAGMA incremental_vacuum').fetchall()
+
+            database_manager_logger.info("Database vacuumed")
+
+        except Exception as e:
+            database_manager_logger.error(f"Error Vacuuming Database: {repr(e)}")
+
+            raise
+
+    def run_maintenance(self, force : bool = False, vacuum : bool = False, exporter = None) -> None:
+        """
+        Run the telemetry maintenance job.
+
+        Rollups are refreshed on every call since that only touches new rows. Retention pruning runs at most
+        once per `Config.MAINTENANCE_INTERVAL_HOURS` unless `force` is set; with an `exporter`, the predictions are
+        exported first and no unexported prediction is pruned. Vacuuming can rewrite the whole
+        database, so it only runs when asked for, from the command line rather than from a page load:
+        `python -m web.utils.database_manager --vacuum`.
+
+        Arguments:
+
+            `force`                 {bool, optional}        : Prune even if the interval has not elapsed.
+
+            `vacuum`                {bool, optional}        : Vacuum the database after pruning.
+
+            `exporter`         {PredictionExporter, optional}  : Parquet exporter of the prediction history.
+
+        """
+
+        try:
+
+            self.refresh_rollups()
+
+            now_ms = self._to_epoch_ms()
+
+            if force or now_ms - self._get_state('lastMaintenanceMs') >= Config.MAINTENANCE_INTERVAL_HOURS * self.ROLLUP_GRANULARITIES["hour"]:
+
+                export_mark = None
+
+                if exporter is not None:
+                    exporter.export(database_manager = self)
+                    export_mark = exporter.high_water_mark
+
+                self.prune_expired_events(now_ms = now_ms, export_high_water_id = export_mark)
+
+                with self.conn:
+                    self._set_state('lastMaintenanceMs', now_ms)
+
+            if vacuum:
+                self.vacuum()
+
+        except Exception as e:
+            database_manager_logger.error(f"Error Running Maintenance: {repr(e)}")
+
+            raise
+    
+    def close_connection(self) -> None:
         """
         Close the database connection.
         
@@ -228,4 +1348,25 @@ class DatabaseManager:
 # db_manager.add_prediction_details("I'm feeling great today!", "happy", 0.92)
 # page_visits = db_manager.view_all_page_visited_details()
 # predictions = db_manager.view_all_prediction_details()
-# db_manager.close_connection()
\ No newline at end of file
+# db_manager.close_connection()
+
+
+if __name__ == "__main__":
+
+    # python -m web.utils.database_manager --force --vacuum
+    parser           = argparse.ArgumentParser(description = "Run the telemetry maintenance job outside the app")
+
+    parser.add_argument("--force", action = "store_true", help = "Prune even if the maintenance interval has not elapsed")
+    parser.add_argument("--vacuum", action = "store_true", help = "Vacuum the database after pruning")
+
+    args             = parser.parse_args()
+    database_manager = DatabaseManager(db_path = Config.DATABASE_PATH)
+    exporter         = None
+
+    if Config.PREDICTION_HISTORY_PATH:
+        from web.utils.prediction_exporter import PredictionExporter
+
+        exporter     = PredictionExporter(output_dir = Config.PREDICTION_HISTORY_PATH)
+
+    database_manager.run_maintenance(force = args.force, vacuum = args.vacuum, exporter = exporter)
+    database_manager.close_connection()
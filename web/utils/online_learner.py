@@ -0,0 +1,237 @@
+# DEPENDENCIES
+
+import os
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.pipeline import Pipeline
+from sklearn.naive_bayes import MultinomialNB
+from sklearn.linear_model import SGDClassifier
+from sklearn.feature_extraction.text import HashingVectorizer
+
+from config.config import Config
+from src.utils.logger import LoggerSetup
+from src.data_cleaner.cleaning_engine import TextCleaningTransformer
+from web.utils.database_manager import DatabaseManager
+
+online_learner_logger = LoggerSetup(logger_name = "online_learner.py", log_filename_prefix = "online_learner").get_logger()
+
+
+class OnlineLearner:
+    """
+    Keeps an incrementally trained emotion classifier current with the labels users confirm in the app.
+
+    Texts are cleaned like the training data, so raw feedback transcripts get the same features as the bootstrap
+    data, and featurized with a stateless HashingVectorizer, so new vocabulary never requires refitting. The
+    classifier (`SGDClassifier` or `MultinomialNB`) is updated with `partial_fit` on mini-batches read from
+    `predictionFeedbackTable`. Every update costs O(batch) instead of a full retraining over the dataset.
+
+    The checkpoint holds the serving pipeline together with the id of the last consumed feedback row and is
+    replaced atomically, so the app can hot-swap it at any time and an interrupted run never learns a batch twice.
+
+    Attributes:
+
+        `checkpoint_path`             {str}             : Path of the checkpoint file.
+
+        `model_type`                  {str}             : "sgd" or "naive_bayes".
+
+        `batch_size`                  {int}             : Number of feedback rows per `partial_fit` call.
+
+        `pipeline`                  {Pipeline}          : Serving pipeline (`clean` -> `hv` -> `clf`) with `predict` and `predict_proba`.
+
+        `high_water_id`               {int}             : Id of the last feedback row learned from.
+
+        `samples_seen`                {int}             : Total number of samples learned from.
+
+    """
+
+    CLASSIFIERS = {"sgd"         : lambda : SGDClassifier(loss = "log_loss", alpha = 1e-5, random_state = 1234),
+                   "naive_bayes" : lambda : MultinomialNB(alpha = 0.1),
+                   }
+
+    def __init__(self, checkpoint_path : str = Config.ONLINE_MODEL_PATH, model_type : str = Config.ONLINE_MODEL_TYPE,
+                 batch_size : int = Config.ONLINE_BATCH_SIZE, n_features : int = 2 ** 20) -> None:
+        """
+        Initialize the OnlineLearner, resuming from the checkpoint when one exists.
+
+        Arguments:
+
+            `checkpoint_path`        {str, optional}        : Path of the checkpoint file.
+
+            `model_type`             {str, optional}        : "sgd" or "naive_bayes"; ignored when resuming a checkpoint.
+
+            `batch_size`             {int, optional}        : Number of feedback rows per update.
+
+            `n_features`             {int, optional}        : Number of hashed features; ignored when resuming a checkpoint.
+
+        """
+
+        try:
+
+            if model_type not in self.CLASSIFIERS:
+                raise ValueError(f"Unknown model type: {model_type}, expected one of {list(self.CLASSIFIERS)}")
+
+            self.checkpoint_path = checkpoint_path
+            self.model_type      = model_type
+            self.batch_size      = batch_size
+
+            if os.path.exists(self.checkpoint_path):
+
+                checkpoint         = joblib.load(self.checkpoint_path)
+                self.pipeline      = checkpoint["pipeline"]
+                self.high_water_id = checkpoint["highWaterId"]
+                self.samples_seen  = checkpoint["samplesSeen"]
+
+                # Checkpoints written before the cleaning step was added learned from raw feedback texts
+                if "clean" not in self.pipeline.named_steps:
+                    self.pipeline.steps.insert(0, ('clean', TextCleaningTransformer()))
+
+            else:
+
+                # alternate_sign = False keeps the features non-negative, as MultinomialNB requires
+                self.pipeline      = Pipeline([('clean', TextCleaningTransformer()),
+                                               ('hv', HashingVectorizer(n_features = n_features, alternate_sign = False)),
+                                               ('clf', self.CLASSIFIERS[model_type]()),
+                                               ])
+                self.high_water_id = 0
+                self.samples_seen  = 0
+
+            online_learner_logger.info(f"OnlineLearner initialized at feedback id {self.high_water_id} "
+                                       f"with {self.samples_seen} samples seen")
+
+        except Exception as e:
+            online_learner_logger.error(f"Error initializing OnlineLearner: {repr(e)}")
+
+            raise
+
+    def partial_fit(self, texts : list, labels : list) -> None:
+        """
+        Update the classifier with one mini-batch.
+
+        Arguments:
+
+            `texts`                      {list}             : Raw texts, cleaned by the pipeline's `clean` step.
+
+            `labels`                     {list}             : Their emotion labels, all from `Config.EMOTION_LABELS`.
+
+        """
+
+        # Both steps are stateless, so they are applied directly instead of through the never fitted pipeline
+        features = self.pipeline.named_steps["hv"].transform(self.pipeline.named_steps["clean"].transform(texts))
+
+        self.pipeline.named_steps["clf"].partial_fit(features, np.asarray(labels), classes = np.asarray(Config.EMOTION_LABELS))
+
+        self.samples_seen += len(labels)
+
+    def save_checkpoint(self) -> None:
+        """
+        Atomically replace the checkpoint with the current pipeline and progress.
+
+        """
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.checkpoint_path)), exist_ok = True)
+
+        joblib.dump({"pipeline"    : self.pipeline,
+                     "highWaterId" : int(self.high_water_id),
+                     "samplesSeen" : int(self.samples_seen),
+                     }, self.checkpoint_path + ".tmp")
+
+        os.replace(self.checkpoint_path + ".tmp", self.checkpoint_path)
+
+    def bootstrap(self, dataframe : pd.DataFrame, text_column : str = "Clean_Text", label_column : str = "Emotion",
+                  chunk_size : int = 10000) -> int:
+        """
+        Seed a new learner from the labeled training data before any feedback arrives.
+
+        Arguments:
+
+            `dataframe`             {pd.DataFrame}          : Labeled texts, e.g. the cleaned training dataset.
+
+            `text_column`            {str, optional}        : Column holding the texts.
+
+            `label_column`           {str, optional}        : Column holding the labels.
+
+            `chunk_size`             {int, optional}        : Number of rows per `partial_fit` call.
+
+        Returns:
+
+            int                                             : Number of samples learned from.
+
+        """
+
+        try:
+
+            dataframe = dataframe.dropna(subset = [text_column, label_column])
+            dataframe = dataframe[dataframe[label_column].isin(Config.EMOTION_LABELS)]
+
+            for start in range(0, len(dataframe), chunk_size):
+
+                chunk = dataframe.iloc[start:start + chunk_size]
+                self.partial_fit(texts = chunk[text_column].tolist(), labels = chunk[label_column].tolist())
+
+            self.save_checkpoint()
+
+            online_learner_logger.info(f"Bootstrapped online model with {len(dataframe)} samples")
+
+            return len(dataframe)
+
+        except Exception as e:
+            online_learner_logger.error(f"Error bootstrapping online model: {repr(e)}")
+
+            raise
+
+    def learn(self, database_manager : DatabaseManager) -> int:
+        """
+        Learn from all feedback confirmed since the last checkpoint.
+
+        Each mini-batch is followed by a checkpoint, so the served model improves as soon as a batch is learned.
+
+        Arguments:
+
+            `database_manager`       {DatabaseManager}      : Open database manager to read feedback from.
+
+        Returns:
+
+            int                                             : Number of feedback rows learned from.
+
+        """
+
+        try:
+
+            learned = 0
+
+            for rows in database_manager.iter_feedback_chunks(after_id = self.high_water_id, chunk_size = self.batch_size):
+
+                _, texts, labels   = zip(*rows)
+
+                self.partial_fit(texts = list(texts), labels = list(labels))
+                self.high_water_id = rows[-1][0]
+                self.save_checkpoint()
+
+                learned           += len(rows)
+
+            online_learner_logger.info(f"Learned from {learned} confirmed predictions, {self.samples_seen} samples seen in total")
+
+            return learned
+
+        except Exception as e:
+            online_learner_logger.error(f"Error learning from feedback: {repr(e)}")
+
+            raise
+
+
+if __name__ == "__main__":
+
+    online_learner   = OnlineLearner()
+
+    if online_learner.samples_seen == 0 and os.path.exists(Config.EMOTION_DATASET_CLEANED):
+        online_learner.bootstrap(dataframe = pd.read_csv(Config.EMOTION_DATASET_CLEANED))
+
+    database_manager = DatabaseManager(db_path = Config.DATABASE_PATH)
+
+    online_learner.learn(database_manager = database_manager)
+
+    database_manager.close_connection()
@@ -0,0 +1,234 @@
+# DEPENDENCIES
+
+import os
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+import json
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import pyarrow.compute as pc
+from datetime import datetime
+from datetime import timezone
+
+from config.config import Config
+from src.utils.logger import LoggerSetup
+from web.utils.database_manager import DatabaseManager
+
+prediction_exporter_logger = LoggerSetup(logger_name = "prediction_exporter.py", log_filename_prefix = "prediction_exporter").get_logger()
+
+
+class PredictionExporter:
+    """
+    Incrementally exports the prediction history from SQLite into date-partitioned Parquet files.
+
+    Files are laid out as `<output_dir>/date=YYYY-MM-DD/part-<first id>-<last id>.parquet` (UTC dates) with the
+    emotion label stored as a dictionary-encoded column. The id of the last exported row is kept in
+    `<output_dir>/_export_state.json`, so every run only appends rows added since the previous one.
+
+    Attributes:
+
+        `output_dir`                  {str}             : Root directory of the Parquet dataset.
+
+        `chunk_size`                  {int}             : Number of rows read from SQLite and written per file batch.
+
+    """
+
+    STATE_FILE  = "_export_state.json"
+
+    SCHEMA      = pa.schema([("id", pa.int64()),
+                             ("rawtext", pa.string()),
+                             ("prediction", pa.dictionary(pa.int8(), pa.string())),
+                             ("probability", pa.float64()),
+                             ("timestampMs", pa.int64()),
+                             ("modelVersionId", pa.int64()),
+                             ("probabilities", pa.binary()),
+                             ])
+
+    def __init__(self, output_dir : str = Config.PREDICTION_HISTORY_PATH, chunk_size : int = Config.EXPORT_CHUNK_SIZE) -> None:
+        """
+        Initialize the PredictionExporter.
+
+        Arguments:
+
+            `output_dir`             {str, optional}        : Root directory of the Parquet dataset.
+
+            `chunk_size`             {int, optional}        : Number of rows read and written per batch.
+
+        """
+
+        try:
+
+            self.output_dir = output_dir
+            self.chunk_size = chunk_size
+
+            os.makedirs(self.output_dir, exist_ok = True)
+
+            prediction_exporter_logger.info(f"PredictionExporter initialized with output directory: {self.output_dir}")
+
+        except Exception as e:
+            prediction_exporter_logger.error(f"Error initializing PredictionExporter: {repr(e)}")
+
+            raise
+
+    @property
+    def high_water_mark(self) -> int:
+        """
+        Id of the last exported prediction, 0 before the first export.
+
+        """
+
+        state_path = os.path.join(self.output_dir, self.STATE_FILE)
+
+        if not os.path.exists(state_path):
+            return 0
+
+        with open(state_path, "r") as f:
+            return json.load(f)["highWaterId"]
+
+    def _save_high_water_mark(self, high_water_id : int) -> None:
+        """
+        Atomically persist the id of the last exported prediction.
+
+        """
+
+        state_path = os.path.join(self.output_dir, self.STATE_FILE)
+
+        with open(state_path + ".tmp", "w") as f:
+            json.dump({"highWaterId" : int(high_water_id)}, f)
+
+        os.replace(state_path + ".tmp", state_path)
+
+    def _write_chunk(self, rows : list) -> None:
+        """
+        Write one chunk of prediction rows, split into one file per UTC date partition.
+
+        """
+
+        columns = list(zip(*rows))
+        table   = pa.Table.from_arrays([pa.array(columns[0], pa.int64()),
+                                        pa.array(columns[1], pa.string()),
+                                        pa.array(columns[2], pa.string()).dictionary_encode().cast(self.SCHEMA.field("prediction").type),
+                                        pa.array(columns[3], pa.float64()),
+                                        pa.array(columns[4], pa.int64()),
+                                        pa.array(columns[5], pa.int64()),
+                                        pa.array(columns[6], pa.binary()),
+                                        ], schema = self.SCHEMA)
+
+        dates   = pc.strftime(pc.cast(table["timestampMs"], pa.timestamp("ms", tz = "UTC")), format = "%Y-%m-%d")
+
+        for date in pc.unique(dates).to_pylist():
+
+            partition_dir = os.path.join(self.output_dir, f"date={date}")
+            os.makedirs(partition_dir, exist_ok = True)
+
+            partition     = table.filter(pc.equal(dates, date))
+            file_name     = f"part-{partition['id'][0].as_py():012d}-{partition['id'][-1].as_py():012d}.parquet"
+
+            pq.write_table(partition, os.path.join(partition_dir, file_name))
+
+    def export(self, database_manager : DatabaseManager) -> int:
+        """
+        Append all predictions added since the last export to the Parquet dataset.
+
+        Rows are streamed from SQLite in `chunk_size` batches and the high-water mark is advanced after every
+        written batch. File names are derived from the id range, so a batch repeated after an interrupted run
+        overwrites its earlier output instead of duplicating it.
+
+        Arguments:
+
+            `database_manager`       {DatabaseManager}      : Open database manager to read from.
+
+        Returns:
+
+            int                                             : Number of exported rows.
+
+        """
+
+        try:
+
+            exported = 0
+
+            for rows in database_manager.iter_prediction_chunks(after_id = self.high_water_mark, chunk_size = self.chunk_size):
+
+                self._write_chunk(rows = rows)
+                self._save_high_water_mark(high_water_id = rows[-1][0])
+
+                exported += len(rows)
+
+            prediction_exporter_logger.info(f"Exported {exported} predictions to {self.output_dir}")
+
+            return exported
+
+        except Exception as e:
+            prediction_exporter_logger.error(f"Error exporting predictions: {repr(e)}")
+
+            raise
+
+    def has_history(self) -> bool:
+        """
+        Whether at least one export has been written.
+
+        """
+
+        return self.high_water_mark > 0
+
+    def load_history(self, start_ms : int = None, end_ms : int = None, columns : list = None) -> pd.DataFrame:
+        """
+        Load exported predictions inside a time window.
+
+        Only the date partitions overlapping the window are opened and only the requested columns are read.
+        Before the first export the result is an empty DataFrame with the export's columns.
+
+        Arguments:
+
+            `start_ms`               {int, optional}        : Inclusive lower bound in UTC epoch milliseconds.
+
+            `end_ms`                 {int, optional}        : Exclusive upper bound in UTC epoch milliseconds.
+
+            `columns`               {list, optional}        : Columns to read, all columns by default.
+
+        Returns:
+
+            pd.DataFrame                                    : The matching predictions, `prediction` as a categorical column.
+
+        """
+
+        try:
+
+            dataset    = ds.dataset(self.output_dir,
+                                    format       = "parquet",
+                                    partitioning = ds.partitioning(pa.schema([("date", pa.string())]), flavor = "hive")
+                                    )
+
+            if not dataset.files:
+                return self.SCHEMA.empty_table().select(columns or self.SCHEMA.names).to_pandas()
+
+            expression = None
+
+            if start_ms is not None:
+                start_date = datetime.fromtimestamp(start_ms / 1000, tz = timezone.utc).strftime("%Y-%m-%d")
+                expression = (ds.field("date") >= start_date) & (ds.field("timestampMs") >= int(start_ms))
+
+            if end_ms is not None:
+                end_date   = datetime.fromtimestamp(end_ms / 1000, tz = timezone.utc).strftime("%Y-%m-%d")
+                bound      = (ds.field("date") <= end_date) & (ds.field("timestampMs") < int(end_ms))
+                expression = bound if expression is None else expression & bound
+
+            return dataset.to_table(columns = columns, filter = expression).to_pandas()
+
+        except Exception as e:
+            prediction_exporter_logger.error(f"Error loading prediction history: {repr(e)}")
+
+            raise
+
+
+if __name__ == "__main__":
+
+    database_manager = DatabaseManager(db_path = Config.DATABASE_PATH)
+
+    PredictionExporter().export(database_manager = database_manager)
+
+    database_manager.close_connection()